@@ -347,6 +347,32 @@ class DuckDBSaver(BaseDuckDBSaver):
                 ),
             )
 
+    def put_writes_many(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        All writes are stored in a single round trip to the DuckDB database.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task identifier and the writes of that task.
+        """
+        upserts, inserts = self._dump_writes_many(
+            config["configurable"]["thread_id"],
+            config["configurable"]["checkpoint_ns"],
+            config["configurable"]["checkpoint_id"],
+            task_writes,
+        )
+        with self._cursor() as cur:
+            if upserts:
+                cur.executemany(self.UPSERT_CHECKPOINT_WRITES_SQL, upserts)
+            if inserts:
+                cur.executemany(self.INSERT_CHECKPOINT_WRITES_SQL, inserts)
+
     @contextmanager
     def _cursor(self) -> Iterator[duckdb.DuckDBPyConnection]:
         with self.lock, self.conn.cursor() as cur:
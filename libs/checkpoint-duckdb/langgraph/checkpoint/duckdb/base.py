@@ -226,6 +226,29 @@ class BaseDuckDBSaver(BaseCheckpointSaver[str]):
             for idx, (channel, value) in enumerate(writes)
         ]
 
+    def _dump_writes_many(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> tuple[
+        list[tuple[str, str, str, str, int, str, str, bytes]],
+        list[tuple[str, str, str, str, int, str, str, bytes]],
+    ]:
+        """Dump the writes of several tasks, split into rows to upsert and rows to insert."""
+        upserts: list[tuple[str, str, str, str, int, str, str, bytes]] = []
+        inserts: list[tuple[str, str, str, str, int, str, str, bytes]] = []
+        for task_id, writes in task_writes:
+            (
+                upserts if all(w[0] in WRITES_IDX_MAP for w in writes) else inserts
+            ).extend(
+                self._dump_writes(
+                    thread_id, checkpoint_ns, checkpoint_id, task_id, writes
+                )
+            )
+        return upserts, inserts
+
     def _load_metadata(self, metadata_json_str: str) -> CheckpointMetadata:
         return self.jsonplus_serde.loads(metadata_json_str.encode())
 
@@ -109,3 +109,28 @@ class TestDuckDBSaver:
                 list(saver.list(None, filter={"my_key": "abc"}))[0].metadata["my_key"]  # type: ignore
                 == "abc"
             )
+
+    def test_put_writes_many(self) -> None:
+        with DuckDBSaver.from_conn_string(":memory:") as saver:
+            saver.setup()
+            config = saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            saver.put_writes_many(
+                config,
+                [
+                    ("task-1", [("a", 1), ("b", 2)]),
+                    ("task-2", [("__error__", "first")]),
+                ],
+            )
+            # writes to special channels replace previous ones, others are kept
+            saver.put_writes_many(
+                config,
+                [
+                    ("task-1", [("a", 3)]),
+                    ("task-2", [("__error__", "second")]),
+                ],
+            )
+            assert sorted(saver.get_tuple(config).pending_writes) == [
+                ("task-1", "a", 1),
+                ("task-1", "b", 2),
+                ("task-2", "__error__", "second"),
+            ]
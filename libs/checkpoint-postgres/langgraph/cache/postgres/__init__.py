@@ -0,0 +1,143 @@
+import threading
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from typing import Any, Optional
+
+from psycopg import Connection
+from psycopg.rows import dict_row
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace
+from langgraph.checkpoint.postgres import _internal
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+_NS_SEP = "\x1f"
+
+
+def _ns_to_str(ns: Namespace) -> str:
+    return _NS_SEP.join(ns)
+
+
+class PostgresCache(BaseCache[Any]):
+    """A cache of node results stored in a Postgres database.
+
+    Expired entries are skipped on read, and deleted on the next write.
+    Async methods run the sync ones in a thread.
+
+    Args:
+        conn (Union[Connection, ConnectionPool]): The Postgres connection or pool.
+        serde (Optional[SerializerProtocol]): Serializer for cached values.
+
+    Examples:
+        >>> from langgraph.cache.postgres import PostgresCache
+        >>> from langgraph.types import CachePolicy
+        >>>
+        >>> builder.add_node("retrieve", retrieve, cache_policy=CachePolicy(ttl=300))
+        >>> with PostgresCache.from_conn_string(DB_URI) as cache:
+        ...     cache.setup()
+        ...     graph = builder.compile(cache=cache)
+    """
+
+    SETUP = """
+    CREATE TABLE IF NOT EXISTS node_cache (
+        ns TEXT NOT NULL,
+        key TEXT NOT NULL,
+        type TEXT NOT NULL,
+        value BYTEA NOT NULL,
+        expires_at TIMESTAMPTZ,
+        PRIMARY KEY (ns, key)
+    );
+    CREATE INDEX IF NOT EXISTS node_cache_expires_at_idx ON node_cache(expires_at);
+    """
+
+    lock: threading.Lock
+
+    def __init__(
+        self,
+        conn: _internal.Conn,
+        *,
+        serde: Optional[SerializerProtocol] = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self.conn = conn
+        self.lock = threading.Lock()
+
+    @classmethod
+    @contextmanager
+    def from_conn_string(cls, conn_string: str) -> Iterator["PostgresCache"]:
+        """Create a new PostgresCache instance from a connection string.
+
+        Args:
+            conn_string (str): The Postgres connection info string.
+
+        Returns:
+            PostgresCache: A new PostgresCache instance.
+        """
+        with Connection.connect(
+            conn_string, autocommit=True, prepare_threshold=0, row_factory=dict_row
+        ) as conn:
+            yield cls(conn)
+
+    def setup(self) -> None:
+        """Set up the cache table.
+
+        This method creates the necessary table in the Postgres database if it doesn't
+        already exist. It MUST be called directly by the user the first time the cache
+        is used.
+        """
+        with self.lock, _internal.get_connection(self.conn) as conn:
+            conn.execute(self.SETUP)
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        if not keys:
+            return {}
+        by_str = {(_ns_to_str(ns), key): (ns, key) for ns, key in keys}
+        with self.lock, _internal.get_connection(self.conn) as conn:
+            rows = conn.execute(
+                "SELECT ns, key, type, value FROM node_cache "
+                "WHERE (ns, key) IN (SELECT * FROM unnest(%s::text[], %s::text[])) "
+                "AND (expires_at IS NULL OR expires_at > now())",
+                ([k[0] for k in by_str], [k[1] for k in by_str]),
+            ).fetchall()
+        return {
+            by_str[(row["ns"], row["key"])]: self.serde.loads_typed(
+                (row["type"], row["value"])
+            )
+            for row in rows
+        }
+
+    def set(self, pairs: Mapping[FullKey, tuple[Any, Optional[int]]]) -> None:
+        rows = [
+            (_ns_to_str(ns), key, *self.serde.dumps_typed(value), ttl)
+            for (ns, key), (value, ttl) in pairs.items()
+        ]
+        with self.lock, _internal.get_connection(self.conn) as conn:
+            with conn.transaction():
+                conn.execute(
+                    "DELETE FROM node_cache WHERE expires_at IS NOT NULL "
+                    "AND expires_at <= now()"
+                )
+                with conn.cursor() as cur:
+                    cur.executemany(
+                        "INSERT INTO node_cache (ns, key, type, value, expires_at) "
+                        "VALUES (%s, %s, %s, %s, "
+                        "now() + make_interval(secs => %s::double precision)) "
+                        "ON CONFLICT (ns, key) DO UPDATE SET type = EXCLUDED.type, "
+                        "value = EXCLUDED.value, expires_at = EXCLUDED.expires_at",
+                        rows,
+                    )
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        with self.lock, _internal.get_connection(self.conn) as conn:
+            if namespaces is None or () in namespaces:
+                conn.execute("DELETE FROM node_cache")
+                return
+            with conn.transaction():
+                for ns in namespaces:
+                    prefix = _ns_to_str(ns)
+                    conn.execute(
+                        "DELETE FROM node_cache WHERE ns = %s OR starts_with(ns, %s)",
+                        (prefix, prefix + _NS_SEP),
+                    )
+
+
+__all__ = ["PostgresCache"]
@@ -154,6 +154,7 @@ class PostgresSaver(BasePostgresSaver):
                         value["checkpoint"],
                         value["channel_values"],
                         value["pending_sends"],
+                        value["channel_refs"],
                     ),
                     self._load_metadata(value["metadata"]),
                     (
@@ -235,6 +236,7 @@ class PostgresSaver(BasePostgresSaver):
                         value["checkpoint"],
                         value["channel_values"],
                         value["pending_sends"],
+                        value["channel_refs"],
                     ),
                     self._load_metadata(value["metadata"]),
                     (
@@ -299,27 +301,30 @@ class PostgresSaver(BasePostgresSaver):
             }
         }
 
-        with self._cursor(pipeline=True) as cur:
-            cur.executemany(
-                self.UPSERT_CHECKPOINT_BLOBS_SQL,
-                self._dump_blobs(
-                    thread_id,
-                    checkpoint_ns,
-                    copy.pop("channel_values"),  # type: ignore[misc]
-                    new_versions,
-                ),
-            )
-            cur.execute(
-                self.UPSERT_CHECKPOINTS_SQL,
-                (
-                    thread_id,
-                    checkpoint_ns,
-                    checkpoint["id"],
-                    checkpoint_id,
-                    Jsonb(self._dump_checkpoint(copy)),
-                    self._dump_metadata(metadata),
-                ),
-            )
+        blobs = self._dump_blobs(
+            thread_id,
+            checkpoint_ns,
+            copy.pop("channel_values"),  # type: ignore[misc]
+            new_versions,
+        )
+        try:
+            with self._cursor(pipeline=True) as cur:
+                cur.executemany(self.UPSERT_CHECKPOINT_BLOBS_SQL, blobs)
+                cur.execute(
+                    self.UPSERT_CHECKPOINTS_SQL,
+                    (
+                        thread_id,
+                        checkpoint_ns,
+                        checkpoint["id"],
+                        checkpoint_id,
+                        Jsonb(self._dump_checkpoint(copy)),
+                        self._dump_metadata(metadata),
+                    ),
+                )
+        except BaseException:
+            # later segments must not refer to blobs that weren't stored
+            self.segments.forget([b[:3] for b in blobs])
+            raise
         return next_config
 
     def put_writes(
@@ -354,6 +359,32 @@ class PostgresSaver(BasePostgresSaver):
                 ),
             )
 
+    def put_writes_many(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        All writes are stored in a single round trip to the Postgres database.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task identifier and the writes of that task.
+        """
+        upserts, inserts = self._dump_writes_many(
+            config["configurable"]["thread_id"],
+            config["configurable"]["checkpoint_ns"],
+            config["configurable"]["checkpoint_id"],
+            task_writes,
+        )
+        with self._cursor(pipeline=True) as cur:
+            if upserts:
+                cur.executemany(self.UPSERT_CHECKPOINT_WRITES_SQL, upserts)
+            if inserts:
+                cur.executemany(self.INSERT_CHECKPOINT_WRITES_SQL, inserts)
+
     @contextmanager
     def _cursor(self, *, pipeline: bool = False) -> Iterator[Cursor[DictRow]]:
         """Create a database cursor as a context manager.
@@ -142,6 +142,7 @@ class AsyncPostgresSaver(BasePostgresSaver):
                         value["checkpoint"],
                         value["channel_values"],
                         value["pending_sends"],
+                        value["channel_refs"],
                     ),
                     self._load_metadata(value["metadata"]),
                     (
@@ -203,6 +204,7 @@ class AsyncPostgresSaver(BasePostgresSaver):
                         value["checkpoint"],
                         value["channel_values"],
                         value["pending_sends"],
+                        value["channel_refs"],
                     ),
                     self._load_metadata(value["metadata"]),
                     (
@@ -256,28 +258,31 @@ class AsyncPostgresSaver(BasePostgresSaver):
             }
         }
 
-        async with self._cursor(pipeline=True) as cur:
-            await cur.executemany(
-                self.UPSERT_CHECKPOINT_BLOBS_SQL,
-                await asyncio.to_thread(
-                    self._dump_blobs,
-                    thread_id,
-                    checkpoint_ns,
-                    copy.pop("channel_values"),  # type: ignore[misc]
-                    new_versions,
-                ),
-            )
-            await cur.execute(
-                self.UPSERT_CHECKPOINTS_SQL,
-                (
-                    thread_id,
-                    checkpoint_ns,
-                    checkpoint["id"],
-                    checkpoint_id,
-                    Jsonb(self._dump_checkpoint(copy)),
-                    self._dump_metadata(metadata),
-                ),
-            )
+        blobs = await asyncio.to_thread(
+            self._dump_blobs,
+            thread_id,
+            checkpoint_ns,
+            copy.pop("channel_values"),  # type: ignore[misc]
+            new_versions,
+        )
+        try:
+            async with self._cursor(pipeline=True) as cur:
+                await cur.executemany(self.UPSERT_CHECKPOINT_BLOBS_SQL, blobs)
+                await cur.execute(
+                    self.UPSERT_CHECKPOINTS_SQL,
+                    (
+                        thread_id,
+                        checkpoint_ns,
+                        checkpoint["id"],
+                        checkpoint_id,
+                        Jsonb(self._dump_checkpoint(copy)),
+                        self._dump_metadata(metadata),
+                    ),
+                )
+        except BaseException:
+            # later segments must not refer to blobs that weren't stored
+            self.segments.forget([b[:3] for b in blobs])
+            raise
         return next_config
 
     async def aput_writes(
@@ -311,6 +316,33 @@ class AsyncPostgresSaver(BasePostgresSaver):
         async with self._cursor(pipeline=True) as cur:
             await cur.executemany(query, params)
 
+    async def aput_writes_many(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint asynchronously.
+
+        All writes are stored in a single round trip to the database.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task identifier and the writes of that task.
+        """
+        upserts, inserts = await asyncio.to_thread(
+            self._dump_writes_many,
+            config["configurable"]["thread_id"],
+            config["configurable"]["checkpoint_ns"],
+            config["configurable"]["checkpoint_id"],
+            task_writes,
+        )
+        async with self._cursor(pipeline=True) as cur:
+            if upserts:
+                await cur.executemany(self.UPSERT_CHECKPOINT_WRITES_SQL, upserts)
+            if inserts:
+                await cur.executemany(self.INSERT_CHECKPOINT_WRITES_SQL, inserts)
+
     @asynccontextmanager
     async def _cursor(
         self, *, pipeline: bool = False
@@ -464,5 +496,21 @@ class AsyncPostgresSaver(BasePostgresSaver):
             self.aput_writes(config, writes, task_id), self.loop
         ).result()
 
+    def put_writes_many(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task identifier and the writes of that task.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.aput_writes_many(config, task_writes), self.loop
+        ).result()
+
 
 __all__ = ["AsyncPostgresSaver", "AsyncShallowPostgresSaver", "Conn"]
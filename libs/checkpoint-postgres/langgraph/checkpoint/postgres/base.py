@@ -13,6 +13,8 @@ from langgraph.checkpoint.base import (
     CheckpointMetadata,
     get_checkpoint_id,
 )
+from langgraph.checkpoint.base.segments import SegmentedBlobs
+from langgraph.checkpoint.serde.base import SerializerProtocol
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.checkpoint.serde.types import TASKS, ChannelProtocol
 
@@ -68,6 +70,7 @@ MIGRATIONS = [
     """
     CREATE INDEX CONCURRENTLY IF NOT EXISTS checkpoint_writes_thread_id_idx ON checkpoint_writes(thread_id);
     """,
+    "ALTER TABLE checkpoint_blobs ADD COLUMN IF NOT EXISTS refs TEXT[];",
 ]
 
 SELECT_SQL = f"""
@@ -87,6 +90,20 @@ select
             and bl.channel = jsonb_each_text.key
             and bl.version = jsonb_each_text.value
     ) as channel_values,
+    (
+        select array_agg(array[ref.channel::bytea, ref.version::bytea, ref.type::bytea, ref.blob])
+        from jsonb_each_text(checkpoint -> 'channel_versions')
+        inner join checkpoint_blobs bl
+            on bl.thread_id = checkpoints.thread_id
+            and bl.checkpoint_ns = checkpoints.checkpoint_ns
+            and bl.channel = jsonb_each_text.key
+            and bl.version = jsonb_each_text.value
+        inner join checkpoint_blobs ref
+            on ref.thread_id = bl.thread_id
+            and ref.checkpoint_ns = bl.checkpoint_ns
+            and ref.channel = bl.channel
+            and ref.version = any(bl.refs)
+    ) as channel_refs,
     (
         select
         array_agg(array[cw.task_id::text::bytea, cw.channel::bytea, cw.type::bytea, cw.blob] order by cw.task_id, cw.idx)
@@ -106,8 +123,8 @@ select
 from checkpoints """
 
 UPSERT_CHECKPOINT_BLOBS_SQL = """
-    INSERT INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob)
-    VALUES (%s, %s, %s, %s, %s, %s)
+    INSERT INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob, refs)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
     ON CONFLICT (thread_id, checkpoint_ns, channel, version) DO NOTHING
 """
 
@@ -146,31 +163,47 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
 
     jsonplus_serde = JsonPlusSerializer()
     supports_pipeline: bool
+    segments: SegmentedBlobs
+
+    def __init__(self, *, serde: Optional[SerializerProtocol] = None) -> None:
+        super().__init__(serde=serde)
+        self.segments = SegmentedBlobs(self.serde)
 
     def _load_checkpoint(
         self,
         checkpoint: dict[str, Any],
         channel_values: list[tuple[bytes, bytes, bytes]],
         pending_sends: list[tuple[bytes, bytes]],
+        channel_refs: Optional[list[tuple[bytes, bytes, bytes, bytes]]] = None,
     ) -> Checkpoint:
         return {
             **checkpoint,
             "pending_sends": [
                 self.serde.loads_typed((c.decode(), b)) for c, b in pending_sends or []
             ],
-            "channel_values": self._load_blobs(channel_values),
+            "channel_values": self._load_blobs(channel_values, channel_refs),
         }
 
     def _dump_checkpoint(self, checkpoint: Checkpoint) -> dict[str, Any]:
         return {**checkpoint, "pending_sends": []}
 
     def _load_blobs(
-        self, blob_values: list[tuple[bytes, bytes, bytes]]
+        self,
+        blob_values: list[tuple[bytes, bytes, bytes]],
+        ref_values: Optional[list[tuple[bytes, bytes, bytes, bytes]]] = None,
     ) -> dict[str, Any]:
+        """Load the (channel, type, blob) rows of the channel values of a
+        checkpoint, given the (channel, version, type, blob) rows of the blobs
+        they refer to, ie. those of lists stored as appended segments."""
         if not blob_values:
             return {}
+        referenced: dict[str, dict[str, tuple[str, bytes]]] = {}
+        for k, ver, t, v in ref_values or []:
+            referenced.setdefault(k.decode(), {})[ver.decode()] = (t.decode(), v)
         return {
-            k.decode(): self.serde.loads_typed((t.decode(), v))
+            k.decode(): self.segments.loads(
+                (t.decode(), v), referenced.get(k.decode(), {})
+            )
             for k, t, v in blob_values
             if t.decode() != "empty"
         }
@@ -181,24 +214,37 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
         checkpoint_ns: str,
         values: dict[str, Any],
         versions: ChannelVersions,
-    ) -> list[tuple[str, str, str, str, str, Optional[bytes]]]:
+    ) -> list[tuple[str, str, str, str, str, Optional[bytes], Optional[list[str]]]]:
+        """Return the checkpoint_blobs rows storing the values of the given channel
+        versions. A list that only grew since it was last stored is stored as the
+        items appended to it, with the versions of the blobs it refers to."""
         if not versions:
             return []
 
-        return [
-            (
-                thread_id,
-                checkpoint_ns,
-                k,
-                cast(str, ver),
-                *(
-                    self.serde.dumps_typed(values[k])
-                    if k in values
-                    else ("empty", None)
-                ),
-            )
-            for k, ver in versions.items()
-        ]
+        rows: list[
+            tuple[str, str, str, str, str, Optional[bytes], Optional[list[str]]]
+        ] = []
+        for k, ver in versions.items():
+            if k in values:
+                (type_, blob), refs = self.segments.dumps_with_refs(
+                    (thread_id, checkpoint_ns, k), cast(str, ver), values[k]
+                )
+                rows.append(
+                    (
+                        thread_id,
+                        checkpoint_ns,
+                        k,
+                        cast(str, ver),
+                        type_,
+                        blob,
+                        [cast(str, r) for r in refs] or None,
+                    )
+                )
+            else:
+                rows.append(
+                    (thread_id, checkpoint_ns, k, cast(str, ver), "empty", None, None)
+                )
+        return rows
 
     def _load_writes(
         self, writes: list[tuple[bytes, bytes, bytes, bytes]]
@@ -237,6 +283,29 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
             for idx, (channel, value) in enumerate(writes)
         ]
 
+    def _dump_writes_many(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> tuple[
+        list[tuple[str, str, str, str, int, str, str, bytes]],
+        list[tuple[str, str, str, str, int, str, str, bytes]],
+    ]:
+        """Dump the writes of several tasks, split into rows to upsert and rows to insert."""
+        upserts: list[tuple[str, str, str, str, int, str, str, bytes]] = []
+        inserts: list[tuple[str, str, str, str, int, str, str, bytes]] = []
+        for task_id, writes in task_writes:
+            (
+                upserts if all(w[0] in WRITES_IDX_MAP for w in writes) else inserts
+            ).extend(
+                self._dump_writes(
+                    thread_id, checkpoint_ns, checkpoint_id, task_id, writes
+                )
+            )
+        return upserts, inserts
+
     def _load_metadata(self, metadata: dict[str, Any]) -> CheckpointMetadata:
         return self.jsonplus_serde.loads(self.jsonplus_serde.dumps(metadata))
 
@@ -457,6 +457,32 @@ class ShallowPostgresSaver(BasePostgresSaver):
                 ),
             )
 
+    def put_writes_many(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        All writes are stored in a single round trip to the Postgres database.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task identifier and the writes of that task.
+        """
+        upserts, inserts = self._dump_writes_many(
+            config["configurable"]["thread_id"],
+            config["configurable"]["checkpoint_ns"],
+            config["configurable"]["checkpoint_id"],
+            task_writes,
+        )
+        with self._cursor(pipeline=True) as cur:
+            if upserts:
+                cur.executemany(self.UPSERT_CHECKPOINT_WRITES_SQL, upserts)
+            if inserts:
+                cur.executemany(self.INSERT_CHECKPOINT_WRITES_SQL, inserts)
+
     @contextmanager
     def _cursor(self, *, pipeline: bool = False) -> Iterator[Cursor[DictRow]]:
         """Create a database cursor as a context manager.
@@ -773,6 +799,33 @@ class AsyncShallowPostgresSaver(BasePostgresSaver):
         async with self._cursor(pipeline=True) as cur:
             await cur.executemany(query, params)
 
+    async def aput_writes_many(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint asynchronously.
+
+        All writes are stored in a single round trip to the database.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task identifier and the writes of that task.
+        """
+        upserts, inserts = await asyncio.to_thread(
+            self._dump_writes_many,
+            config["configurable"]["thread_id"],
+            config["configurable"]["checkpoint_ns"],
+            config["configurable"]["checkpoint_id"],
+            task_writes,
+        )
+        async with self._cursor(pipeline=True) as cur:
+            if upserts:
+                await cur.executemany(self.UPSERT_CHECKPOINT_WRITES_SQL, upserts)
+            if inserts:
+                await cur.executemany(self.INSERT_CHECKPOINT_WRITES_SQL, inserts)
+
     @asynccontextmanager
     async def _cursor(
         self, *, pipeline: bool = False
@@ -916,3 +969,19 @@ class AsyncShallowPostgresSaver(BasePostgresSaver):
         return asyncio.run_coroutine_threadsafe(
             self.aput_writes(config, writes, task_id), self.loop
         ).result()
+
+    def put_writes_many(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task identifier and the writes of that task.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.aput_writes_many(config, task_writes), self.loop
+        ).result()
@@ -0,0 +1,33 @@
+from langgraph.cache.postgres import PostgresCache
+from tests.conftest import DEFAULT_URI
+
+
+def test_postgres_cache() -> None:
+    with PostgresCache.from_conn_string(DEFAULT_URI) as cache:
+        cache.setup()
+        cache.clear()
+        cache.set(
+            {
+                (("graph", "a"), "k1"): ({"x": 1}, None),
+                (("graph", "b"), "k1"): ("b", None),
+                (("graph", "ab"), "k1"): ("sibling", None),
+                (("short",), "k1"): ("expired", 0),
+            }
+        )
+        assert cache.get(
+            [(("graph", "a"), "k1"), (("graph", "a"), "missing"), (("short",), "k1")]
+        ) == {(("graph", "a"), "k1"): {"x": 1}}
+
+        # overwrite
+        cache.set({(("graph", "a"), "k1"): ({"x": 2}, 60)})
+        assert cache.get([(("graph", "a"), "k1")]) == {(("graph", "a"), "k1"): {"x": 2}}
+
+        # clear a namespace and its children, but not its siblings
+        cache.clear([("graph", "a")])
+        assert cache.get(
+            [(("graph", "a"), "k1"), (("graph", "b"), "k1"), (("graph", "ab"), "k1")]
+        ) == {(("graph", "b"), "k1"): "b", (("graph", "ab"), "k1"): "sibling"}
+
+        # clear everything
+        cache.clear()
+        assert cache.get([(("graph", "b"), "k1")]) == {}
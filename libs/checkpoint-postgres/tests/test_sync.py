@@ -238,3 +238,89 @@ def test_null_chars(saver_name: str, test_data) -> None:
             list(saver.list(None, filter={"my_key": "abc"}))[0].metadata["my_key"]
             == "abc"
         )
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe", "shallow"])
+def test_put_writes_many(saver_name: str, test_data) -> None:
+    with _saver(saver_name) as saver:
+        config = saver.put(test_data["configs"][0], test_data["checkpoints"][0], {}, {})
+        saver.put_writes_many(
+            config,
+            [
+                ("task-1", [("a", 1), ("b", 2)]),
+                ("task-2", [("__error__", "first")]),
+            ],
+        )
+        # writes to special channels replace previous ones, others are kept
+        saver.put_writes_many(
+            config,
+            [
+                ("task-1", [("a", 3)]),
+                ("task-2", [("__error__", "second")]),
+            ],
+        )
+        assert sorted(saver.get_tuple(config).pending_writes) == [
+            ("task-1", "a", 1),
+            ("task-1", "b", 2),
+            ("task-2", "__error__", "second"),
+        ]
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe"])
+def test_put_stores_appended_items(saver_name: str, test_data) -> None:
+    items = [{"n": i} for i in range(6)]
+    values = [items[:2], items[:3], items[:5], items[:6], [items[0]]]
+
+    with _saver(saver_name) as saver:
+        saver.segments.max_segments = 2
+
+        def put(parent_config, parent, value):
+            version = saver.get_next_version(parent["channel_versions"].get("a"), None)
+            checkpoint = create_checkpoint(parent, None, 1)
+            checkpoint["channel_values"] = {"a": value}
+            checkpoint["channel_versions"] = {"a": version}
+            config = saver.put(parent_config, checkpoint, {}, {"a": version})
+            return config, checkpoint
+
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-5", "checkpoint_ns": ""}
+        }
+        checkpoint = empty_checkpoint()
+        saved = []
+        for value in values:
+            config, checkpoint = put(config, checkpoint, value)
+            saved.append((config, checkpoint, value))
+
+        # appended items are stored as segments, until the list is compacted
+        # after max_segments, or is changed in any other way
+        with saver._cursor() as cur:
+            cur.execute("SELECT type, refs FROM checkpoint_blobs ORDER BY version")
+            rows = cur.fetchall()
+        assert [row["type"].split(":")[0] for row in rows] == [
+            "msgpack",
+            "segment",
+            "segment",
+            "msgpack",
+            "msgpack",
+        ]
+        assert [len(row["refs"] or ()) for row in rows] == [0, 1, 2, 0, 0]
+
+        # forking from an earlier checkpoint, the new version of the list
+        # extends the one stored last, on the other branch
+        fork_config, fork, _ = saved[1]
+        value = [*items[:3], {"n": "fork"}]
+        fork_config, fork = put(fork_config, fork, value)
+        saved.append((fork_config, fork, value))
+        value = [*value, {"n": "fork again"}]
+        saved.append((*put(fork_config, fork, value), value))
+
+        for saved_config, _, value in saved:
+            loaded = saver.get_tuple(saved_config)
+            assert loaded.checkpoint["channel_values"] == {"a": value}
+        assert {
+            c.config["configurable"]["checkpoint_id"]: c.checkpoint["channel_values"]
+            for c in saver.list({"configurable": {"thread_id": "thread-5"}})
+        } == {
+            saved_config["configurable"]["checkpoint_id"]: {"a": value}
+            for saved_config, _, value in saved
+        }
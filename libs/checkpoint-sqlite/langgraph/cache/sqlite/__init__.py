@@ -0,0 +1,152 @@
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from typing import Any, Iterator, Mapping, Optional, Sequence
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+_NS_SEP = "\x1f"
+
+
+def _ns_to_str(ns: Namespace) -> str:
+    return _NS_SEP.join(ns)
+
+
+class SqliteCache(BaseCache[Any]):
+    """A cache of node results stored in a SQLite database.
+
+    Expired entries are skipped on read, and deleted on the next write.
+
+    Args:
+        conn (sqlite3.Connection): The SQLite database connection.
+        serde (Optional[SerializerProtocol]): Serializer for cached values.
+
+    Examples:
+        >>> from langgraph.cache.sqlite import SqliteCache
+        >>> from langgraph.types import CachePolicy
+        >>>
+        >>> builder.add_node("retrieve", retrieve, cache_policy=CachePolicy(ttl=300))
+        >>> with SqliteCache.from_conn_string("cache.sqlite") as cache:
+        ...     graph = builder.compile(cache=cache)
+    """
+
+    conn: sqlite3.Connection
+    is_setup: bool
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        serde: Optional[SerializerProtocol] = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self.conn = conn
+        self.is_setup = False
+        self.lock = threading.Lock()
+
+    @classmethod
+    @contextmanager
+    def from_conn_string(cls, conn_string: str) -> Iterator["SqliteCache"]:
+        """Create a new SqliteCache instance from a connection string.
+
+        Args:
+            conn_string (str): The SQLite connection string.
+
+        Yields:
+            SqliteCache: A new SqliteCache instance.
+        """
+        with closing(
+            sqlite3.connect(
+                conn_string,
+                # https://ricardoanderegg.com/posts/python-sqlite-thread-safety/
+                check_same_thread=False,
+            )
+        ) as conn:
+            yield cls(conn)
+
+    def setup(self) -> None:
+        """Set up the cache database.
+
+        This method creates the necessary table in the SQLite database if it doesn't
+        already exist. It is called automatically when needed and should not be called
+        directly by the user.
+        """
+        if self.is_setup:
+            return
+
+        self.conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS cache (
+                ns TEXT NOT NULL,
+                key TEXT NOT NULL,
+                type TEXT NOT NULL,
+                value BLOB NOT NULL,
+                expiry REAL,
+                PRIMARY KEY (ns, key)
+            );
+            CREATE INDEX IF NOT EXISTS cache_expiry_idx ON cache(expiry);
+            """
+        )
+
+        self.is_setup = True
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        if not keys:
+            return {}
+        now = time.time()
+        values: dict[FullKey, Any] = {}
+        with self.lock, closing(self.conn.cursor()) as cur:
+            self.setup()
+            for ns, key in keys:
+                cur.execute(
+                    "SELECT type, value, expiry FROM cache WHERE ns = ? AND key = ?",
+                    (_ns_to_str(ns), key),
+                )
+                if (row := cur.fetchone()) is None:
+                    continue
+                type_, value, expiry = row
+                if expiry is not None and expiry <= now:
+                    continue
+                values[(ns, key)] = self.serde.loads_typed((type_, value))
+        return values
+
+    def set(self, pairs: Mapping[FullKey, tuple[Any, Optional[int]]]) -> None:
+        now = time.time()
+        rows = [
+            (
+                _ns_to_str(ns),
+                key,
+                *self.serde.dumps_typed(value),
+                now + ttl if ttl is not None else None,
+            )
+            for (ns, key), (value, ttl) in pairs.items()
+        ]
+        with self.lock, self.conn, closing(self.conn.cursor()) as cur:
+            self.setup()
+            cur.execute(
+                "DELETE FROM cache WHERE expiry IS NOT NULL AND expiry <= ?", (now,)
+            )
+            cur.executemany(
+                "INSERT OR REPLACE INTO cache (ns, key, type, value, expiry) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        with self.lock, self.conn, closing(self.conn.cursor()) as cur:
+            self.setup()
+            if namespaces is None or () in namespaces:
+                cur.execute("DELETE FROM cache")
+                return
+            for ns in namespaces:
+                prefix = _ns_to_str(ns)
+                cur.execute(
+                    "DELETE FROM cache WHERE ns = ? OR substr(ns, 1, ?) = ?",
+                    (prefix, len(prefix) + 1, prefix + _NS_SEP),
+                )
+
+
+__all__ = ["SqliteCache"]
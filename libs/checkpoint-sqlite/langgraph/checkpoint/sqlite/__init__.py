@@ -2,7 +2,16 @@ import random
 import sqlite3
 import threading
 from contextlib import closing, contextmanager
-from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from langchain_core.runnables import RunnableConfig
 
@@ -16,9 +25,17 @@ from langgraph.checkpoint.base import (
     SerializerProtocol,
     get_checkpoint_id,
 )
+from langgraph.checkpoint.base.segments import SegmentedBlobs
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.checkpoint.serde.types import ChannelProtocol
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite.utils import (
+    blob_refs,
+    blobs_where,
+    dump_blobs,
+    dump_writes_many,
+    load_channel_values,
+    search_where,
+)
 
 _AIO_ERROR_MSG = (
     "The SqliteSaver does not support async methods. "
@@ -76,6 +93,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
     ) -> None:
         super().__init__(serde=serde)
         self.jsonplus_serde = JsonPlusSerializer()
+        self.segments = SegmentedBlobs(self.serde)
         self.conn = conn
         self.is_setup = False
         self.lock = threading.Lock()
@@ -146,6 +164,15 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 value BLOB,
                 PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
             );
+            CREATE TABLE IF NOT EXISTS blobs (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL DEFAULT '',
+                channel TEXT NOT NULL,
+                version TEXT NOT NULL,
+                type TEXT NOT NULL,
+                blob BLOB,
+                PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+            );
             """
         )
 
@@ -174,6 +201,52 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     self.conn.commit()
                 cur.close()
 
+    def _load_checkpoint(
+        self,
+        cur: sqlite3.Cursor,
+        thread_id: str,
+        checkpoint_ns: str,
+        type_: str,
+        serialized_checkpoint: bytes,
+        *,
+        migrate: bool = False,
+    ) -> Checkpoint:
+        checkpoint = self.serde.loads_typed((type_, serialized_checkpoint))
+        versions = checkpoint["channel_versions"]
+        if not versions:
+            return checkpoint
+        if migrate and checkpoint.get("channel_values"):
+            # store the values of a checkpoint saved before channel values were
+            # stored as blobs, so that checkpoints after it can refer to them
+            cur.executemany(
+                "INSERT OR IGNORE INTO blobs (thread_id, checkpoint_ns, channel, version, type, blob) VALUES (?, ?, ?, ?, ?, ?)",
+                dump_blobs(
+                    self.serde,
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["channel_values"],
+                    versions,
+                ),
+            )
+            self.conn.commit()
+        where, param_values = blobs_where(
+            thread_id, checkpoint_ns, list(versions.items())
+        )
+        cur.execute(f"SELECT channel, type, blob FROM blobs {where}", param_values)
+        blobs = cur.fetchall()
+        # lists stored as segments also need the blobs of the items before them
+        refs: Iterable[Any] = ()
+        if pairs := blob_refs(self.segments, blobs):
+            where, param_values = blobs_where(thread_id, checkpoint_ns, pairs)
+            cur.execute(
+                f"SELECT channel, version, type, blob FROM blobs {where}", param_values
+            )
+            refs = cur.fetchall()
+        checkpoint["channel_values"] = load_channel_values(
+            self.segments, checkpoint, blobs, refs
+        )
+        return checkpoint
+
     def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database.
 
@@ -244,6 +317,10 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     }
+                # deserialize the checkpoint, and load its channel values
+                loaded = self._load_checkpoint(
+                    cur, thread_id, checkpoint_ns, type, checkpoint, migrate=True
+                )
                 # find any pending writes
                 cur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
@@ -253,10 +330,10 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                         str(config["configurable"]["checkpoint_id"]),
                     ),
                 )
-                # deserialize the checkpoint and metadata
+                # deserialize the metadata
                 return CheckpointTuple(
                     config,
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -332,6 +409,9 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 checkpoint,
                 metadata,
             ) in cur:
+                loaded = self._load_checkpoint(
+                    wcur, thread_id, checkpoint_ns, type, checkpoint
+                )
                 wcur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
                     (thread_id, checkpoint_ns, checkpoint_id),
@@ -344,7 +424,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -396,21 +476,41 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         """
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        copy = checkpoint.copy()
+        # only store the values of channels updated since the previous checkpoint
+        values: Dict[str, Any] = copy.pop("channel_values")  # type: ignore[misc]
+        type_, serialized_checkpoint = self.serde.dumps_typed(copy)
         serialized_metadata = self.jsonplus_serde.dumps(metadata)
-        with self.cursor() as cur:
-            cur.execute(
-                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                (
-                    str(config["configurable"]["thread_id"]),
-                    checkpoint_ns,
-                    checkpoint["id"],
-                    config["configurable"].get("checkpoint_id"),
-                    type_,
-                    serialized_checkpoint,
-                    serialized_metadata,
-                ),
-            )
+        blobs = dump_blobs(
+            self.serde,
+            str(thread_id),
+            checkpoint_ns,
+            values,
+            new_versions,
+            self.segments,
+        )
+        try:
+            with self.cursor() as cur:
+                cur.executemany(
+                    "INSERT OR IGNORE INTO blobs (thread_id, checkpoint_ns, channel, version, type, blob) VALUES (?, ?, ?, ?, ?, ?)",
+                    blobs,
+                )
+                cur.execute(
+                    "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        str(config["configurable"]["thread_id"]),
+                        checkpoint_ns,
+                        checkpoint["id"],
+                        config["configurable"].get("checkpoint_id"),
+                        type_,
+                        serialized_checkpoint,
+                        serialized_metadata,
+                    ),
+                )
+        except BaseException:
+            # later segments must not refer to blobs that weren't stored
+            self.segments.forget([b[:3] for b in blobs])
+            raise
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -456,6 +556,33 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 ],
             )
 
+    def put_writes_many(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint.
+
+        All writes are stored in a single transaction.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task identifier and the writes of that task.
+        """
+        replace, ignore = dump_writes_many(self.serde, config, task_writes)
+        with self.cursor() as cur:
+            if replace:
+                cur.executemany(
+                    "INSERT OR REPLACE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    replace,
+                )
+            if ignore:
+                cur.executemany(
+                    "INSERT OR IGNORE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    ignore,
+                )
+
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database asynchronously.
 
@@ -6,6 +6,7 @@ from typing import (
     AsyncIterator,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     Optional,
     Sequence,
@@ -26,9 +27,17 @@ from langgraph.checkpoint.base import (
     SerializerProtocol,
     get_checkpoint_id,
 )
+from langgraph.checkpoint.base.segments import SegmentedBlobs
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.checkpoint.serde.types import ChannelProtocol
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite.utils import (
+    blob_refs,
+    blobs_where,
+    dump_blobs,
+    dump_writes_many,
+    load_channel_values,
+    search_where,
+)
 
 T = TypeVar("T", bound=Callable)
 
@@ -118,6 +127,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
     ):
         super().__init__(serde=serde)
         self.jsonplus_serde = JsonPlusSerializer()
+        self.segments = SegmentedBlobs(self.serde)
         self.conn = conn
         self.lock = asyncio.Lock()
         self.loop = asyncio.get_running_loop()
@@ -233,6 +243,15 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             self.aput_writes(config, writes, task_id), self.loop
         ).result()
 
+    def put_writes_many(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        return asyncio.run_coroutine_threadsafe(
+            self.aput_writes_many(config, task_writes), self.loop
+        ).result()
+
     async def setup(self) -> None:
         """Set up the checkpoint database asynchronously.
 
@@ -269,12 +288,65 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     value BLOB,
                     PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
                 );
+                CREATE TABLE IF NOT EXISTS blobs (
+                    thread_id TEXT NOT NULL,
+                    checkpoint_ns TEXT NOT NULL DEFAULT '',
+                    channel TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    blob BLOB,
+                    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+                );
                 """
             ):
                 await self.conn.commit()
 
             self.is_setup = True
 
+    async def _aload_checkpoint(
+        self,
+        cur: aiosqlite.Cursor,
+        thread_id: str,
+        checkpoint_ns: str,
+        type_: str,
+        serialized_checkpoint: bytes,
+        *,
+        migrate: bool = False,
+    ) -> Checkpoint:
+        checkpoint = self.serde.loads_typed((type_, serialized_checkpoint))
+        versions = checkpoint["channel_versions"]
+        if not versions:
+            return checkpoint
+        if migrate and checkpoint.get("channel_values"):
+            # store the values of a checkpoint saved before channel values were
+            # stored as blobs, so that checkpoints after it can refer to them
+            await cur.executemany(
+                "INSERT OR IGNORE INTO blobs (thread_id, checkpoint_ns, channel, version, type, blob) VALUES (?, ?, ?, ?, ?, ?)",
+                dump_blobs(
+                    self.serde,
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["channel_values"],
+                    versions,
+                ),
+            )
+            await self.conn.commit()
+        where, params = blobs_where(thread_id, checkpoint_ns, list(versions.items()))
+        await cur.execute(f"SELECT channel, type, blob FROM blobs {where}", params)
+        blobs = await cur.fetchall()
+        # lists stored as segments also need the blobs of the items before them
+        refs: Iterable[Any] = ()
+        if pairs := blob_refs(self.segments, blobs):
+            where, params = blobs_where(thread_id, checkpoint_ns, pairs)
+            await cur.execute(
+                f"SELECT channel, version, type, blob FROM blobs {where}", params
+            )
+            refs = await cur.fetchall()
+        checkpoint["channel_values"] = load_channel_values(
+            self.segments, checkpoint, blobs, refs
+        )
+        return checkpoint
+
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the database asynchronously.
 
@@ -325,6 +397,10 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     }
+                # deserialize the checkpoint, and load its channel values
+                loaded = await self._aload_checkpoint(
+                    cur, thread_id, checkpoint_ns, type, checkpoint, migrate=True
+                )
                 # find any pending writes
                 await cur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
@@ -334,10 +410,10 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                         str(config["configurable"]["checkpoint_id"]),
                     ),
                 )
-                # deserialize the checkpoint and metadata
+                # deserialize the metadata
                 return CheckpointTuple(
                     config,
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -398,6 +474,9 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 checkpoint,
                 metadata,
             ) in cur:
+                loaded = await self._aload_checkpoint(
+                    wcur, thread_id, checkpoint_ns, type, checkpoint
+                )
                 await wcur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
                     (thread_id, checkpoint_ns, checkpoint_id),
@@ -410,7 +489,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     self.jsonplus_serde.loads(metadata) if metadata is not None else {},
                     (
                         {
@@ -453,21 +532,42 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         await self.setup()
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        copy = checkpoint.copy()
+        # only store the values of channels updated since the previous checkpoint
+        values: Dict[str, Any] = copy.pop("channel_values")  # type: ignore[misc]
+        type_, serialized_checkpoint = self.serde.dumps_typed(copy)
         serialized_metadata = self.jsonplus_serde.dumps(metadata)
-        async with self.lock, self.conn.execute(
-            "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (
-                str(config["configurable"]["thread_id"]),
-                checkpoint_ns,
-                checkpoint["id"],
-                config["configurable"].get("checkpoint_id"),
-                type_,
-                serialized_checkpoint,
-                serialized_metadata,
-            ),
-        ):
-            await self.conn.commit()
+        blobs = dump_blobs(
+            self.serde,
+            str(thread_id),
+            checkpoint_ns,
+            values,
+            new_versions,
+            self.segments,
+        )
+        try:
+            async with self.lock, self.conn.cursor() as cur:
+                await cur.executemany(
+                    "INSERT OR IGNORE INTO blobs (thread_id, checkpoint_ns, channel, version, type, blob) VALUES (?, ?, ?, ?, ?, ?)",
+                    blobs,
+                )
+                await cur.execute(
+                    "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        str(config["configurable"]["thread_id"]),
+                        checkpoint_ns,
+                        checkpoint["id"],
+                        config["configurable"].get("checkpoint_id"),
+                        type_,
+                        serialized_checkpoint,
+                        serialized_metadata,
+                    ),
+                )
+                await self.conn.commit()
+        except BaseException:
+            # later segments must not refer to blobs that weren't stored
+            self.segments.forget([b[:3] for b in blobs])
+            raise
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -514,6 +614,34 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 ],
             )
 
+    async def aput_writes_many(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to a checkpoint asynchronously.
+
+        All writes are stored in a single transaction.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task identifier and the writes of that task.
+        """
+        replace, ignore = dump_writes_many(self.serde, config, task_writes)
+        await self.setup()
+        async with self.lock, self.conn.cursor() as cur:
+            if replace:
+                await cur.executemany(
+                    "INSERT OR REPLACE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    replace,
+                )
+            if ignore:
+                await cur.executemany(
+                    "INSERT OR IGNORE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    ignore,
+                )
+
     def get_next_version(self, current: Optional[str], channel: ChannelProtocol) -> str:
         """Generate the next version ID for a channel.
 
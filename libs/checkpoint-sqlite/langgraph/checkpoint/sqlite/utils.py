@@ -1,9 +1,16 @@
 import json
-from typing import Any, Dict, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, cast
 
 from langchain_core.runnables import RunnableConfig
 
-from langgraph.checkpoint.base import get_checkpoint_id
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    ChannelVersions,
+    Checkpoint,
+    SerializerProtocol,
+    get_checkpoint_id,
+)
+from langgraph.checkpoint.base.segments import SegmentedBlobs
 
 
 def _metadata_predicate(
@@ -91,3 +98,128 @@ def search_where(
         param_values.append(get_checkpoint_id(before))
 
     return ("WHERE " + " AND ".join(wheres) if wheres else "", param_values)
+
+
+def blobs_where(
+    thread_id: str, checkpoint_ns: str, versions: Sequence[Tuple[str, Any]]
+) -> Tuple[str, Sequence[Any]]:
+    """Return WHERE clause predicates selecting the blobs of the given
+    (channel, version) pairs, eg. the channel values of a checkpoint.
+
+    This method returns a tuple of a string and a tuple of values, as in
+    search_where().
+    """
+    pairs = ", ".join("(?, ?)" for _ in versions)
+    param_values: list[Any] = [thread_id, checkpoint_ns]
+    for channel, version in versions:
+        param_values.extend((channel, str(version)))
+    return (
+        "WHERE thread_id = ? AND checkpoint_ns = ? "
+        f"AND (channel, version) IN (VALUES {pairs})",
+        param_values,
+    )
+
+
+def dump_blobs(
+    serde: SerializerProtocol,
+    thread_id: str,
+    checkpoint_ns: str,
+    values: Dict[str, Any],
+    versions: ChannelVersions,
+    segments: Optional[SegmentedBlobs] = None,
+) -> list[Tuple[str, str, str, str, str, Optional[bytes]]]:
+    """Return the blobs table rows storing the values of the given channel
+    versions. Channels without a value are stored with the "empty" type.
+
+    If `segments` is given, a list that only grew since it was last stored is
+    stored as the items appended to it."""
+    return [
+        (
+            thread_id,
+            checkpoint_ns,
+            channel,
+            str(version),
+            *(
+                (
+                    segments.dumps(
+                        (thread_id, checkpoint_ns, channel),
+                        str(version),
+                        values[channel],
+                    )
+                    if segments is not None
+                    else serde.dumps_typed(values[channel])
+                )
+                if channel in values
+                else ("empty", None)
+            ),
+        )
+        for channel, version in versions.items()
+    ]
+
+
+def blob_refs(
+    segments: SegmentedBlobs, blobs: Iterable[Tuple[str, str, Optional[bytes]]]
+) -> list[Tuple[str, str]]:
+    """Return the (channel, version) pairs of the blobs needed to load the given
+    (channel, type, blob) rows, ie. the blobs of lists stored as segments."""
+    return [
+        (channel, version)
+        for channel, type_, blob in blobs
+        if blob is not None
+        for version in segments.refs((type_, blob))
+    ]
+
+
+def load_channel_values(
+    segments: SegmentedBlobs,
+    checkpoint: Checkpoint,
+    blobs: Iterable[Tuple[str, str, Optional[bytes]]],
+    refs: Iterable[Tuple[str, str, str, bytes]] = (),
+) -> Dict[str, Any]:
+    """Return the channel values of a checkpoint, given the (channel, type, blob)
+    rows of its channel versions, and the (channel, version, type, blob) rows of
+    the blobs they refer to, as returned by blob_refs().
+
+    Checkpoints saved before channel values were stored as blobs carry their own
+    channel values, which are used for any channel that has no blob."""
+    referenced: Dict[str, Dict[str, Tuple[str, bytes]]] = {}
+    for channel, version, type_, blob in refs:
+        referenced.setdefault(channel, {})[version] = (type_, blob)
+    channel_values = checkpoint.get("channel_values") or {}
+    for channel, type_, blob in blobs:
+        if type_ == "empty":
+            channel_values.pop(channel, None)
+        else:
+            channel_values[channel] = segments.loads(
+                (type_, cast(bytes, blob)), referenced.get(channel, {})
+            )
+    return channel_values
+
+
+def dump_writes_many(
+    serde: SerializerProtocol,
+    config: RunnableConfig,
+    task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+) -> Tuple[list[Tuple[Any, ...]], list[Tuple[Any, ...]]]:
+    """Return the writes table rows storing the writes of several tasks, split
+    into rows to insert or replace and rows to insert or ignore, as done by
+    put_writes() for each task."""
+    thread_id = str(config["configurable"]["thread_id"])
+    checkpoint_ns = str(config["configurable"]["checkpoint_ns"])
+    checkpoint_id = str(config["configurable"]["checkpoint_id"])
+    replace: list[Tuple[Any, ...]] = []
+    ignore: list[Tuple[Any, ...]] = []
+    for task_id, writes in task_writes:
+        (replace if all(w[0] in WRITES_IDX_MAP for w in writes) else ignore).extend(
+            (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                WRITES_IDX_MAP.get(channel, idx),
+                channel,
+                *serde.dumps_typed(value),
+            )
+            for idx, (channel, value) in enumerate(writes)
+        )
+    return replace, ignore
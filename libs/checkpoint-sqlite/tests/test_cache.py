@@ -0,0 +1,47 @@
+import time
+
+from langgraph.cache.sqlite import SqliteCache
+
+
+def test_sqlite_cache() -> None:
+    with SqliteCache.from_conn_string(":memory:") as cache:
+        cache.set(
+            {
+                (("graph", "a"), "k1"): ({"x": 1}, None),
+                (("graph", "b"), "k1"): ([("chan", "value")], None),
+                (("graph", "ab"), "k1"): ("sibling", None),
+                (("short",), "k1"): ("expired", 0),
+            }
+        )
+        time.sleep(0.01)
+        assert cache.get(
+            [(("graph", "a"), "k1"), (("graph", "a"), "missing"), (("short",), "k1")]
+        ) == {(("graph", "a"), "k1"): {"x": 1}}
+
+        # overwrite
+        cache.set({(("graph", "a"), "k1"): ({"x": 2}, 60)})
+        assert cache.get([(("graph", "a"), "k1")]) == {(("graph", "a"), "k1"): {"x": 2}}
+
+        # clear a namespace and its children, but not its siblings
+        cache.clear([("graph", "a")])
+        assert cache.get(
+            [(("graph", "a"), "k1"), (("graph", "b"), "k1"), (("graph", "ab"), "k1")]
+        ) == {
+            (("graph", "b"), "k1"): [["chan", "value"]],
+            (("graph", "ab"), "k1"): "sibling",
+        }
+
+        # clear everything
+        cache.clear()
+        assert cache.get([(("graph", "b"), "k1")]) == {}
+
+
+def test_sqlite_cache_purge_uses_index() -> None:
+    with SqliteCache.from_conn_string(":memory:") as cache:
+        cache.setup()
+        plan = cache.conn.execute(
+            "EXPLAIN QUERY PLAN "
+            "DELETE FROM cache WHERE expiry IS NOT NULL AND expiry <= ?",
+            (time.time(),),
+        ).fetchall()
+        assert "USING INDEX cache_expiry_idx" in plan[0][-1]
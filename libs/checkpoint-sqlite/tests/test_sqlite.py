@@ -155,3 +155,126 @@ class TestSqliteSaver:
             with pytest.raises(NotImplementedError, match="AsyncSqliteSaver"):
                 async for _ in saver.alist(self.config_1):
                     pass
+
+    def test_put_writes_many(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            config = saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            saver.put_writes_many(
+                config,
+                [
+                    ("task-1", [("a", 1), ("b", 2)]),
+                    ("task-2", [("__error__", "first")]),
+                ],
+            )
+            # writes to special channels replace previous ones, others are kept
+            saver.put_writes_many(
+                config,
+                [
+                    ("task-1", [("a", 3)]),
+                    ("task-2", [("__error__", "second")]),
+                ],
+            )
+            assert saver.get_tuple(config).pending_writes == [
+                ("task-1", "a", 1),
+                ("task-1", "b", 2),
+                ("task-2", "__error__", "second"),
+            ]
+
+    def test_put_stores_only_updated_channels(self) -> None:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-3", "checkpoint_ns": ""}
+        }
+        chkpnt_1 = empty_checkpoint()
+        chkpnt_1["channel_values"] = {"a": 1, "b": [1, 2, 3]}
+        chkpnt_1["channel_versions"] = {"a": 1, "b": 1}
+        chkpnt_2 = create_checkpoint(chkpnt_1, None, 2)
+        chkpnt_2["channel_values"] = {"a": 2, "b": [1, 2, 3]}
+        chkpnt_2["channel_versions"] = {"a": 2, "b": 1}
+
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            config_1 = saver.put(config, chkpnt_1, self.metadata_1, {"a": 1, "b": 1})
+            config_2 = saver.put(config_1, chkpnt_2, self.metadata_2, {"a": 2})
+
+            # an unchanged channel is stored once
+            assert saver.conn.execute("SELECT count(*) FROM blobs").fetchone() == (3,)
+            # full state is rebuilt from the channel versions
+            saved_1 = saver.get_tuple(config_1)
+            assert saved_1.checkpoint["channel_values"] == {"a": 1, "b": [1, 2, 3]}
+            saved_2 = saver.get_tuple(config_2)
+            assert saved_2.checkpoint["channel_values"] == {"a": 2, "b": [1, 2, 3]}
+            assert [c.checkpoint["channel_values"] for c in saver.list(config)] == [
+                {"a": 2, "b": [1, 2, 3]},
+                {"a": 1, "b": [1, 2, 3]},
+            ]
+
+    def test_get_tuple_legacy_checkpoint(self) -> None:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-4", "checkpoint_ns": ""}
+        }
+        chkpnt_1 = empty_checkpoint()
+        chkpnt_1["channel_values"] = {"a": 1, "b": [1, 2, 3]}
+        chkpnt_1["channel_versions"] = {"a": 1, "b": 1}
+
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            saver.setup()
+            # checkpoint saved with its channel values, before blobs were stored
+            saver.conn.execute(
+                "INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    "thread-4",
+                    "",
+                    chkpnt_1["id"],
+                    *saver.serde.dumps_typed(chkpnt_1),
+                    saver.jsonplus_serde.dumps(self.metadata_1),
+                ),
+            )
+            saved_1 = saver.get_tuple(config)
+            assert saved_1.checkpoint["channel_values"] == {"a": 1, "b": [1, 2, 3]}
+
+            # the next checkpoint can refer to the unchanged channel
+            chkpnt_2 = create_checkpoint(saved_1.checkpoint, None, 2)
+            chkpnt_2["channel_values"] = {"a": 2, "b": [1, 2, 3]}
+            chkpnt_2["channel_versions"] = {"a": 2, "b": 1}
+            config_2 = saver.put(saved_1.config, chkpnt_2, self.metadata_2, {"a": 2})
+            saved_2 = saver.get_tuple(config_2)
+            assert saved_2.checkpoint["channel_values"] == {"a": 2, "b": [1, 2, 3]}
+
+    def test_put_stores_appended_items(self) -> None:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-5", "checkpoint_ns": ""}
+        }
+        items = [{"n": i} for i in range(6)]
+        values = [items[:2], items[:3], items[:5], items[:6], [items[0]]]
+
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            saver.segments.max_segments = 2
+            checkpoint = empty_checkpoint()
+            configs = []
+            for version, value in enumerate(values, start=1):
+                checkpoint = create_checkpoint(checkpoint, None, version)
+                checkpoint["channel_values"] = {"a": value}
+                checkpoint["channel_versions"] = {"a": version}
+                configs.append(
+                    saver.put(
+                        configs[-1] if configs else config,
+                        checkpoint,
+                        self.metadata_1,
+                        {"a": version},
+                    )
+                )
+
+            # appended items are stored as segments, until the list is compacted
+            # after max_segments, or is changed in any other way
+            assert [
+                type_.split(":")[0]
+                for (type_,) in saver.conn.execute(
+                    "SELECT type FROM blobs ORDER BY version"
+                )
+            ] == ["msgpack", "segment", "segment", "msgpack", "msgpack"]
+            for saved_config, value in zip(configs, values):
+                saved = saver.get_tuple(saved_config)
+                assert saved is not None
+                assert saved.checkpoint["channel_values"] == {"a": value}
+            assert [c.checkpoint["channel_values"] for c in saver.list(config)] == [
+                {"a": value} for value in reversed(values)
+            ]
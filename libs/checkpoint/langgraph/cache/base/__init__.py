@@ -0,0 +1,70 @@
+"""Base interface for caches of node results.
+
+A cache maps a full key, ie. a namespace and a key within it, to a value,
+with an optional time-to-live. Values are serialized with the cache's `serde`
+before they are stored, so that cached values can't be mutated by callers.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Generic, Mapping, Optional, Sequence, TypeVar
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+ValueT = TypeVar("ValueT")
+
+Namespace = tuple[str, ...]
+"""Hierarchical namespace of a cache entry, eg. ("parent_graph", "node")."""
+
+FullKey = tuple[Namespace, str]
+"""Namespace and key of a cache entry."""
+
+
+class BaseCache(ABC, Generic[ValueT]):
+    """Base class for caches.
+
+    Subclasses must implement the sync methods `get`, `set` and `clear`.
+    The async methods run the sync ones in the default executor, and should
+    be overridden by caches with native async support.
+    """
+
+    serde: SerializerProtocol = JsonPlusSerializer()
+
+    def __init__(self, *, serde: Optional[SerializerProtocol] = None) -> None:
+        self.serde = serde or self.serde
+
+    @abstractmethod
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """Get the cached values for the given keys.
+        Missing and expired keys are left out of the result."""
+
+    @abstractmethod
+    def set(self, pairs: Mapping[FullKey, tuple[ValueT, Optional[int]]]) -> None:
+        """Set the cached values for the given keys.
+        Each value is paired with its time-to-live in seconds, None for no expiry."""
+
+    @abstractmethod
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        """Delete the cached values for the given namespaces (and their children).
+        If no namespaces are provided, clear all cached values."""
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """Asynchronously get the cached values for the given keys."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, keys)
+
+    async def aset(self, pairs: Mapping[FullKey, tuple[ValueT, Optional[int]]]) -> None:
+        """Asynchronously set the cached values for the given keys."""
+        await asyncio.get_running_loop().run_in_executor(None, self.set, pairs)
+
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        """Asynchronously delete the cached values for the given namespaces."""
+        await asyncio.get_running_loop().run_in_executor(None, self.clear, namespaces)
+
+
+def _ns_matches(ns: Namespace, namespaces: Sequence[Namespace]) -> bool:
+    """Check if a namespace is equal to, or a child of, any of the given namespaces."""
+    return any(ns[: len(prefix)] == prefix for prefix in namespaces)
+
+
+__all__ = ["BaseCache", "FullKey", "Namespace"]
@@ -0,0 +1,92 @@
+"""In-memory LRU cache of node results.
+
+!!! example "Examples"
+    ```python
+    from langgraph.cache.memory import InMemoryCache
+    from langgraph.types import CachePolicy
+
+    builder.add_node("retrieve", retrieve, cache_policy=CachePolicy(ttl=300))
+    graph = builder.compile(cache=InMemoryCache(maxsize=1024))
+    ```
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Mapping, Optional, Sequence
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace, _ns_matches
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+
+class InMemoryCache(BaseCache[Any]):
+    """A thread-safe in-memory cache, evicting the least recently used entries
+    once more than `maxsize` entries are stored.
+
+    Args:
+        maxsize (Optional[int]): Maximum number of entries to keep, None for unbounded.
+        serde (Optional[SerializerProtocol]): Serializer for cached values.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: Optional[int] = 1024,
+        serde: Optional[SerializerProtocol] = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self.maxsize = maxsize
+        # full key -> (serialized value, expiry timestamp or None)
+        self._data: OrderedDict[FullKey, tuple[tuple[str, bytes], Optional[float]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.RLock()
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        now = time.time()
+        values: dict[FullKey, Any] = {}
+        with self._lock:
+            for key in keys:
+                if (entry := self._data.get(key)) is None:
+                    continue
+                value, expiry = entry
+                if expiry is not None and expiry <= now:
+                    del self._data[key]
+                    continue
+                self._data.move_to_end(key)
+                values[key] = value
+        return {k: self.serde.loads_typed(v) for k, v in values.items()}
+
+    def set(self, pairs: Mapping[FullKey, tuple[Any, Optional[int]]]) -> None:
+        now = time.time()
+        entries = {
+            key: (self.serde.dumps_typed(value), now + ttl if ttl is not None else None)
+            for key, (value, ttl) in pairs.items()
+        }
+        with self._lock:
+            for key, entry in entries.items():
+                self._data[key] = entry
+                self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        with self._lock:
+            if namespaces is None:
+                self._data.clear()
+            else:
+                for key in [k for k in self._data if _ns_matches(k[0], namespaces)]:
+                    del self._data[key]
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        return self.get(keys)
+
+    async def aset(self, pairs: Mapping[FullKey, tuple[Any, Optional[int]]]) -> None:
+        self.set(pairs)
+
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        self.clear(namespaces)
+
+
+__all__ = ["InMemoryCache"]
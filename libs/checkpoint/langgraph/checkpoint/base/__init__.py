@@ -132,11 +132,24 @@ def create_checkpoint(
     step: int,
     *,
     id: Optional[str] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> Checkpoint:
-    """Create a checkpoint for the given channels."""
+    """Create a checkpoint for the given channels.
+
+    If `updated_channels` is provided, only the values of those channels are
+    read, and the values of all other channels are shared with `checkpoint`."""
     ts = datetime.now(timezone.utc).isoformat()
     if channels is None:
         values = checkpoint["channel_values"]
+    elif updated_channels is not None:
+        values = checkpoint["channel_values"].copy()
+        for k in updated_channels:
+            if k not in channels or k not in checkpoint["channel_versions"]:
+                continue
+            try:
+                values[k] = channels[k].checkpoint()
+            except EmptyChannelError:
+                values.pop(k, None)
     else:
         values = {}
         for k, v in channels.items():
@@ -318,6 +331,24 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    def put_writes_many(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        """Store intermediate writes of several tasks linked to the same checkpoint.
+
+        The default implementation calls `put_writes` once per task. Override
+        this method to store all writes in a single round trip.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task identifier and the writes of that task.
+        """
+        for task_id, writes in task_writes:
+            self.put_writes(config, writes, task_id)
+
     async def aget(self, config: RunnableConfig) -> Optional[Checkpoint]:
         """Asynchronously fetch a checkpoint using the given configuration.
 
@@ -410,6 +441,24 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    async def aput_writes_many(
+        self,
+        config: RunnableConfig,
+        task_writes: Sequence[Tuple[str, Sequence[Tuple[str, Any]]]],
+    ) -> None:
+        """Asynchronously store intermediate writes of several tasks linked to the same checkpoint.
+
+        The default implementation calls `aput_writes` once per task. Override
+        this method to store all writes in a single round trip.
+
+        Args:
+            config (RunnableConfig): Configuration of the related checkpoint.
+            task_writes (Sequence[Tuple[str, Sequence[Tuple[str, Any]]]]): Pairs of
+                task identifier and the writes of that task.
+        """
+        for task_id, writes in task_writes:
+            await self.aput_writes(config, writes, task_id)
+
     def get_next_version(self, current: Optional[V], channel: ChannelProtocol) -> V:
         """Generate the next version ID for a channel.
 
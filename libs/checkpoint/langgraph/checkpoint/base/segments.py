@@ -0,0 +1,199 @@
+"""Storage of growing list values as appended segments.
+
+Channels such as `messages` hold a list that each step only appends to. Storing
+the full list for every version makes the storage of a thread grow with the
+square of its length. Instead, savers can store the new version of such a list
+as the items appended since the version stored last, together with references
+to the blobs holding the items before them.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Hashable,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+SEGMENT_TYPE_PREFIX = "segment:"
+"""Prefix of the type of blobs storing the items appended to a list."""
+
+Version = Union[str, int, float]
+
+
+class _Stored(NamedTuple):
+    version: Version
+    """Version of the list stored last."""
+    length: int
+    """Length of the list stored last."""
+    digest: bytes
+    """Digest of the serialized items of the list stored last."""
+    base: Version
+    """Version of the last full copy of the list."""
+    segments: tuple[Version, ...]
+    """Versions of the segments appended to the base since."""
+
+
+class SegmentedBlobs:
+    """Serializes channel values, storing a list that only grew since the
+    version stored last for the same channel as the items appended to it.
+
+    A segment blob refers to the blob of the full list it extends (its base),
+    and to the segments appended to the base before it. After `max_segments`
+    segments, the full list is stored again, so that loading a value never needs
+    more than `max_segments + 1` blobs.
+
+    A list only grew if the items at the start of the new list serialize the same
+    as those of the version stored last, as checked with a digest of the
+    serialized items, so that items changed in place are detected. Only the
+    length and digest of the list stored last are kept.
+
+    A segment blob starts with the versions it refers to, so that they can be
+    read without deserializing its items.
+
+    Args:
+        serde: The serializer for the values.
+        max_segments: Number of segments after which the full list is stored again.
+        max_channels: Number of channels for which the list stored last is kept.
+    """
+
+    def __init__(
+        self,
+        serde: SerializerProtocol,
+        *,
+        max_segments: int = 32,
+        max_channels: int = 1024,
+    ) -> None:
+        self.serde = serde
+        self.max_segments = max_segments
+        self.max_channels = max_channels
+        self._stored: OrderedDict[Hashable, _Stored] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def dumps(self, key: Hashable, version: Version, value: Any) -> tuple[str, bytes]:
+        """Serialize a channel value, stored as the given version.
+
+        Args:
+            key: Identifies the channel, eg. (thread ID, checkpoint NS, channel).
+            version: The version the blob is stored as.
+            value: The channel value.
+        """
+        return self.dumps_with_refs(key, version, value)[0]
+
+    def dumps_with_refs(
+        self, key: Hashable, version: Version, value: Any
+    ) -> tuple[tuple[str, bytes], list[Version]]:
+        """Serialize a channel value, as `dumps()`, and also return the versions
+        of the blobs needed to load it, as `refs()` would, for savers that store
+        them alongside the blob."""
+        if type(value) is not list:
+            return self.serde.dumps_typed(value), []
+        with self._lock:
+            prev = self._stored.pop(key, None)
+        digest = hashlib.blake2b(digest_size=16)
+        if (
+            prev is not None
+            and len(prev.segments) < self.max_segments
+            and len(value) >= prev.length
+            and version != prev.base
+            and version not in prev.segments
+            and self._update_digest(digest, value[: prev.length]) == prev.digest
+        ):
+            refs = [prev.base, *prev.segments]
+            appended = value[prev.length :]
+            type_, blob = self.serde.dumps_typed(appended)
+            dumped = (SEGMENT_TYPE_PREFIX + type_, _dumps_header(refs) + blob)
+            stored = _Stored(
+                version,
+                len(value),
+                self._update_digest(digest, appended),
+                prev.base,
+                (*prev.segments, version),
+            )
+        else:
+            dumped = self.serde.dumps_typed(value)
+            refs = []
+            digest = hashlib.blake2b(digest_size=16)
+            stored = _Stored(
+                version, len(value), self._update_digest(digest, value), version, ()
+            )
+        with self._lock:
+            self._stored[key] = stored
+            if len(self._stored) > self.max_channels:
+                self._stored.popitem(last=False)
+        return dumped, refs
+
+    def forget(self, keys: Sequence[Hashable]) -> None:
+        """Forget the lists stored last for the given channels, eg. when storing
+        them failed, so that no segment refers to them."""
+        with self._lock:
+            for key in keys:
+                self._stored.pop(key, None)
+
+    def refs(self, dumped: tuple[str, bytes]) -> list[Version]:
+        """Return the versions of the blobs needed to load a blob."""
+        if not dumped[0].startswith(SEGMENT_TYPE_PREFIX):
+            return []
+        return _loads_header(dumped[1])[0]
+
+    def loads(
+        self,
+        dumped: tuple[str, bytes],
+        blobs: Mapping[Version, tuple[str, bytes]],
+    ) -> Any:
+        """Deserialize a channel value.
+
+        Args:
+            dumped: The blob of the value.
+            blobs: The blobs of the versions returned by `refs()`, by version.
+        """
+        if not dumped[0].startswith(SEGMENT_TYPE_PREFIX):
+            return self.serde.loads_typed(dumped)
+        refs, offset = _loads_header(dumped[1])
+        value = list(self.serde.loads_typed(blobs[refs[0]]))
+        for version in refs[1:]:
+            value.extend(self._loads_segment(blobs[version]))
+        value.extend(self._loads_segment(dumped, offset))
+        return value
+
+    def _loads_segment(
+        self, dumped: tuple[str, bytes], offset: Optional[int] = None
+    ) -> list[Any]:
+        """Deserialize the items of a segment blob, after its header."""
+        type_, blob = dumped
+        if offset is None:
+            offset = _loads_header(blob)[1]
+        return self.serde.loads_typed(
+            (type_[len(SEGMENT_TYPE_PREFIX) :], blob[offset:])
+        )
+
+    def _update_digest(self, digest: Any, items: Iterable[Any]) -> bytes:
+        """Add the serialized items to a digest, returning its value."""
+        for item in items:
+            type_, blob = self.serde.dumps_typed(item)
+            digest.update(len(type_).to_bytes(4, "big"))
+            digest.update(type_.encode())
+            digest.update(len(blob).to_bytes(8, "big"))
+            digest.update(blob)
+        return digest.digest()
+
+
+def _dumps_header(refs: list[Version]) -> bytes:
+    """Serialize the versions a segment blob refers to, prefixed by their length."""
+    header = json.dumps(refs, separators=(",", ":")).encode()
+    return len(header).to_bytes(4, "big") + header
+
+
+def _loads_header(blob: bytes) -> tuple[list[Version], int]:
+    """Return the versions a segment blob refers to, and the offset of its items."""
+    size = int.from_bytes(blob[:4], "big")
+    return json.loads(blob[4 : 4 + size]), 4 + size
@@ -6,7 +6,17 @@ import shutil
 from collections import defaultdict
 from contextlib import AbstractAsyncContextManager, AbstractContextManager, ExitStack
 from types import TracebackType
-from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence, Tuple, Type
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from langchain_core.runnables import RunnableConfig
 
@@ -20,6 +30,7 @@ from langgraph.checkpoint.base import (
     SerializerProtocol,
     get_checkpoint_id,
 )
+from langgraph.checkpoint.base.segments import SegmentedBlobs
 from langgraph.checkpoint.serde.types import TASKS, ChannelProtocol
 
 logger = logging.getLogger(__name__)
@@ -31,6 +42,9 @@ class MemorySaver(
     """An in-memory checkpoint saver.
 
     This checkpoint saver stores checkpoints in memory using a defaultdict.
+    Channel values are stored once per channel version, so each checkpoint only
+    adds the values of the channels updated since the previous one. A list that
+    only grew since is stored as the items appended to it.
 
     Note:
         Only use `MemorySaver` for debugging or testing purposes.
@@ -67,6 +81,8 @@ class MemorySaver(
     writes: defaultdict[
         tuple[str, str, str], dict[tuple[str, int], tuple[str, str, tuple[str, bytes]]]
     ]
+    # (thread ID, checkpoint NS, channel, version) -> serialized channel value
+    blobs: dict[tuple[str, str, str, Union[str, int, float]], tuple[str, bytes]]
 
     def __init__(
         self,
@@ -77,10 +93,13 @@ class MemorySaver(
         super().__init__(serde=serde)
         self.storage = factory(lambda: defaultdict(dict))
         self.writes = factory(dict)
+        self.blobs = factory()
+        self.segments = SegmentedBlobs(self.serde)
         self.stack = ExitStack()
         if factory is not defaultdict:
             self.stack.enter_context(self.storage)  # type: ignore[arg-type]
             self.stack.enter_context(self.writes)  # type: ignore[arg-type]
+            self.stack.enter_context(self.blobs)  # type: ignore[arg-type]
 
     def __enter__(self) -> "MemorySaver":
         return self.stack.__enter__()
@@ -104,6 +123,44 @@ class MemorySaver(
     ) -> Optional[bool]:
         return self.stack.__exit__(__exc_type, __exc_value, __traceback)
 
+    def _load_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint: tuple[str, bytes],
+        sends: list[tuple[str, bytes]],
+        *,
+        migrate: bool = False,
+    ) -> Checkpoint:
+        loaded = self.serde.loads_typed(checkpoint)
+        # checkpoints saved before channel values were stored separately
+        # carry their own channel values, which are used for any missing blob
+        channel_values: dict[str, Any] = loaded.get("channel_values") or {}
+        if migrate and channel_values:
+            for k, v in loaded["channel_versions"].items():
+                if k in channel_values:
+                    self.blobs.setdefault(
+                        (thread_id, checkpoint_ns, k, v),
+                        self.serde.dumps_typed(channel_values[k]),
+                    )
+        for k, v in loaded["channel_versions"].items():
+            if blob := self.blobs.get((thread_id, checkpoint_ns, k, v)):
+                if blob[0] == "empty":
+                    channel_values.pop(k, None)
+                else:
+                    channel_values[k] = self.segments.loads(
+                        blob,
+                        {
+                            ref: self.blobs[(thread_id, checkpoint_ns, k, ref)]
+                            for ref in self.segments.refs(blob)
+                        },
+                    )
+        return {
+            **loaded,
+            "channel_values": channel_values,
+            "pending_sends": [self.serde.loads_typed(s) for s in sends],
+        }
+
     def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Get a checkpoint tuple from the in-memory storage.
 
@@ -136,10 +193,9 @@ class MemorySaver(
                     sends = []
                 return CheckpointTuple(
                     config=config,
-                    checkpoint={
-                        **self.serde.loads_typed(checkpoint),
-                        "pending_sends": [self.serde.loads_typed(s) for s in sends],
-                    },
+                    checkpoint=self._load_checkpoint(
+                        thread_id, checkpoint_ns, checkpoint, sends, migrate=True
+                    ),
                     metadata=self.serde.loads_typed(metadata),
                     pending_writes=[
                         (id, c, self.serde.loads_typed(v)) for id, c, v in writes
@@ -177,10 +233,9 @@ class MemorySaver(
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    checkpoint={
-                        **self.serde.loads_typed(checkpoint),
-                        "pending_sends": [self.serde.loads_typed(s) for s in sends],
-                    },
+                    checkpoint=self._load_checkpoint(
+                        thread_id, checkpoint_ns, checkpoint, sends, migrate=True
+                    ),
                     metadata=self.serde.loads_typed(metadata),
                     pending_writes=[
                         (id, c, self.serde.loads_typed(v)) for id, c, v in writes
@@ -289,10 +344,9 @@ class MemorySaver(
                                 "checkpoint_id": checkpoint_id,
                             }
                         },
-                        checkpoint={
-                            **self.serde.loads_typed(checkpoint),
-                            "pending_sends": [self.serde.loads_typed(s) for s in sends],
-                        },
+                        checkpoint=self._load_checkpoint(
+                            thread_id, checkpoint_ns, checkpoint, sends
+                        ),
                         metadata=metadata,
                         parent_config={
                             "configurable": {
@@ -331,8 +385,16 @@ class MemorySaver(
         """
         c = checkpoint.copy()
         c.pop("pending_sends")  # type: ignore[misc]
+        values: dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        # only store the values of channels updated since the previous checkpoint
+        for k, v in new_versions.items():
+            self.blobs[(thread_id, checkpoint_ns, k, v)] = (
+                self.segments.dumps((thread_id, checkpoint_ns, k), v, values[k])
+                if k in values
+                else ("empty", b"")
+            )
         self.storage[thread_id][checkpoint_ns].update(
             {
                 checkpoint["id"]: (
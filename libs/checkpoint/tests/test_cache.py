@@ -0,0 +1,58 @@
+import time
+
+from langgraph.cache.memory import InMemoryCache
+
+
+def test_in_memory_cache() -> None:
+    cache = InMemoryCache()
+    cache.set(
+        {
+            (("graph", "a"), "k1"): ({"x": 1}, None),
+            (("graph", "b"), "k1"): ([("chan", "value")], None),
+            (("other",), "k1"): ("other", None),
+        }
+    )
+    assert cache.get([(("graph", "a"), "k1"), (("graph", "a"), "missing")]) == {
+        (("graph", "a"), "k1"): {"x": 1}
+    }
+
+    # cached values are copies
+    cache.get([(("graph", "a"), "k1")])[(("graph", "a"), "k1")]["x"] = 2
+    assert cache.get([(("graph", "a"), "k1")]) == {(("graph", "a"), "k1"): {"x": 1}}
+
+    # clear a namespace and its children
+    cache.clear([("graph",)])
+    assert cache.get(
+        [(("graph", "a"), "k1"), (("graph", "b"), "k1"), (("other",), "k1")]
+    ) == {(("other",), "k1"): "other"}
+
+    # clear everything
+    cache.clear()
+    assert cache.get([(("other",), "k1")]) == {}
+
+
+def test_in_memory_cache_ttl() -> None:
+    cache = InMemoryCache()
+    cache.set({(("a",), "short"): (1, 0), (("a",), "long"): (2, 60)})
+    time.sleep(0.01)
+    assert cache.get([(("a",), "short"), (("a",), "long")]) == {(("a",), "long"): 2}
+
+
+def test_in_memory_cache_lru() -> None:
+    cache = InMemoryCache(maxsize=2)
+    cache.set({(("a",), "1"): (1, None), (("a",), "2"): (2, None)})
+    # reading "1" makes "2" the least recently used
+    assert cache.get([(("a",), "1")]) == {(("a",), "1"): 1}
+    cache.set({(("a",), "3"): (3, None)})
+    assert cache.get([(("a",), "1"), (("a",), "2"), (("a",), "3")]) == {
+        (("a",), "1"): 1,
+        (("a",), "3"): 3,
+    }
+
+
+async def test_in_memory_cache_async() -> None:
+    cache = InMemoryCache()
+    await cache.aset({(("a",), "1"): (1, None)})
+    assert await cache.aget([(("a",), "1")]) == {(("a",), "1"): 1}
+    await cache.aclear([("a",)])
+    assert await cache.aget([(("a",), "1")]) == {}
@@ -138,3 +138,86 @@ class TestMemorySaver:
             c async for c in self.memory_saver.alist(None, filter=query_4)
         ]
         assert len(search_results_4) == 0
+
+    def test_put_stores_only_updated_channels(self) -> None:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-3", "checkpoint_ns": ""}
+        }
+        chkpnt_1 = empty_checkpoint()
+        chkpnt_1["channel_values"] = {"a": 1, "b": [1, 2, 3]}
+        chkpnt_1["channel_versions"] = {"a": 1, "b": 1}
+        config_1 = self.memory_saver.put(
+            config, chkpnt_1, self.metadata_1, {"a": 1, "b": 1}
+        )
+
+        chkpnt_2 = create_checkpoint(chkpnt_1, None, 2)
+        chkpnt_2["channel_values"] = {"a": 2, "b": [1, 2, 3]}
+        chkpnt_2["channel_versions"] = {"a": 2, "b": 1}
+        config_2 = self.memory_saver.put(config_1, chkpnt_2, self.metadata_2, {"a": 2})
+
+        # an unchanged channel is stored once
+        assert len(self.memory_saver.blobs) == 3
+        # full state is rebuilt from the channel versions
+        saved_1 = self.memory_saver.get_tuple(config_1)
+        assert saved_1.checkpoint["channel_values"] == {"a": 1, "b": [1, 2, 3]}
+        saved_2 = self.memory_saver.get_tuple(config_2)
+        assert saved_2.checkpoint["channel_values"] == {"a": 2, "b": [1, 2, 3]}
+        assert [
+            c.checkpoint["channel_values"] for c in self.memory_saver.list(config)
+        ] == [{"a": 2, "b": [1, 2, 3]}, {"a": 1, "b": [1, 2, 3]}]
+
+    def test_put_stores_appended_items(self) -> None:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-4", "checkpoint_ns": ""}
+        }
+        self.memory_saver.segments.max_segments = 2
+        items = [{"n": i} for i in range(6)]
+        values = [items[:2], items[:3], items[:5], items[:6], [items[0]]]
+        checkpoint = empty_checkpoint()
+        configs = []
+        for version, value in enumerate(values, start=1):
+            checkpoint = create_checkpoint(checkpoint, None, version)
+            checkpoint["channel_values"] = {"a": value}
+            checkpoint["channel_versions"] = {"a": version}
+            config = self.memory_saver.put(
+                config, checkpoint, self.metadata_1, {"a": version}
+            )
+            configs.append(config)
+
+        # appended items are stored as segments, until the list is compacted
+        # after max_segments, or is changed in any other way
+        assert [
+            self.memory_saver.blobs[("thread-4", "", "a", v)][0].split(":")[0]
+            for v in range(1, 6)
+        ] == ["msgpack", "segment", "segment", "msgpack", "msgpack"]
+        for config, value in zip(configs, values):
+            saved = self.memory_saver.get_tuple(config)
+            assert saved.checkpoint["channel_values"] == {"a": value}
+
+    def test_put_stores_items_changed_in_place(self) -> None:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-5", "checkpoint_ns": ""}
+        }
+        value = [{"n": 0}, {"n": 1}]
+        checkpoint = empty_checkpoint()
+        saved = []
+        for version in range(1, 3):
+            checkpoint = create_checkpoint(checkpoint, None, version)
+            checkpoint["channel_values"] = {"a": value}
+            checkpoint["channel_versions"] = {"a": version}
+            config = self.memory_saver.put(
+                config, checkpoint, self.metadata_1, {"a": version}
+            )
+            saved.append((config, [dict(item) for item in value]))
+            # the same list, with an item changed in place and another appended
+            value[0]["n"] = 10
+            value.append({"n": 2})
+
+        # the list is stored in full, as its first items changed
+        assert [
+            self.memory_saver.blobs[("thread-5", "", "a", v)][0].split(":")[0]
+            for v in range(1, 3)
+        ] == ["msgpack", "msgpack"]
+        for config, value in saved:
+            saved_tuple = self.memory_saver.get_tuple(config)
+            assert saved_tuple.checkpoint["channel_values"] == {"a": value}
@@ -1,45 +1,82 @@
+import atexit
 import random
+import shutil
+import tempfile
+from typing import Any, Optional
 from uuid import uuid4
 
 from langchain_core.messages import HumanMessage
 from pyperf._runner import Runner
 from uvloop import new_event_loop
 
-from bench.fanout_to_subgraph import fanout_to_subgraph, fanout_to_subgraph_sync
+from bench.checkpointers import duckdb_saver, sqlite_saver
+from bench.fanout_to_subgraph import (
+    fanout_to_subgraph,
+    fanout_to_subgraph_sync,
+    fanout_to_task,
+    fanout_to_task_sync,
+)
+from bench.interrupt_resume import interrupt_resume
+from bench.long_thread import long_thread, long_thread_input
+from bench.nested_subgraphs import nested_subgraphs
 from bench.react_agent import react_agent
+from bench.state_schema import state_schema, state_schema_input
+from bench.store import store_put, store_search
+from bench.wide_dict import wide_dict
 from bench.wide_state import wide_state
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.pregel import Pregel
+from langgraph.types import Command, StreamMode
 
+# SQLite and DuckDB savers store checkpoints in local files in this directory
+tmpdir = tempfile.mkdtemp(prefix="langgraph-bench-")
+atexit.register(shutil.rmtree, tmpdir, ignore_errors=True)
 
-async def arun(graph: Pregel, input: dict):
-    len(
-        [
-            c
-            async for c in graph.astream(
-                input,
-                {
-                    "configurable": {"thread_id": str(uuid4())},
-                    "recursion_limit": 1000000000,
-                },
-            )
-        ]
-    )
 
+async def arun(
+    graph: Pregel,
+    input: Any,
+    stream_mode: Optional[StreamMode] = None,
+    resumes: int = 0,
+):
+    config = {
+        "configurable": {"thread_id": str(uuid4())},
+        "recursion_limit": 1000000000,
+    }
+    len([c async for c in graph.astream(input, config, stream_mode=stream_mode)])
+    # resume the thread after each interrupt
+    for i in range(resumes):
+        len(
+            [
+                c
+                async for c in graph.astream(
+                    Command(resume=str(i)), config, stream_mode=stream_mode
+                )
+            ]
+        )
 
-def run(graph: Pregel, input: dict):
-    len(
-        [
-            c
-            for c in graph.stream(
-                input,
-                {
-                    "configurable": {"thread_id": str(uuid4())},
-                    "recursion_limit": 1000000000,
-                },
-            )
-        ]
-    )
+
+def run(
+    graph: Pregel,
+    input: Any,
+    stream_mode: Optional[StreamMode] = None,
+    resumes: int = 0,
+):
+    config = {
+        "configurable": {"thread_id": str(uuid4())},
+        "recursion_limit": 1000000000,
+    }
+    len([c for c in graph.stream(input, config, stream_mode=stream_mode)])
+    # resume the thread after each interrupt
+    for i in range(resumes):
+        len(
+            [
+                c
+                for c in graph.stream(
+                    Command(resume=str(i)), config, stream_mode=stream_mode
+                )
+            ]
+        )
 
 
 benchmarks = (
@@ -83,6 +120,26 @@ benchmarks = (
             ]
         },
     ),
+    (
+        "fanout_to_task_10000x",
+        fanout_to_task(),
+        fanout_to_task_sync(),
+        [
+            "".join(random.choices("abcdefghijklmnopqrstuvwxyz", k=10))
+            for _ in range(10000)
+        ],
+    ),
+    (
+        "fanout_to_subgraph_10000x",
+        fanout_to_subgraph().compile(checkpointer=None),
+        fanout_to_subgraph_sync().compile(checkpointer=None),
+        {
+            "subjects": [
+                random.choices("abcdefghijklmnopqrstuvwxyz", k=1000)
+                for _ in range(10000)
+            ]
+        },
+    ),
     (
         "react_agent_10x",
         react_agent(10, checkpointer=None),
@@ -203,12 +260,119 @@ benchmarks = (
             ]
         },
     ),
+    *(
+        (
+            f"state_{kind}_100x100",
+            state_schema(kind, 100).compile(checkpointer=None),
+            state_schema(kind, 100).compile(checkpointer=None),
+            state_schema_input(100),
+        )
+        for kind in ("typeddict", "dataclass", "pydantic")
+    ),
+    (
+        "wide_dict_1000x100",
+        wide_dict(1000, 100).compile(checkpointer=None),
+        wide_dict(1000, 100).compile(checkpointer=None),
+        {"step": 0},
+    ),
+    (
+        "wide_dict_1000x100_checkpoint",
+        wide_dict(1000, 100).compile(checkpointer=MemorySaver()),
+        wide_dict(1000, 100).compile(checkpointer=MemorySaver()),
+        {"step": 0},
+    ),
+    # the async SQLite and DuckDB savers are bound to the event loop they are
+    # created in, so only the sync graphs are run with them
+    *(
+        (
+            f"{name}_checkpoint_{saver.__name__.removesuffix('_saver')}",
+            None,
+            graph,
+            input,
+        )
+        for saver in (sqlite_saver, duckdb_saver)
+        for name, graph, input in (
+            (
+                "fanout_to_subgraph_10x",
+                fanout_to_subgraph_sync().compile(
+                    checkpointer=saver(tmpdir, f"fanout_{uuid4()}")
+                ),
+                {
+                    "subjects": [
+                        random.choices("abcdefghijklmnopqrstuvwxyz", k=1000)
+                        for _ in range(10)
+                    ]
+                },
+            ),
+            (
+                "react_agent_10x",
+                react_agent(10, checkpointer=saver(tmpdir, f"react_{uuid4()}")),
+                {"messages": [HumanMessage("hi?")]},
+            ),
+            (
+                "long_thread_1000x10",
+                long_thread(10).compile(
+                    checkpointer=saver(tmpdir, f"long_thread_{uuid4()}")
+                ),
+                long_thread_input(1000),
+            ),
+        )
+    ),
+    *(
+        (
+            f"react_agent_100x_stream_{stream_mode}",
+            react_agent(100, checkpointer=None),
+            react_agent(100, checkpointer=None),
+            {"messages": [HumanMessage("hi?")]},
+            stream_mode,
+        )
+        for stream_mode in ("values", "updates", "messages")
+    ),
+    (
+        "nested_subgraphs_10x100",
+        nested_subgraphs(10, 100).compile(checkpointer=None),
+        nested_subgraphs(10, 100).compile(checkpointer=None),
+        {"items": [], "step": 0},
+    ),
+    (
+        "nested_subgraphs_10x100_checkpoint",
+        nested_subgraphs(10, 100).compile(checkpointer=MemorySaver()),
+        nested_subgraphs(10, 100).compile(checkpointer=MemorySaver()),
+        {"items": [], "step": 0},
+    ),
+    (
+        "long_thread_1000x100_checkpoint",
+        long_thread(100).compile(checkpointer=MemorySaver()),
+        long_thread(100).compile(checkpointer=MemorySaver()),
+        long_thread_input(1000),
+    ),
+    (
+        "long_thread_5000x100_checkpoint",
+        long_thread(100).compile(checkpointer=MemorySaver()),
+        long_thread(100).compile(checkpointer=MemorySaver()),
+        long_thread_input(5000),
+    ),
+    (
+        "interrupt_resume_100x_checkpoint",
+        interrupt_resume().compile(checkpointer=MemorySaver()),
+        interrupt_resume().compile(checkpointer=MemorySaver()),
+        {"answers": [], "step": 0},
+        None,
+        100,
+    ),
 )
 
 
 r = Runner()
 
-for name, agraph, graph, input in benchmarks:
-    r.bench_async_func(name, arun, agraph, input, loop_factory=new_event_loop)
+for name, agraph, graph, input, *args in benchmarks:
+    if agraph is not None:
+        r.bench_async_func(
+            name, arun, agraph, input, *args, loop_factory=new_event_loop
+        )
     if graph is not None:
-        r.bench_func(name + "_sync", run, graph, input)
+        r.bench_func(name + "_sync", run, graph, input, *args)
+
+for n_items in (10_000, 100_000, 1_000_000):
+    r.bench_func(f"store_put_{n_items}", store_put, n_items)
+    r.bench_func(f"store_search_{n_items}", store_search, n_items)
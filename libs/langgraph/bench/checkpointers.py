@@ -0,0 +1,24 @@
+import os
+import sqlite3
+
+import duckdb
+
+from langgraph.checkpoint.duckdb import DuckDBSaver
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+
+def sqlite_saver(dirname: str, name: str) -> SqliteSaver:
+    """A SQLite saver storing checkpoints in a local file, so that writes go
+    to disk as they would in a deployment."""
+    return SqliteSaver(
+        sqlite3.connect(
+            os.path.join(dirname, f"{name}.sqlite"), check_same_thread=False
+        )
+    )
+
+
+def duckdb_saver(dirname: str, name: str) -> DuckDBSaver:
+    """A DuckDB saver storing checkpoints in a local file."""
+    saver = DuckDBSaver(duckdb.connect(os.path.join(dirname, f"{name}.duckdb")))
+    saver.setup()
+    return saver
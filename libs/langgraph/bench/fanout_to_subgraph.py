@@ -2,7 +2,9 @@ import operator
 from typing import Annotated, TypedDict
 
 from langgraph.constants import END, START, Send
+from langgraph.func import entrypoint, task
 from langgraph.graph.state import StateGraph
+from langgraph.pregel import Pregel
 
 
 def fanout_to_subgraph() -> StateGraph:
@@ -101,6 +103,32 @@ def fanout_to_subgraph_sync() -> StateGraph:
     return builder
 
 
+def fanout_to_task() -> Pregel:
+    @task()
+    async def generate(subject: str) -> str:
+        return f"Joke about {subject}"
+
+    @entrypoint()
+    async def generate_jokes(subjects: list[str]) -> list[str]:
+        futures = [generate(s) for s in subjects]
+        return [await f for f in futures]
+
+    return generate_jokes
+
+
+def fanout_to_task_sync() -> Pregel:
+    @task()
+    def generate(subject: str) -> str:
+        return f"Joke about {subject}"
+
+    @entrypoint()
+    def generate_jokes(subjects: list[str]) -> list[str]:
+        futures = [generate(s) for s in subjects]
+        return [f.result() for f in futures]
+
+    return generate_jokes
+
+
 if __name__ == "__main__":
     import asyncio
     import random
@@ -112,7 +140,7 @@ if __name__ == "__main__":
     graph = fanout_to_subgraph().compile(checkpointer=MemorySaver())
     input = {
         "subjects": [
-            random.choices("abcdefghijklmnopqrstuvwxyz", k=1000) for _ in range(1000)
+            random.choices("abcdefghijklmnopqrstuvwxyz", k=1000) for _ in range(10000)
         ]
     }
     config = {"configurable": {"thread_id": "1"}}
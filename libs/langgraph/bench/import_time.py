@@ -0,0 +1,96 @@
+import subprocess
+import sys
+from typing import NamedTuple
+
+MODULE = "langgraph.graph"
+
+# modules that importing `MODULE` should not load, as they are only needed by
+# some graphs, and are imported on first use instead
+DEFERRED = (
+    "langgraph.pregel.debug",
+    "langgraph.pregel.messages",
+    "langgraph.pregel.remote",
+    "langgraph.utils.pydantic",
+    "langgraph_sdk",
+    "concurrent.futures.process",
+    "pprint",
+)
+
+
+class ImportTime(NamedTuple):
+    total: int
+    """Cumulative import time of the module, in microseconds."""
+    own: int
+    """Import time of langgraph modules only, excluding their dependencies,
+    in microseconds."""
+    deferred: list[str]
+    """Modules in `DEFERRED` that were imported."""
+
+
+def import_time(module: str = MODULE) -> ImportTime:
+    """Import a module in a new interpreter with `python -X importtime`, and
+    parse its report."""
+    code = (
+        f"import sys, {module}; print(*(m for m in {DEFERRED!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = own = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # header
+        name = name.strip()
+        if name.startswith("langgraph.") and not name.startswith(
+            ("langgraph.checkpoint", "langgraph.store")
+        ):
+            own += int(self_us)
+        if name == module:
+            total = int(cumulative_us)
+    return ImportTime(total, own, proc.stdout.split())
+
+
+def best_import_time(module: str = MODULE, runs: int = 5) -> ImportTime:
+    """The fastest of `runs` imports, as the others are slowed down by noise."""
+    return min((import_time(module) for _ in range(runs)), key=lambda t: t.total)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=f"Fail if importing {MODULE} takes longer than a budget."
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget", type=float, default=1500, help="Total import time, in ms."
+    )
+    parser.add_argument(
+        "--own-budget",
+        type=float,
+        default=150,
+        help="Import time of langgraph modules only, in ms.",
+    )
+    args = parser.parse_args()
+
+    result = best_import_time(MODULE, args.runs)
+    print(f"import {MODULE}: {result.total / 1000:.1f}ms total")
+    print(f"import {MODULE}: {result.own / 1000:.1f}ms in langgraph modules")
+    errors = []
+    if result.total / 1000 > args.budget:
+        errors.append(f"total import time is over budget of {args.budget}ms")
+    if result.own / 1000 > args.own_budget:
+        errors.append(
+            f"import time of langgraph modules is over budget of {args.own_budget}ms"
+        )
+    if result.deferred:
+        errors.append(f"modules imported eagerly: {', '.join(result.deferred)}")
+    for error in errors:
+        print(f"FAIL: {error}", file=sys.stderr)
+    sys.exit(1 if errors else 0)
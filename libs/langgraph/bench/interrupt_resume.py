@@ -0,0 +1,47 @@
+import operator
+from typing import Annotated, TypedDict
+
+from langgraph.constants import START
+from langgraph.graph.state import StateGraph
+from langgraph.types import interrupt
+
+
+def interrupt_resume() -> StateGraph:
+    """A graph whose only node interrupts every time it runs, and loops back
+    to itself once resumed. Running it for a number of interrupt/resume cycles
+    on the same thread makes the cost of saving and restoring the state for
+    every cycle visible."""
+
+    class State(TypedDict):
+        answers: Annotated[list[str], operator.add]
+        step: int
+
+    def ask(state: State) -> dict:
+        answer = interrupt(f"question {state['step']}")
+        return {"answers": [answer], "step": state["step"] + 1}
+
+    builder = StateGraph(State)
+    builder.add_node("ask", ask)
+    builder.add_edge(START, "ask")
+    builder.add_edge("ask", "ask")
+    return builder
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    import uvloop
+
+    from langgraph.checkpoint.memory import MemorySaver
+    from langgraph.types import Command
+
+    graph = interrupt_resume().compile(checkpointer=MemorySaver())
+    config = {"configurable": {"thread_id": "1"}, "recursion_limit": 20000000000}
+
+    async def run():
+        len([c async for c in graph.astream({"answers": [], "step": 0}, config)])
+        for i in range(100):
+            len([c async for c in graph.astream(Command(resume=str(i)), config)])
+
+    uvloop.install()
+    asyncio.run(run())
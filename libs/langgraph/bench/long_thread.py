@@ -0,0 +1,57 @@
+from langchain_core.messages import AIMessage, HumanMessage
+
+from langgraph.constants import END, START
+from langgraph.graph.message import MessagesState
+from langgraph.graph.state import StateGraph
+
+
+def long_thread(n_steps: int) -> StateGraph:
+    """A chat graph adding one message per step for `n_steps` steps to a thread
+    that already holds many messages. With a checkpointer, this makes the cost
+    of saving a growing list of messages for every step visible."""
+
+    class State(MessagesState):
+        step: int
+
+    def reply(state: State) -> dict:
+        step = state["step"] + 1
+        return {
+            "messages": [AIMessage(f"reply {step}", id=f"reply-{step}")],
+            "step": step,
+        }
+
+    builder = StateGraph(State)
+    builder.add_node("reply", reply)
+    builder.add_edge(START, "reply")
+    builder.add_conditional_edges(
+        "reply", lambda state: END if state["step"] >= n_steps else "reply"
+    )
+    return builder
+
+
+def long_thread_input(n_messages: int) -> dict:
+    return {
+        "messages": [
+            (HumanMessage if i % 2 else AIMessage)("lorem ipsum " * 20, id=str(i))
+            for i in range(n_messages)
+        ],
+        "step": 0,
+    }
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    import uvloop
+
+    from langgraph.checkpoint.memory import MemorySaver
+
+    graph = long_thread(100).compile(checkpointer=MemorySaver())
+    input = long_thread_input(1000)
+    config = {"configurable": {"thread_id": "1"}, "recursion_limit": 20000000000}
+
+    async def run():
+        len([c async for c in graph.astream(input, config=config)])
+
+    uvloop.install()
+    asyncio.run(run())
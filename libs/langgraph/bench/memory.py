@@ -0,0 +1,184 @@
+import gc
+import itertools
+import os
+import tracemalloc
+from functools import lru_cache
+from typing import Any, Optional, TypedDict
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, AnyMessage
+
+import langgraph
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.constants import END, START
+from langgraph.graph.state import StateGraph
+from langgraph.pregel import Pregel
+
+# subsystems allocations are attributed to, by the path of the innermost
+# langgraph frame that made them, relative to the package, checked in order
+SUBSYSTEMS = (
+    ("channels", ("channels/", "managed/")),
+    ("checkpoint", ("checkpoint/",)),
+    (
+        "stream",
+        (
+            "pregel/messages.py",
+            "pregel/io.py",
+            "pregel/debug.py",
+            "utils/queue.py",
+        ),
+    ),
+    (
+        "writes",
+        (
+            "pregel/algo.py",
+            "pregel/write.py",
+            "pregel/runner.py",
+            "pregel/retry.py",
+        ),
+    ),
+    ("loop", ("",)),
+)
+
+# langgraph is a namespace package, spread over the libraries installing it
+PACKAGE_PATHS = tuple(os.path.join(path, "") for path in langgraph.__path__)
+
+
+def memory_graph(n_steps: int) -> StateGraph:
+    """A graph looping over a node calling a chat model for `n_steps` steps.
+    Its state holds a large document that is never updated, and a message that
+    is replaced every step, so that the memory retained by a run, and by the
+    checkpoints of its thread, should not grow with the large document."""
+
+    class State(TypedDict):
+        doc: str
+        messages: list[AnyMessage]
+        step: int
+
+    model = GenericFakeChatModel(
+        messages=(AIMessage(f"answer {i}") for i in itertools.count())
+    )
+
+    def chat(state: State) -> dict:
+        return {
+            "messages": [model.invoke(state["messages"])],
+            "step": state["step"] + 1,
+        }
+
+    builder = StateGraph(State)
+    builder.add_node("chat", chat)
+    builder.add_edge(START, "chat")
+    builder.add_conditional_edges(
+        "chat", lambda state: END if state["step"] >= n_steps else "chat"
+    )
+    return builder
+
+
+def memory_graph_input(doc_size: int = 100_000) -> dict:
+    return {"doc": "x" * doc_size, "messages": [], "step": 0}
+
+
+@lru_cache(maxsize=None)
+def subsystem(filename: str) -> Optional[str]:
+    for root in PACKAGE_PATHS:
+        if filename.startswith(root):
+            path = filename[len(root) :].replace(os.sep, "/")
+            for name, prefixes in SUBSYSTEMS:
+                if path.startswith(prefixes):
+                    return name
+    return None
+
+
+@lru_cache(maxsize=None)
+def attribute(traceback: tracemalloc.Traceback) -> str:
+    """The subsystem of the innermost langgraph frame of a traceback."""
+    # frames are ordered from the oldest to the most recent
+    for frame in reversed(traceback):
+        if name := subsystem(frame.filename):
+            return name
+    return "other"
+
+
+def retained() -> dict[str, int]:
+    """Size of the memory allocated since `tracemalloc` started and still in
+    use, by subsystem. Allocations made outside of langgraph frames are counted
+    as "other"."""
+    # reference cycles freed by the next collection aren't retained
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot()
+    sizes = dict.fromkeys([name for name, _ in SUBSYSTEMS] + ["other"], 0)
+    for trace in snapshot.traces:
+        sizes[attribute(trace.traceback)] += trace.size
+    return sizes
+
+
+def measure(graph: Pregel, input: Any, *, n_frames: int = 32) -> list[dict[str, int]]:
+    """Run a graph under `tracemalloc`, and return the memory retained by
+    subsystem after each superstep, starting with the one before the first."""
+    config = {"configurable": {"thread_id": "1"}, "recursion_limit": 1000000000}
+    steps = []
+    tracemalloc.start(n_frames)
+    try:
+        steps.append(retained())
+        for mode, _ in graph.stream(
+            input, config, stream_mode=["values", "updates", "messages"]
+        ):
+            if mode == "values":
+                steps.append(retained())
+    finally:
+        tracemalloc.stop()
+    return steps
+
+
+def growth_per_step(steps: list[dict[str, int]], warmup: int) -> dict[str, float]:
+    """Average growth of the memory retained by each subsystem per superstep,
+    leaving out the first `warmup` supersteps."""
+    first, last = steps[min(warmup, len(steps) - 2)], steps[-1]
+    n_steps = len(steps) - 1 - min(warmup, len(steps) - 2)
+    return {name: (last[name] - first[name]) / n_steps for name in last}
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    from langgraph.checkpoint.memory import MemorySaver
+
+    parser = argparse.ArgumentParser(
+        description="Report the memory retained by each subsystem per superstep, "
+        "and fail if one grows by more than a threshold."
+    )
+    parser.add_argument("--steps", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--doc-size", type=int, default=100_000)
+    parser.add_argument("--checkpointer", choices=("none", "memory"), default="memory")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=8192,
+        help="Growth per superstep allowed for each subsystem, in bytes.",
+    )
+    parser.add_argument("--per-step", action="store_true")
+    args = parser.parse_args()
+
+    checkpointer: Optional[BaseCheckpointSaver] = (
+        MemorySaver() if args.checkpointer == "memory" else None
+    )
+    graph = memory_graph(args.steps).compile(checkpointer=checkpointer)
+    steps = measure(graph, memory_graph_input(args.doc_size))
+
+    names = list(steps[0])
+    if args.per_step:
+        print("step", *names, sep="\t")
+        for i, (prev, curr) in enumerate(zip(steps, steps[1:])):
+            print(i, *(curr[name] - prev[name] for name in names), sep="\t")
+    growth = growth_per_step(steps, args.warmup)
+    failed = False
+    for name in names:
+        over = name != "other" and growth[name] > args.threshold
+        failed = failed or over
+        print(
+            f"{name}: {steps[-1][name] - steps[0][name]} bytes retained, "
+            f"{growth[name]:.0f} bytes per step" + (" FAIL" if over else "")
+        )
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,52 @@
+import operator
+from typing import Annotated, TypedDict
+
+from langgraph.constants import END, START
+from langgraph.graph.state import StateGraph
+
+
+def nested_subgraphs(depth: int, n_steps: int) -> StateGraph:
+    """A graph nesting `depth` levels of subgraphs, each the only node of its
+    parent, where the innermost one loops for `n_steps` steps. This makes the
+    cost of entering and leaving subgraphs, and of their nested checkpoint
+    namespaces, visible."""
+
+    class State(TypedDict):
+        items: Annotated[list[str], operator.add]
+        step: int
+
+    def inner(state: State) -> dict:
+        return {"items": [f"step {state['step']}"], "step": state["step"] + 1}
+
+    builder = StateGraph(State)
+    builder.add_node("inner", inner)
+    builder.add_edge(START, "inner")
+    builder.add_conditional_edges(
+        "inner", lambda state: END if state["step"] >= n_steps else "inner"
+    )
+
+    for level in range(depth):
+        parent = StateGraph(State)
+        parent.add_node(f"level_{level}", builder.compile())
+        parent.add_edge(START, f"level_{level}")
+        builder = parent
+
+    return builder
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    import uvloop
+
+    from langgraph.checkpoint.memory import MemorySaver
+
+    graph = nested_subgraphs(10, 100).compile(checkpointer=MemorySaver())
+    input = {"items": [], "step": 0}
+    config = {"configurable": {"thread_id": "1"}, "recursion_limit": 20000000000}
+
+    async def run():
+        len([c async for c in graph.astream(input, config=config, subgraphs=True)])
+
+    uvloop.install()
+    asyncio.run(run())
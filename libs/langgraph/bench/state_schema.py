@@ -0,0 +1,101 @@
+import operator
+from dataclasses import dataclass, field
+from typing import Annotated, Any, Literal, TypedDict
+
+from pydantic import BaseModel
+
+from langgraph.constants import END, START
+from langgraph.graph.state import StateGraph
+
+
+class Doc(BaseModel):
+    id: str
+    text: str
+    tags: list[str]
+    meta: dict[str, int]
+
+
+class DocDict(TypedDict):
+    id: str
+    text: str
+    tags: list[str]
+    meta: dict[str, int]
+
+
+def state_schema(
+    kind: Literal["typeddict", "dataclass", "pydantic"], n_steps: int
+) -> StateGraph:
+    """A graph looping over two nodes for `n_steps` steps, with a large state that
+    only changes in a couple of small keys. The state is declared as a TypedDict,
+    a dataclass or a pydantic model, which makes the cost of coercing the state
+    for every node visible."""
+
+    if kind == "pydantic":
+
+        class PydanticState(BaseModel):
+            docs: list[Doc] = []
+            notes: Annotated[list[str], operator.add] = []
+            step: int = 0
+
+        State: Any = PydanticState
+    elif kind == "dataclass":
+
+        @dataclass
+        class DataclassState:
+            docs: list[DocDict] = field(default_factory=list)
+            notes: Annotated[list[str], operator.add] = field(default_factory=list)
+            step: int = 0
+
+        State = DataclassState
+    else:
+
+        class TypedDictState(TypedDict):
+            docs: list[DocDict]
+            notes: Annotated[list[str], operator.add]
+            step: int
+
+        State = TypedDictState
+
+    def get_step(state: Any) -> int:
+        return state["step"] if isinstance(state, dict) else state.step
+
+    def one(state: Any) -> dict:
+        return {"notes": [f"one {get_step(state)}"]}
+
+    def two(state: Any) -> dict:
+        return {"notes": [f"two {get_step(state)}"], "step": get_step(state) + 1}
+
+    builder = StateGraph(State)
+    builder.add_node(one)
+    builder.add_node(two)
+    builder.add_edge(START, "one")
+    builder.add_edge("one", "two")
+    builder.add_conditional_edges(
+        "two", lambda state: END if get_step(state) >= n_steps else "one"
+    )
+    return builder
+
+
+def state_schema_input(n_docs: int) -> dict:
+    return {
+        "docs": [
+            {
+                "id": str(i),
+                "text": "lorem ipsum " * 20,
+                "tags": [f"tag{j}" for j in range(10)],
+                "meta": {f"key{j}": j for j in range(10)},
+            }
+            for i in range(n_docs)
+        ],
+        "step": 0,
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    for kind in ("typeddict", "dataclass", "pydantic"):
+        graph = state_schema(kind, 100).compile()  # type: ignore[arg-type]
+        start = time.perf_counter()
+        graph.invoke(state_schema_input(100), {"recursion_limit": 1000})
+        print(kind, f"{time.perf_counter() - start:.3f}s")
@@ -0,0 +1,51 @@
+from functools import lru_cache
+
+from langgraph.store.base import PutOp
+from langgraph.store.memory import InMemoryStore
+
+N_NAMESPACES = 100
+
+
+def store_put(n_items: int) -> InMemoryStore:
+    """Put `n_items` items, spread over `N_NAMESPACES` namespaces, in a new
+    store, in a single batch."""
+    store = InMemoryStore()
+    store.batch(
+        PutOp(
+            ("users", str(i % N_NAMESPACES), "memories"),
+            str(i),
+            {"text": f"memory {i}", "kind": i % 10, "score": i},
+        )
+        for i in range(n_items)
+    )
+    return store
+
+
+@lru_cache(maxsize=None)
+def populated_store(n_items: int) -> InMemoryStore:
+    """The store filled by `store_put`, built once per process, as filling the
+    larger ones takes longer than the searches measured on them."""
+    return store_put(n_items)
+
+
+def store_search(n_items: int, n_searches: int = 10) -> None:
+    """Search a store of `n_items` items `n_searches` times, each with a
+    namespace prefix and a filter on the item values."""
+    store = populated_store(n_items)
+    for i in range(n_searches):
+        store.search(
+            ("users", str(i % N_NAMESPACES)), filter={"kind": i % 10}, limit=10
+        )
+
+
+if __name__ == "__main__":
+    import time
+
+    for n_items in (10_000, 100_000, 1_000_000):
+        start = time.perf_counter()
+        store_put(n_items)
+        print(f"put {n_items}", f"{time.perf_counter() - start:.3f}s")
+        populated_store(n_items)
+        start = time.perf_counter()
+        store_search(n_items)
+        print(f"search {n_items}", f"{time.perf_counter() - start:.3f}s")
@@ -0,0 +1,58 @@
+import operator
+from typing import Annotated, Literal, TypedDict
+
+from langgraph.constants import START
+from langgraph.graph.state import StateGraph
+from langgraph.types import Command
+
+
+def wide_dict(n_keys: int, n_steps: int) -> StateGraph:
+    """A graph with a state of `n_keys` keys (half plain values, half reducers),
+    run for `n_steps` steps by a node that reads and writes only a couple of
+    keys. This makes the cost of per-step work done over every channel visible."""
+
+    State = TypedDict(  # type: ignore[misc]
+        "State",
+        {
+            "step": int,
+            **{
+                f"key_{i}": Annotated[list, operator.add] if i % 2 else int
+                for i in range(n_keys)
+            },
+        },
+    )
+
+    class StepState(TypedDict):
+        step: int
+
+    def write(state: StepState) -> Command[Literal["write"]]:
+        step = state["step"] + 1
+        idx = step % n_keys
+        return Command(
+            update={"step": step, f"key_{idx}": [step] if idx % 2 else step},
+            goto="write" if step < n_steps else (),
+        )
+
+    builder = StateGraph(State)
+    builder.add_node("write", write, input=StepState)
+    builder.add_edge(START, "write")
+
+    return builder
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    import uvloop
+
+    from langgraph.checkpoint.memory import MemorySaver
+
+    graph = wide_dict(2000, 500).compile(checkpointer=MemorySaver())
+    input = {"step": 0}
+    config = {"configurable": {"thread_id": "1"}, "recursion_limit": 20000000000}
+
+    async def run():
+        len([c async for c in graph.astream(input, config=config)])
+
+    uvloop.install()
+    asyncio.run(run())
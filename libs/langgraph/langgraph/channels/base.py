@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Optional, Sequence, TypeVar
+from typing import Any, ClassVar, Generic, Optional, Sequence, TypeVar
 
 from typing_extensions import Self
 
@@ -13,6 +13,12 @@ C = TypeVar("C")
 class BaseChannel(Generic[Value, Update, C], ABC):
     __slots__ = ("key", "typ")
 
+    needs_step_notification: ClassVar[bool] = True
+    """Whether `update` should be called with an empty sequence at the end of
+    each step in which the channel received no writes. Channels whose value
+    doesn't change on an empty update can set this to False, so that Pregel
+    skips them."""
+
     def __init__(self, typ: Any, key: str = "") -> None:
         self.typ = typ
         self.key = key
@@ -47,7 +53,8 @@ class BaseChannel(Generic[Value, Update, C], ABC):
         """Update the channel's value with the given sequence of updates.
         The order of the updates in the sequence is arbitrary.
         This method is called by Pregel for all channels at the end of each step.
-        If there are no updates, it is called with an empty sequence.
+        If there are no updates, it is called with an empty sequence, unless
+        `needs_step_notification` is False.
         Raises InvalidUpdateError if the sequence of updates is invalid.
         Returns True if the channel was updated, False otherwise."""
 
@@ -1,5 +1,8 @@
 import collections.abc
+import operator
+from functools import reduce
 from typing import (
+    Any,
     Callable,
     Generic,
     Optional,
@@ -24,6 +27,44 @@ def _strip_extras(t):  # type: ignore[no-untyped-def]
     return t
 
 
+def _bulk_add(current: Any, values: Sequence[Any]) -> Any:
+    if type(current) is list and all(type(v) is list for v in values):
+        # extend a single copy, instead of copying the list for each value
+        result = current.copy()
+        for value in values:
+            result.extend(value)
+        return result
+    return reduce(operator.add, values, current)
+
+
+def _bulk_or(current: Any, values: Sequence[Any]) -> Any:
+    if type(current) in (dict, set) and all(type(v) is type(current) for v in values):
+        # update a single copy, instead of copying the dict or set for each value
+        result = current.copy()
+        for value in values:
+            result.update(value)
+        return result
+    return reduce(operator.or_, values, current)
+
+
+_BULK_OPERATORS: dict[Callable, Callable[[Any, Sequence[Any]], Any]] = {
+    operator.add: _bulk_add,
+    operator.or_: _bulk_or,
+}
+
+
+def _get_bulk(
+    reducer: Callable[[Value, Value], Value],
+) -> Optional[Callable[[Value, Sequence[Value]], Value]]:
+    try:
+        if bulk := _BULK_OPERATORS.get(reducer):
+            return bulk
+    except TypeError:
+        # unhashable reducer
+        pass
+    return getattr(reducer, "__bulk__", None)
+
+
 class BinaryOperatorAggregate(Generic[Value], BaseChannel[Value, Value, Value]):
     """Stores the result of applying a binary operator to the current value and each new value.
 
@@ -32,13 +73,21 @@ class BinaryOperatorAggregate(Generic[Value], BaseChannel[Value, Value, Value]):
 
     total = Channels.BinaryOperatorAggregate(int, operator.add)
     ```
+
+    An operator can declare a bulk version of itself as a `__bulk__` attribute,
+    taking the current value and the list of new values of a step, to fold all
+    the values of a step at once instead of one at a time. `operator.add` on
+    lists, `operator.or_` on dicts and sets, and `add_messages` have one.
     """
 
-    __slots__ = ("value", "operator")
+    __slots__ = ("value", "operator", "bulk")
+
+    needs_step_notification = False
 
     def __init__(self, typ: Type[Value], operator: Callable[[Value, Value], Value]):
         super().__init__(typ)
         self.operator = operator
+        self.bulk = _get_bulk(operator)
         # special forms from typing or collections.abc are not instantiable
         # so we need to replace them with their concrete counterparts
         typ = _strip_extras(typ)
@@ -84,8 +133,12 @@ class BinaryOperatorAggregate(Generic[Value], BaseChannel[Value, Value, Value]):
         if not hasattr(self, "value"):
             self.value = values[0]
             values = values[1:]
-        for value in values:
-            self.value = self.operator(self.value, value)
+        if self.bulk is not None:
+            if values:
+                self.value = self.bulk(self.value, values)
+        else:
+            for value in values:
+                self.value = self.operator(self.value, value)
         return True
 
     def get(self) -> Value:
@@ -16,6 +16,8 @@ class LastValue(Generic[Value], BaseChannel[Value, Value, Value]):
 
     __slots__ = ("value",)
 
+    needs_step_notification = False
+
     def __eq__(self, value: object) -> bool:
         return isinstance(value, LastValue)
 
@@ -0,0 +1,119 @@
+import uuid
+from typing import Any, Optional, Sequence, Type, cast
+
+from langchain_core.messages import (
+    AnyMessage,
+    BaseMessage,
+    BaseMessageChunk,
+    RemoveMessage,
+    convert_to_messages,
+    message_chunk_to_message,
+)
+from typing_extensions import Self
+
+from langgraph.channels.base import BaseChannel
+
+
+def _coerce_messages(messages: Any) -> list[BaseMessage]:
+    """Convert a message, or list of message-likes, to a list of messages,
+    assigning ids to those without one."""
+    if not isinstance(messages, list):
+        messages = [messages]
+    coerced = [
+        message_chunk_to_message(cast(BaseMessageChunk, m))
+        for m in convert_to_messages(messages)
+    ]
+    for m in coerced:
+        if m.id is None:
+            m.id = str(uuid.uuid4())
+    return coerced
+
+
+def _merge_messages(
+    messages: list[BaseMessage], index: dict[str, int], value: Any
+) -> dict[str, int]:
+    """Merge one update into a list of messages in place, as `add_messages` does,
+    given the position of each message by id. Returns the updated index."""
+    # ids are matched against messages added by previous updates only
+    size = len(messages)
+    removed: set[str] = set()
+    for m in _coerce_messages(value):
+        idx = index.get(cast(str, m.id))
+        if idx is not None and idx < size:
+            if isinstance(m, RemoveMessage):
+                removed.add(cast(str, m.id))
+            else:
+                messages[idx] = m
+        elif isinstance(m, RemoveMessage):
+            raise ValueError(
+                f"Attempting to delete a message with an ID that doesn't exist ('{m.id}')"
+            )
+        else:
+            index[cast(str, m.id)] = len(messages)
+            messages.append(m)
+    if removed:
+        messages[:] = [m for m in messages if m.id not in removed]
+        index = {m.id: i for i, m in enumerate(messages)}  # type: ignore[misc]
+    return index
+
+
+class MessagesChannel(BaseChannel[list[AnyMessage], Any, list[AnyMessage]]):
+    """Stores a list of messages, merging updates as `add_messages` does.
+
+    Keeps an index of the position of each message by id, so that each update
+    only costs the number of messages it contains, instead of the length of the
+    list. The list is only copied before an update if it was returned by `get()`
+    or `checkpoint()` since the last one, so that values read before an update
+    don't change."""
+
+    __slots__ = ("value", "index", "shared")
+
+    needs_step_notification = False
+
+    def __init__(self, typ: Type[Any]) -> None:
+        super().__init__(typ)
+        self.value: list[BaseMessage] = []
+        self.index: dict[str, int] = {}
+        self.shared = False
+
+    def __eq__(self, value: object) -> bool:
+        return isinstance(value, MessagesChannel)
+
+    @property
+    def ValueType(self) -> Type[Any]:
+        """The type of the value stored in the channel."""
+        return self.typ
+
+    @property
+    def UpdateType(self) -> Type[Any]:
+        """The type of the update received by the channel."""
+        return self.typ
+
+    def checkpoint(self) -> list[BaseMessage]:
+        self.shared = True
+        return self.value
+
+    def from_checkpoint(self, checkpoint: Optional[list[AnyMessage]]) -> Self:
+        empty = self.__class__(self.typ)
+        empty.key = self.key
+        if checkpoint:
+            if all(isinstance(m, BaseMessage) and m.id for m in checkpoint):
+                empty.value = list(checkpoint)
+            else:
+                empty.value = _coerce_messages(list(checkpoint))
+            empty.index = {m.id: i for i, m in enumerate(empty.value)}  # type: ignore[misc]
+        return empty
+
+    def update(self, values: Sequence[Any]) -> bool:
+        if not values:
+            return False
+        if self.shared:
+            self.value = self.value.copy()
+            self.shared = False
+        for value in values:
+            self.index = _merge_messages(self.value, self.index, value)
+        return True
+
+    def get(self) -> list[BaseMessage]:
+        self.shared = True
+        return self.value
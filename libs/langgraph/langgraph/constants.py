@@ -81,6 +81,10 @@ CONFIG_KEY_WRITES = sys.intern("__pregel_writes")
 # read-only list of existing task writes
 CONFIG_KEY_SCRATCHPAD = sys.intern("__pregel_scratchpad")
 # holds a mutable dict for temporary storage scoped to the current task
+CONFIG_KEY_DURABILITY = sys.intern("__pregel_durability")
+# holds the durability mode of the parent graph, inherited by subgraphs
+CONFIG_KEY_CANCEL_TOKEN = sys.intern("__pregel_cancel_token")
+# holds the `CancellationToken` of the current attempt of a task with a timeout
 
 # --- Other constants ---
 PUSH = sys.intern("__pregel_push")
@@ -124,6 +128,8 @@ RESERVED = {
     CONFIG_KEY_CHECKPOINT_MAP,
     CONFIG_KEY_CHECKPOINT_ID,
     CONFIG_KEY_CHECKPOINT_NS,
+    CONFIG_KEY_DURABILITY,
+    CONFIG_KEY_CANCEL_TOKEN,
     # other constants
     PUSH,
     PULL,
@@ -91,6 +91,12 @@ class ParentCommand(GraphBubbleUp):
         super().__init__(command)
 
 
+class NodeTimeoutError(TimeoutError):
+    """Raised when an attempt of a node runs longer than the node's timeout."""
+
+    pass
+
+
 class EmptyInputError(Exception):
     """Raised when graph receives an empty input."""
 
@@ -1,4 +1,3 @@
-import uuid
 import warnings
 from functools import partial
 from typing import (
@@ -16,13 +15,11 @@ from typing import (
 from langchain_core.messages import (
     AnyMessage,
     BaseMessage,
-    BaseMessageChunk,
     MessageLikeRepresentation,
-    RemoveMessage,
     convert_to_messages,
-    message_chunk_to_message,
 )
 
+from langgraph.channels.messages import _coerce_messages, _merge_messages
 from langgraph.graph.state import StateGraph
 
 Messages = Union[list[MessageLikeRepresentation], MessageLikeRepresentation]
@@ -41,12 +38,42 @@ def _add_messages_wrapper(func: Callable) -> Callable[[Messages, Messages], Mess
             )
             raise ValueError(msg)
         else:
-            return partial(func, **kwargs)
+            reducer = partial(func, **kwargs)
+            reducer.__bulk__ = partial(_add_messages_bulk, **kwargs)  # type: ignore[attr-defined]
+            return reducer
 
     _add_messages.__doc__ = func.__doc__
+    # merges all the updates of a step at once, see BinaryOperatorAggregate
+    _add_messages.__bulk__ = _add_messages_bulk  # type: ignore[attr-defined]
     return cast(Callable[[Messages, Messages], Messages], _add_messages)
 
 
+def _add_messages_bulk(
+    left: Messages,
+    rights: Sequence[Messages],
+    *,
+    format: Optional[Literal["langchain-openai"]] = None,
+) -> Messages:
+    """Merges several lists of messages into `left`, one after the other, as
+    successive calls to `add_messages` would."""
+    # coerce to list of messages, with ids
+    merged = _coerce_messages(left)
+    # merge
+    index = {m.id: i for i, m in enumerate(merged)}
+    for right in rights:
+        index = _merge_messages(merged, index, right)  # type: ignore[arg-type]
+
+    if format == "langchain-openai":
+        merged = _format_messages(merged)
+    elif format:
+        msg = f"Unrecognized {format=}. Expected one of 'langchain-openai', None."
+        raise ValueError(msg)
+    else:
+        pass
+
+    return merged
+
+
 @_add_messages_wrapper
 def add_messages(
     left: Messages,
@@ -158,55 +185,7 @@ def add_messages(
 
         Support for 'format="langchain-openai"' flag added.
     """
-    # coerce to list
-    if not isinstance(left, list):
-        left = [left]  # type: ignore[assignment]
-    if not isinstance(right, list):
-        right = [right]  # type: ignore[assignment]
-    # coerce to message
-    left = [
-        message_chunk_to_message(cast(BaseMessageChunk, m))
-        for m in convert_to_messages(left)
-    ]
-    right = [
-        message_chunk_to_message(cast(BaseMessageChunk, m))
-        for m in convert_to_messages(right)
-    ]
-    # assign missing ids
-    for m in left:
-        if m.id is None:
-            m.id = str(uuid.uuid4())
-    for m in right:
-        if m.id is None:
-            m.id = str(uuid.uuid4())
-    # merge
-    left_idx_by_id = {m.id: i for i, m in enumerate(left)}
-    merged = left.copy()
-    ids_to_remove = set()
-    for m in right:
-        if (existing_idx := left_idx_by_id.get(m.id)) is not None:
-            if isinstance(m, RemoveMessage):
-                ids_to_remove.add(m.id)
-            else:
-                merged[existing_idx] = m
-        else:
-            if isinstance(m, RemoveMessage):
-                raise ValueError(
-                    f"Attempting to delete a message with an ID that doesn't exist ('{m.id}')"
-                )
-
-            merged.append(m)
-    merged = [m for m in merged if m.id not in ids_to_remove]
-
-    if format == "langchain-openai":
-        merged = _format_messages(merged)
-    elif format:
-        msg = f"Unrecognized {format=}. Expected one of 'langchain-openai', None."
-        raise ValueError(msg)
-    else:
-        pass
-
-    return merged
+    return _add_messages_bulk(left, [right], format=format)
 
 
 class MessageGraph(StateGraph):
@@ -1,5 +1,6 @@
 import inspect
 import logging
+import pickle
 import typing
 import warnings
 from functools import partial
@@ -28,11 +29,13 @@ from pydantic.v1 import BaseModel as BaseModelV1
 from typing_extensions import Self
 
 from langgraph._api.deprecation import LangGraphDeprecationWarning
+from langgraph.cache.base import BaseCache
 from langgraph.channels.base import BaseChannel
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.dynamic_barrier_value import DynamicBarrierValue, WaitForNames
 from langgraph.channels.ephemeral_value import EphemeralValue
 from langgraph.channels.last_value import LastValue
+from langgraph.channels.messages import MessagesChannel
 from langgraph.channels.named_barrier_value import NamedBarrierValue
 from langgraph.constants import EMPTY_SEQ, NS_END, NS_SEP, SELF, TAG_HIDDEN
 from langgraph.errors import (
@@ -50,6 +53,8 @@ from langgraph.managed.base import (
     is_managed_value,
     is_writable_managed_value,
 )
+from langgraph.pregel.executor import arun_in_process, run_in_process
+from langgraph.pregel.metrics import MetricsOutput
 from langgraph.pregel.read import ChannelRead, PregelNode
 from langgraph.pregel.write import (
     ChannelWrite,
@@ -57,10 +62,23 @@ from langgraph.pregel.write import (
     ChannelWriteTupleEntry,
 )
 from langgraph.store.base import BaseStore
-from langgraph.types import All, Checkpointer, Command, RetryPolicy
+from langgraph.types import (
+    All,
+    BatchPolicy,
+    CachePolicy,
+    Checkpointer,
+    Command,
+    Durability,
+    RetryPolicy,
+    StreamBufferPolicy,
+    StreamCoalescePolicy,
+)
 from langgraph.utils.fields import get_field_default
-from langgraph.utils.pydantic import create_model
-from langgraph.utils.runnable import RunnableCallable, coerce_to_runnable
+from langgraph.utils.runnable import (
+    KWARGS_CONFIG_KEYS,
+    RunnableCallable,
+    coerce_to_runnable,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -86,12 +104,46 @@ def _get_node_name(node: RunnableLike) -> str:
         raise TypeError(f"Unsupported node type: {type(node)}")
 
 
+def _process_node(name: str, action: RunnableLike) -> RunnableCallable:
+    """Wrap a node function to run in the shared process pool."""
+    if (
+        isinstance(action, Runnable)
+        or not isfunction(action)
+        or inspect.iscoroutinefunction(action)
+    ):
+        raise ValueError(
+            f"Node `{name}` must be a sync function to run with executor='process'."
+        )
+    params = signature(action).parameters
+    for kw, _, _, _ in KWARGS_CONFIG_KEYS:
+        if kw in params:
+            raise ValueError(
+                f"Node `{name}` can't accept '{kw}' when run with executor='process'."
+            )
+    try:
+        pickle.dumps(action)
+    except Exception as exc:
+        raise ValueError(
+            f"Node `{name}` must be picklable to run with executor='process', "
+            "eg. a function defined at the top level of a module."
+        ) from exc
+    return RunnableCallable(
+        partial(run_in_process, action),
+        partial(arun_in_process, action),
+        name=name,
+        trace=False,
+    )
+
+
 class StateNodeSpec(NamedTuple):
     runnable: Runnable
     metadata: Optional[dict[str, Any]]
     input: Type[Any]
     retry_policy: Optional[RetryPolicy]
     ends: Optional[tuple[str, ...]] = EMPTY_SEQ
+    cache_policy: Optional[CachePolicy] = None
+    batch_policy: Optional[BatchPolicy] = None
+    timeout: Optional[float] = None
 
 
 class StateGraph(Graph):
@@ -232,6 +284,10 @@ class StateGraph(Graph):
         metadata: Optional[dict[str, Any]] = None,
         input: Optional[Type[Any]] = None,
         retry: Optional[RetryPolicy] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        batch: Optional[BatchPolicy] = None,
+        timeout: Optional[float] = None,
+        executor: Literal["thread", "process"] = "thread",
     ) -> Self:
         """Adds a new node to the state graph.
         Will take the name of the function/runnable as the node name.
@@ -256,6 +312,10 @@ class StateGraph(Graph):
         metadata: Optional[dict[str, Any]] = None,
         input: Optional[Type[Any]] = None,
         retry: Optional[RetryPolicy] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        batch: Optional[BatchPolicy] = None,
+        timeout: Optional[float] = None,
+        executor: Literal["thread", "process"] = "thread",
     ) -> Self:
         """Adds a new node to the state graph.
 
@@ -279,6 +339,10 @@ class StateGraph(Graph):
         metadata: Optional[dict[str, Any]] = None,
         input: Optional[Type[Any]] = None,
         retry: Optional[RetryPolicy] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        batch: Optional[BatchPolicy] = None,
+        timeout: Optional[float] = None,
+        executor: Literal["thread", "process"] = "thread",
     ) -> Self:
         """Adds a new node to the state graph.
 
@@ -290,6 +354,22 @@ class StateGraph(Graph):
             metadata (Optional[dict[str, Any]]): The metadata associated with the node. (default: None)
             input (Optional[Type[Any]]): The input schema for the node. (default: the graph's input schema)
             retry (Optional[RetryPolicy]): The policy for retrying the node. (default: None)
+            cache_policy (Optional[CachePolicy]): The policy for caching the node's writes,
+                used when the graph is compiled with a `cache`. (default: None)
+            batch (Optional[BatchPolicy]): Run the node's tasks of each step in batches,
+                eg. those created with `Send`. The node receives the list of the inputs
+                of a batch and must return the list of their outputs, each written
+                to the state as usual. (default: None)
+            timeout (Optional[float]): Maximum number of seconds each attempt of the node may
+                run, after which it fails with a `NodeTimeoutError`, retried as per `retry`.
+                Async nodes are cancelled, sync nodes are signalled through their
+                `cancel_token` keyword argument, if any, which is None for nodes
+                without a timeout. Only the writes and stream output of the attempt
+                that succeeded are sent, and the node can't call tasks. (default: None)
+            executor (Literal["thread", "process"]): Where to run the node. "process" runs
+                a (picklable, top-level) sync function in a shared process pool, for CPU-bound
+                work. Its input and config are pickled to the worker, and its return value
+                is pickled back and written to the state as usual. (default: "thread")
         Raises:
             ValueError: If the key is already being used as a state key.
 
@@ -386,6 +466,16 @@ class StateGraph(Graph):
                     ends = vals
         except (TypeError, StopIteration):
             pass
+        if batch is not None and batch.max_size < 1:
+            raise ValueError("Batch max_size must be at least 1.")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("Timeout must be positive.")
+        if executor == "process":
+            action = _process_node(cast(str, node), action)
+        elif executor != "thread":
+            raise ValueError(
+                f"Invalid executor '{executor}', expected 'thread' or 'process'."
+            )
         if input is not None:
             self._add_schema(input)
         self.nodes[cast(str, node)] = StateNodeSpec(
@@ -394,6 +484,9 @@ class StateGraph(Graph):
             input=input or self.schema,
             retry_policy=retry,
             ends=ends,
+            cache_policy=cache_policy,
+            batch_policy=batch,
+            timeout=timeout,
         )
         return self
 
@@ -480,9 +573,15 @@ class StateGraph(Graph):
         checkpointer: Checkpointer = None,
         *,
         store: Optional[BaseStore] = None,
+        cache: Optional[BaseCache] = None,
         interrupt_before: Optional[Union[All, list[str]]] = None,
         interrupt_after: Optional[Union[All, list[str]]] = None,
         debug: bool = False,
+        durability: Optional[Durability] = None,
+        stream_buffer: Optional[StreamBufferPolicy] = None,
+        stream_coalesce: Optional[StreamCoalescePolicy] = None,
+        eager: bool = False,
+        metrics_hook: Optional[Callable[[MetricsOutput], None]] = None,
     ) -> "CompiledStateGraph":
         """Compiles the state graph into a `CompiledGraph` object.
 
@@ -495,9 +594,27 @@ class StateGraph(Graph):
                 allowing it to be paused, resumed, and replayed from any point.
                 If None, it may inherit the parent graph's checkpointer when used as a subgraph.
                 If False, it will not use or inherit any checkpointer.
+            cache (Optional[BaseCache]): A cache for the results of nodes added with a `cache_policy`.
             interrupt_before (Optional[Sequence[str]]): An optional list of node names to interrupt before.
             interrupt_after (Optional[Sequence[str]]): An optional list of node names to interrupt after.
             debug (bool): A flag indicating whether to enable debug mode.
+            durability (Optional[Durability]): When to save checkpoints, one of "sync",
+                "async" or "exit". If None, inherits the durability of the parent graph
+                when used as a subgraph, and defaults to "async" otherwise.
+            stream_buffer (Optional[StreamBufferPolicy]): Bound on the number of chunks
+                buffered while streaming, and whether to block producers, drop the
+                oldest chunks or coalesce message chunks once it's reached.
+                If None, the buffer is unbounded.
+            stream_coalesce (Optional[StreamCoalescePolicy]): Merge the chunks of each
+                chat model run for stream_mode="messages", by time or count.
+                If None, one chunk is emitted per token.
+            eager (bool): Start the nodes of the next step as soon as the tasks
+                triggering them finish, instead of waiting for the whole step.
+                Results don't change, as nodes that read a channel written by a
+                task that finishes later are run again.
+            metrics_hook (Optional[Callable[[MetricsOutput], None]]): Called with
+                the metrics of every run, as emitted for stream_mode="metrics",
+                without having to stream them.
 
         Returns:
             CompiledStateGraph: The compiled state graph.
@@ -553,6 +670,12 @@ class StateGraph(Graph):
             auto_validate=False,
             debug=debug,
             store=store,
+            cache=cache,
+            durability=durability,
+            stream_buffer=stream_buffer,
+            stream_coalesce=stream_coalesce,
+            eager=eager,
+            metrics_hook=metrics_hook,
         )
 
         compiled.attach_node(START, None)
@@ -719,6 +842,9 @@ class CompiledStateGraph(CompiledGraph):
                 ],
                 metadata=node.metadata,
                 retry_policy=node.retry_policy,
+                cache_policy=node.cache_policy,
+                batch_policy=node.batch_policy,
+                timeout=node.timeout,
                 bound=node.runnable,
             )
         else:
@@ -936,6 +1062,9 @@ def _get_channel(
     elif channel := _is_field_channel(annotation):
         channel.key = name
         return channel
+    elif channel := _is_field_messages(annotation):
+        channel.key = name
+        return channel
     elif channel := _is_field_binop(annotation):
         channel.key = name
         return channel
@@ -955,6 +1084,17 @@ def _is_field_channel(typ: Type[Any]) -> Optional[BaseChannel]:
     return None
 
 
+def _is_field_messages(typ: Type[Any]) -> Optional[MessagesChannel]:
+    # imported here to avoid circular import
+    from langgraph.graph.message import add_messages
+
+    if hasattr(typ, "__metadata__"):
+        meta = typ.__metadata__
+        if len(meta) >= 1 and meta[-1] is add_messages:
+            return MessagesChannel(typ)
+    return None
+
+
 def _is_field_binop(typ: Type[Any]) -> Optional[BinaryOperatorAggregate]:
     if hasattr(typ, "__metadata__"):
         meta = typ.__metadata__
@@ -1002,6 +1142,8 @@ def _get_schema(
     if isclass(typ) and issubclass(typ, (BaseModel, BaseModelV1)):
         return typ
     else:
+        from langgraph.utils.pydantic import create_model
+
         keys = list(schemas[typ].keys())
         if len(keys) == 1 and keys[0] == "__root__":
             return create_model(
@@ -4,7 +4,7 @@ import asyncio
 import concurrent
 import concurrent.futures
 import queue
-from collections import deque
+from collections import defaultdict, deque
 from functools import partial
 from typing import (
     Any,
@@ -41,6 +41,7 @@ from langchain_core.tracers._streaming import _StreamingCallbackHandler
 from pydantic import BaseModel
 from typing_extensions import Self
 
+from langgraph.cache.base import BaseCache
 from langgraph.channels.base import (
     BaseChannel,
 )
@@ -56,6 +57,7 @@ from langgraph.constants import (
     CONFIG_KEY_CHECKPOINT_ID,
     CONFIG_KEY_CHECKPOINT_NS,
     CONFIG_KEY_CHECKPOINTER,
+    CONFIG_KEY_DURABILITY,
     CONFIG_KEY_NODE_FINISHED,
     CONFIG_KEY_READ,
     CONFIG_KEY_RESUMING,
@@ -88,11 +90,10 @@ from langgraph.pregel.algo import (
     local_write,
     prepare_next_tasks,
 )
-from langgraph.pregel.debug import tasks_w_writes
 from langgraph.pregel.io import read_channels
 from langgraph.pregel.loop import AsyncPregelLoop, StreamProtocol, SyncPregelLoop
 from langgraph.pregel.manager import AsyncChannelsManager, ChannelsManager
-from langgraph.pregel.messages import StreamMessagesHandler
+from langgraph.pregel.metrics import MetricsOutput
 from langgraph.pregel.protocol import PregelProtocol
 from langgraph.pregel.read import PregelNode
 from langgraph.pregel.retry import RetryPolicy
@@ -104,9 +105,12 @@ from langgraph.store.base import BaseStore
 from langgraph.types import (
     All,
     Checkpointer,
+    Durability,
     LoopProtocol,
     StateSnapshot,
+    StreamBufferPolicy,
     StreamChunk,
+    StreamCoalescePolicy,
     StreamMode,
 )
 from langgraph.utils.config import (
@@ -117,7 +121,6 @@ from langgraph.utils.config import (
     patch_configurable,
 )
 from langgraph.utils.fields import get_enhanced_type_hints
-from langgraph.utils.pydantic import create_model
 from langgraph.utils.queue import AsyncQueue, SyncQueue  # type: ignore[attr-defined]
 
 WriteValue = Union[Callable[[Input], Output], Any]
@@ -229,12 +232,46 @@ class Pregel(PregelProtocol):
     retry_policy: Optional[RetryPolicy] = None
     """Retry policy to use when running tasks. Set to None to disable."""
 
+    cache: Optional[BaseCache] = None
+    """Cache to use for the results of nodes with a cache policy. Defaults to None."""
+
+    durability: Optional[Durability] = None
+    """When to save checkpoints, one of "sync", "async" or "exit".
+    Defaults to None, ie. the durability of the parent graph, or "async"."""
+
+    stream_buffer: Optional[StreamBufferPolicy] = None
+    """Bound on the number of chunks buffered while streaming, and what to do when
+    it's reached. Defaults to None, ie. unbounded."""
+
+    stream_coalesce: Optional[StreamCoalescePolicy] = None
+    """Merge the message chunks of chat model runs for stream_mode="messages",
+    by time or count. Defaults to None, ie. one chunk per token."""
+
+    eager: bool = False
+    """Whether to start the nodes of the next step triggered by the tasks that
+    finished, while others of the current step are still running. Their results
+    are discarded, and they run again, if a task that finishes later writes to a
+    channel they read. Defaults to False."""
+
+    metrics_hook: Optional[Callable[[MetricsOutput], None]] = None
+    """Called with the step, task and checkpointer metrics of every run of the
+    graph, as emitted for stream_mode="metrics", without streaming them.
+    Defaults to None."""
+
     config_type: Optional[Type[Any]] = None
 
     config: Optional[RunnableConfig] = None
 
     name: str = "LangGraph"
 
+    trigger_to_nodes: Mapping[str, Sequence[str]]
+    """Index of the nodes subscribed to each channel, built on validation.
+    Used to only check the nodes triggered by the channels updated in a step."""
+
+    node_index: Mapping[str, int]
+    """Position of each node in the order nodes were declared, built on validation.
+    Used to check the nodes triggered in a step in that order."""
+
     def __init__(
         self,
         *,
@@ -252,9 +289,17 @@ class Pregel(PregelProtocol):
         checkpointer: Optional[BaseCheckpointSaver] = None,
         store: Optional[BaseStore] = None,
         retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[BaseCache] = None,
+        durability: Optional[Durability] = None,
+        stream_buffer: Optional[StreamBufferPolicy] = None,
+        stream_coalesce: Optional[StreamCoalescePolicy] = None,
+        eager: bool = False,
+        metrics_hook: Optional[Callable[[MetricsOutput], None]] = None,
         config_type: Optional[Type[Any]] = None,
         config: Optional[RunnableConfig] = None,
         name: str = "LangGraph",
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+        node_index: Optional[Mapping[str, int]] = None,
     ) -> None:
         self.nodes = nodes
         self.channels = channels or {}
@@ -269,9 +314,17 @@ class Pregel(PregelProtocol):
         self.checkpointer = checkpointer
         self.store = store
         self.retry_policy = retry_policy
+        self.cache = cache
+        self.durability = durability
+        self.stream_buffer = stream_buffer
+        self.stream_coalesce = stream_coalesce
+        self.eager = eager
+        self.metrics_hook = metrics_hook
         self.config_type = config_type
         self.config = config
         self.name = name
+        self.trigger_to_nodes = trigger_to_nodes or {}
+        self.node_index = node_index or {}
         if auto_validate:
             self.validate()
 
@@ -304,6 +357,12 @@ class Pregel(PregelProtocol):
             self.interrupt_after_nodes,
             self.interrupt_before_nodes,
         )
+        trigger_to_nodes: defaultdict[str, list[str]] = defaultdict(list)
+        for name, node in self.nodes.items():
+            for trigger in node.triggers:
+                trigger_to_nodes[trigger].append(name)
+        self.trigger_to_nodes = dict(trigger_to_nodes)
+        self.node_index = {name: idx for idx, name in enumerate(self.nodes)}
         return self
 
     @property
@@ -357,6 +416,8 @@ class Pregel(PregelProtocol):
         if isinstance(self.input_channels, str):
             return super().get_input_schema(config)
         else:
+            from langgraph.utils.pydantic import create_model
+
             return create_model(
                 self.get_name("Input"),
                 field_definitions={
@@ -389,6 +450,8 @@ class Pregel(PregelProtocol):
         if isinstance(self.output_channels, str):
             return super().get_output_schema(config)
         else:
+            from langgraph.utils.pydantic import create_model
+
             return create_model(
                 self.get_name("Output"),
                 field_definitions={
@@ -549,6 +612,8 @@ class Pregel(PregelProtocol):
                 if tasks := [t for t in next_tasks.values() if t.writes]:
                     apply_writes(saved.checkpoint, channels, tasks, None)
             # assemble the state snapshot
+            from langgraph.pregel.debug import tasks_w_writes
+
             return StateSnapshot(
                 read_channels(channels, self.stream_channels_asis),
                 tuple(t.name for t in next_tasks.values() if not t.writes),
@@ -661,6 +726,8 @@ class Pregel(PregelProtocol):
                 if tasks := [t for t in next_tasks.values() if t.writes]:
                     apply_writes(saved.checkpoint, channels, tasks, None)
             # assemble the state snapshot
+            from langgraph.pregel.debug import tasks_w_writes
+
             return StateSnapshot(
                 read_channels(channels, self.stream_channels_asis),
                 tuple(t.name for t in next_tasks.values() if not t.writes),
@@ -1110,7 +1177,7 @@ class Pregel(PregelProtocol):
             if saved and channel_writes:
                 checkpointer.put_writes(checkpoint_config, channel_writes, task_id)
             # apply to checkpoint and save
-            mv_writes = apply_writes(
+            mv_writes, _ = apply_writes(
                 checkpoint, channels, [task], checkpointer.get_next_version
             )
             assert not mv_writes, "Can't write to SharedValues from update_state"
@@ -1391,7 +1458,7 @@ class Pregel(PregelProtocol):
                     checkpoint_config, channel_writes, task_id
                 )
             # apply to checkpoint and save
-            mv_writes = apply_writes(
+            mv_writes, _ = apply_writes(
                 checkpoint, channels, [task], checkpointer.get_next_version
             )
             assert not mv_writes, "Can't write to SharedValues from update_state"
@@ -1425,6 +1492,7 @@ class Pregel(PregelProtocol):
         interrupt_before: Optional[Union[All, Sequence[str]]],
         interrupt_after: Optional[Union[All, Sequence[str]]],
         debug: Optional[bool],
+        durability: Optional[Durability],
     ) -> tuple[
         bool,
         set[StreamMode],
@@ -1433,6 +1501,7 @@ class Pregel(PregelProtocol):
         Union[All, Sequence[str]],
         Optional[BaseCheckpointSaver],
         Optional[BaseStore],
+        Durability,
     ]:
         if config["recursion_limit"] < 1:
             raise ValueError("recursion_limit must be at least 1")
@@ -1463,6 +1532,12 @@ class Pregel(PregelProtocol):
             store: Optional[BaseStore] = config[CONF][CONFIG_KEY_STORE]
         else:
             store = self.store
+        durability = (
+            durability
+            or self.durability
+            or config.get(CONF, {}).get(CONFIG_KEY_DURABILITY)
+            or "async"
+        )
         return (
             debug,
             set(stream_mode),
@@ -1471,6 +1546,7 @@ class Pregel(PregelProtocol):
             interrupt_after,
             checkpointer,
             store,
+            durability,
         )
 
     def stream(
@@ -1484,6 +1560,7 @@ class Pregel(PregelProtocol):
         interrupt_after: Optional[Union[All, Sequence[str]]] = None,
         debug: Optional[bool] = None,
         subgraphs: bool = False,
+        durability: Optional[Durability] = None,
     ) -> Iterator[Union[dict[str, Any], Any]]:
         """Stream graph steps for a single input.
 
@@ -1501,6 +1578,11 @@ class Pregel(PregelProtocol):
             interrupt_after: Nodes to interrupt after, defaults to all nodes in the graph.
             debug: Whether to print debug information during execution, defaults to False.
             subgraphs: Whether to stream subgraphs, defaults to False.
+            durability: When to save checkpoints, defaults to self.durability.
+                sync: Save the checkpoint of each step before starting the next one.
+                async: Save the checkpoint of each step while the next one runs.
+                exit: Only save the last checkpoint, when the run completes,
+                    is interrupted or fails.
 
         Yields:
             The output of each step in the graph. The output shape depends on the stream_mode.
@@ -1553,7 +1635,11 @@ class Pregel(PregelProtocol):
             ```
         """
 
-        stream = SyncQueue()
+        stream = (
+            SyncQueue(self.stream_buffer.maxsize, self.stream_buffer.on_full)
+            if self.stream_buffer is not None
+            else SyncQueue()
+        )
 
         def output() -> Iterator:
             while True:
@@ -1588,6 +1674,7 @@ class Pregel(PregelProtocol):
                 interrupt_after_,
                 checkpointer,
                 store,
+                durability_,
             ) = self._defaults(
                 config,
                 stream_mode=stream_mode,
@@ -1595,11 +1682,14 @@ class Pregel(PregelProtocol):
                 interrupt_before=interrupt_before,
                 interrupt_after=interrupt_after,
                 debug=debug,
+                durability=durability,
             )
             # set up messages stream mode
             if "messages" in stream_modes:
+                from langgraph.pregel.messages import StreamMessagesHandler
+
                 run_manager.inheritable_handlers.append(
-                    StreamMessagesHandler(stream.put)
+                    StreamMessagesHandler(stream.put, self.stream_coalesce)
                 )
             # set up custom stream mode
             if "custom" in stream_modes:
@@ -1608,7 +1698,9 @@ class Pregel(PregelProtocol):
                 )
             with SyncPregelLoop(
                 input,
-                stream=StreamProtocol(stream.put, stream_modes),
+                # output of the loop itself is never blocked, as it may be
+                # produced while the consumer waits for tasks to finish
+                stream=StreamProtocol(partial(stream.put, block=False), stream_modes),
                 config=config,
                 store=store,
                 checkpointer=checkpointer,
@@ -1620,6 +1712,12 @@ class Pregel(PregelProtocol):
                 interrupt_after=interrupt_after_,
                 manager=run_manager,
                 debug=debug,
+                trigger_to_nodes=self.trigger_to_nodes,
+                node_index=self.node_index,
+                cache=self.cache,
+                durability=durability_,
+                stream_depth=stream.qsize,
+                metrics_hook=self.metrics_hook,
             ) as loop:
                 # create runner
                 runner = PregelRunner(
@@ -1627,7 +1725,14 @@ class Pregel(PregelProtocol):
                     put_writes=loop.put_writes,
                     schedule_task=loop.accept_push,
                     node_finished=config[CONF].get(CONFIG_KEY_NODE_FINISHED),
+                    task_finished=loop.put_task_metrics if loop.metrics else None,
+                    schedule_eager=loop.accept_eager if self.eager else None,
+                    keep_eager=loop.keep_eager if self.eager else None,
                 )
+                # subgraphs inherit the durability mode
+                loop.config[CONF][CONFIG_KEY_DURABILITY] = durability_
+                # unblock producers waiting for the stream on exit
+                loop.stack.callback(stream.close)
                 # enable subgraph streaming
                 if subgraphs:
                     loop.config[CONF][CONFIG_KEY_STREAM] = loop.stream
@@ -1657,6 +1762,8 @@ class Pregel(PregelProtocol):
                 # channels are guaranteed to be immutable for the duration of the step,
                 # with channel updates applied only at the transition between steps
                 while loop.tick(input_keys=self.input_channels):
+                    loop.wait_checkpoint()
+                    loop.match_cached_writes()
                     for _ in runner.tick(
                         loop.tasks.values(),
                         timeout=self.step_timeout,
@@ -1695,6 +1802,7 @@ class Pregel(PregelProtocol):
         interrupt_after: Optional[Union[All, Sequence[str]]] = None,
         debug: Optional[bool] = None,
         subgraphs: bool = False,
+        durability: Optional[Durability] = None,
     ) -> AsyncIterator[Union[dict[str, Any], Any]]:
         """Stream graph steps for a single input.
 
@@ -1712,6 +1820,11 @@ class Pregel(PregelProtocol):
             interrupt_after: Nodes to interrupt after, defaults to all nodes in the graph.
             debug: Whether to print debug information during execution, defaults to False.
             subgraphs: Whether to stream subgraphs, defaults to False.
+            durability: When to save checkpoints, defaults to self.durability.
+                sync: Save the checkpoint of each step before starting the next one.
+                async: Save the checkpoint of each step while the next one runs.
+                exit: Only save the last checkpoint, when the run completes,
+                    is interrupted or fails.
 
         Yields:
             The output of each step in the graph. The output shape depends on the stream_mode.
@@ -1764,11 +1877,15 @@ class Pregel(PregelProtocol):
             ```
         """
 
-        stream = AsyncQueue()
+        stream = (
+            AsyncQueue(self.stream_buffer.maxsize, self.stream_buffer.on_full)
+            if self.stream_buffer is not None
+            else AsyncQueue()
+        )
         aioloop = asyncio.get_running_loop()
         stream_put = cast(
             Callable[[StreamChunk], None],
-            partial(aioloop.call_soon_threadsafe, stream.put_nowait),
+            partial(stream.put_threadsafe, aioloop),
         )
 
         def output() -> Iterator:
@@ -1813,6 +1930,7 @@ class Pregel(PregelProtocol):
                 interrupt_after_,
                 checkpointer,
                 store,
+                durability_,
             ) = self._defaults(
                 config,
                 stream_mode=stream_mode,
@@ -1820,18 +1938,19 @@ class Pregel(PregelProtocol):
                 interrupt_before=interrupt_before,
                 interrupt_after=interrupt_after,
                 debug=debug,
+                durability=durability,
             )
             # set up messages stream mode
             if "messages" in stream_modes:
+                from langgraph.pregel.messages import StreamMessagesHandler
+
                 run_manager.inheritable_handlers.append(
-                    StreamMessagesHandler(stream_put)
+                    StreamMessagesHandler(stream_put, self.stream_coalesce)
                 )
             # set up custom stream mode
             if "custom" in stream_modes:
-                config[CONF][CONFIG_KEY_STREAM_WRITER] = (
-                    lambda c: aioloop.call_soon_threadsafe(
-                        stream.put_nowait, ((), "custom", c)
-                    )
+                config[CONF][CONFIG_KEY_STREAM_WRITER] = lambda c: stream_put(
+                    ((), "custom", c)
                 )
             async with AsyncPregelLoop(
                 input,
@@ -1847,6 +1966,12 @@ class Pregel(PregelProtocol):
                 interrupt_after=interrupt_after_,
                 manager=run_manager,
                 debug=debug,
+                trigger_to_nodes=self.trigger_to_nodes,
+                node_index=self.node_index,
+                cache=self.cache,
+                durability=durability_,
+                stream_depth=stream.qsize,
+                metrics_hook=self.metrics_hook,
             ) as loop:
                 # create runner
                 runner = PregelRunner(
@@ -1855,7 +1980,14 @@ class Pregel(PregelProtocol):
                     schedule_task=loop.accept_push,
                     use_astream=do_stream is not None,
                     node_finished=config[CONF].get(CONFIG_KEY_NODE_FINISHED),
+                    task_finished=loop.put_task_metrics if loop.metrics else None,
+                    schedule_eager=loop.accept_eager if self.eager else None,
+                    keep_eager=loop.keep_eager if self.eager else None,
                 )
+                # subgraphs inherit the durability mode
+                loop.config[CONF][CONFIG_KEY_DURABILITY] = durability_
+                # unblock producers waiting for the stream on exit
+                loop.stack.callback(stream.close)
                 # enable subgraph streaming
                 if subgraphs:
                     loop.config[CONF][CONFIG_KEY_STREAM] = StreamProtocol(
@@ -1875,6 +2007,8 @@ class Pregel(PregelProtocol):
                 # channels are guaranteed to be immutable for the duration of the step,
                 # with channel updates applied only at the transition between steps
                 while loop.tick(input_keys=self.input_channels):
+                    await loop.await_checkpoint()
+                    await loop.amatch_cached_writes()
                     async for _ in runner.atick(
                         loop.tasks.values(),
                         timeout=self.step_timeout,
@@ -1914,6 +2048,7 @@ class Pregel(PregelProtocol):
         interrupt_before: Optional[Union[All, Sequence[str]]] = None,
         interrupt_after: Optional[Union[All, Sequence[str]]] = None,
         debug: Optional[bool] = None,
+        durability: Optional[Durability] = None,
         **kwargs: Any,
     ) -> Union[dict[str, Any], Any]:
         """Run the graph with a single input and config.
@@ -1926,6 +2061,7 @@ class Pregel(PregelProtocol):
             interrupt_before: Optional. The nodes to interrupt the graph run before.
             interrupt_after: Optional. The nodes to interrupt the graph run after.
             debug: Optional. Enable debug mode for the graph run.
+            durability: Optional. When to save checkpoints, one of "sync", "async" or "exit".
             **kwargs: Additional keyword arguments to pass to the graph run.
 
         Returns:
@@ -1945,6 +2081,7 @@ class Pregel(PregelProtocol):
             interrupt_before=interrupt_before,
             interrupt_after=interrupt_after,
             debug=debug,
+            durability=durability,
             **kwargs,
         ):
             if stream_mode == "values":
@@ -1966,6 +2103,7 @@ class Pregel(PregelProtocol):
         interrupt_before: Optional[Union[All, Sequence[str]]] = None,
         interrupt_after: Optional[Union[All, Sequence[str]]] = None,
         debug: Optional[bool] = None,
+        durability: Optional[Durability] = None,
         **kwargs: Any,
     ) -> Union[dict[str, Any], Any]:
         """Asynchronously invoke the graph on a single input.
@@ -1978,6 +2116,7 @@ class Pregel(PregelProtocol):
             interrupt_before: Optional. The nodes to interrupt before. Default is None.
             interrupt_after: Optional. The nodes to interrupt after. Default is None.
             debug: Optional. Whether to enable debug mode. Default is None.
+            durability: Optional. When to save checkpoints, one of "sync", "async" or "exit". Default is None.
             **kwargs: Additional keyword arguments.
 
         Returns:
@@ -1998,6 +2137,7 @@ class Pregel(PregelProtocol):
             interrupt_before=interrupt_before,
             interrupt_after=interrupt_after,
             debug=debug,
+            durability=durability,
             **kwargs,
         ):
             if stream_mode == "values":
@@ -68,12 +68,13 @@ from langgraph.pregel.read import PregelNode
 from langgraph.store.base import BaseStore
 from langgraph.types import (
     All,
+    CacheKey,
     LoopProtocol,
     PregelExecutableTask,
     PregelTask,
     RetryPolicy,
 )
-from langgraph.utils.config import merge_configs, patch_config
+from langgraph.utils.config import patch_task_config
 
 GetNextVersion = Callable[[Optional[V], BaseChannel], V]
 SUPPORTS_EXC_NOTES = sys.version_info >= (3, 11)
@@ -221,10 +222,14 @@ def apply_writes(
     channels: Mapping[str, BaseChannel],
     tasks: Iterable[WritesProtocol],
     get_next_version: Optional[GetNextVersion],
-) -> dict[str, list[Any]]:
+    notify_channels: Optional[Iterable[str]] = None,
+) -> tuple[dict[str, list[Any]], set[str]]:
     """Apply writes from a set of tasks (usually the tasks from a Pregel step)
     to the checkpoint and channels, and return managed values writes to be applied
-    externally."""
+    externally, along with the set of channels whose version was bumped.
+
+    `notify_channels` are the names of the channels that need to be notified of
+    a new step, if known, otherwise every channel is checked."""
     # sort tasks on path, to ensure deterministic order for update application
     # any path parts after the 3rd are ignored for sorting
     # (we use them for eg. task ids which aren't good for sorting)
@@ -233,15 +238,21 @@ def apply_writes(
     # so we don't do anything other than update the channels written to
     bump_step = any(t.triggers for t in tasks)
 
-    # update seen versions
+    # update seen versions, replacing (not mutating) the seen versions of each
+    # node, so that they can be shared with previously saved checkpoints
+    versions_seen = checkpoint["versions_seen"]
     for task in tasks:
-        checkpoint["versions_seen"].setdefault(task.name, {}).update(
-            {
-                chan: checkpoint["channel_versions"][chan]
-                for chan in task.triggers
-                if chan in checkpoint["channel_versions"]
-            }
-        )
+        if seen := {
+            chan: checkpoint["channel_versions"][chan]
+            for chan in task.triggers
+            if chan in checkpoint["channel_versions"]
+        }:
+            if prev := versions_seen.get(task.name):
+                versions_seen[task.name] = {**prev, **seen}
+            else:
+                versions_seen[task.name] = seen
+        else:
+            versions_seen.setdefault(task.name, {})
 
     # Find the highest version of all channels
     if checkpoint["channel_versions"]:
@@ -250,6 +261,7 @@ def apply_writes(
         max_version = None
 
     # Consume all channels that were read
+    updated_channels: set[str] = set()
     for chan in {
         chan
         for task in tasks
@@ -261,6 +273,7 @@ def apply_writes(
                 max_version,
                 channels[chan],
             )
+            updated_channels.add(chan)
 
     # clear pending sends
     if checkpoint["pending_sends"] and bump_step:
@@ -287,7 +300,7 @@ def apply_writes(
         max_version = None
 
     # Apply writes to channels
-    updated_channels: set[str] = set()
+    written_channels: set[str] = set()
     for chan, vals in pending_writes_by_channel.items():
         if chan in channels:
             if channels[chan].update(vals) and get_next_version is not None:
@@ -295,20 +308,29 @@ def apply_writes(
                     max_version,
                     channels[chan],
                 )
-            updated_channels.add(chan)
+                updated_channels.add(chan)
+            written_channels.add(chan)
 
     # Channels that weren't updated in this step are notified of a new step
+    # (skipping channels for which an empty update is a no-op)
     if bump_step:
-        for chan in channels:
-            if chan not in updated_channels:
-                if channels[chan].update([]) and get_next_version is not None:
+        if notify_channels is None:
+            notify_channels = [
+                chan for chan, c in channels.items() if c.needs_step_notification
+            ]
+        for chan in notify_channels:
+            if chan not in written_channels:
+                channel = channels[chan]
+                if channel.update(EMPTY_SEQ) and get_next_version is not None:
                     checkpoint["channel_versions"][chan] = get_next_version(
                         max_version,
-                        channels[chan],
+                        channel,
                     )
+                    updated_channels.add(chan)
 
-    # Return managed values writes to be applied externally
-    return pending_writes_by_managed
+    # Return managed values writes to be applied externally,
+    # and the channels updated in this step
+    return pending_writes_by_managed, updated_channels
 
 
 @overload
@@ -325,6 +347,9 @@ def prepare_next_tasks(
     store: Literal[None] = None,
     checkpointer: Literal[None] = None,
     manager: Literal[None] = None,
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+    node_index: Optional[Mapping[str, int]] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> dict[str, PregelTask]: ...
 
 
@@ -342,6 +367,9 @@ def prepare_next_tasks(
     store: Optional[BaseStore],
     checkpointer: Optional[BaseCheckpointSaver],
     manager: Union[None, ParentRunManager, AsyncParentRunManager],
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+    node_index: Optional[Mapping[str, int]] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> dict[str, PregelExecutableTask]: ...
 
 
@@ -358,10 +386,18 @@ def prepare_next_tasks(
     store: Optional[BaseStore] = None,
     checkpointer: Optional[BaseCheckpointSaver] = None,
     manager: Union[None, ParentRunManager, AsyncParentRunManager] = None,
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+    node_index: Optional[Mapping[str, int]] = None,
+    updated_channels: Optional[set[str]] = None,
 ) -> Union[dict[str, PregelTask], dict[str, PregelExecutableTask]]:
     """Prepare the set of tasks that will make up the next Pregel step.
     This is the union of all PUSH tasks (Sends) and PULL tasks (nodes triggered
-    by edges)."""
+    by edges).
+
+    When both `trigger_to_nodes` and `updated_channels` are provided, only the
+    nodes subscribed to one of the updated channels are considered as PULL task
+    candidates, instead of every node in `processes`, in the order of
+    `node_index`."""
     tasks: list[Union[PregelTask, PregelExecutableTask]] = []
     # Consume pending_sends from previous step (legacy version of Send)
     for idx, _ in enumerate(checkpoint["pending_sends"]):  # TODO: remove branch in 1.0
@@ -381,9 +417,24 @@ def prepare_next_tasks(
             manager=manager,
         ):
             tasks.append(task)
+    # Narrow down the nodes to check, if we know which channels were updated
+    # in the previous step and which nodes are triggered by each channel
+    candidate_nodes: Iterable[str]
+    if updated_channels is not None and trigger_to_nodes:
+        triggered_nodes: set[str] = set()
+        for chan in updated_channels:
+            if node_names := trigger_to_nodes.get(chan):
+                triggered_nodes.update(node_names)
+        # keep the order nodes were declared in, as when checking every node
+        if node_index:
+            candidate_nodes = sorted(triggered_nodes, key=node_index.__getitem__)
+        else:
+            candidate_nodes = [name for name in processes if name in triggered_nodes]
+    else:
+        candidate_nodes = processes
     # Check if any processes should be run in next step
     # If so, prepare the values to be passed to them
-    for name in processes:
+    for name in candidate_nodes:
         if task := prepare_single_task(
             (PULL, name),
             None,
@@ -520,8 +571,10 @@ def prepare_single_task(
                 call.input,
                 proc_,
                 writes,
-                patch_config(
-                    merge_configs(config, {"metadata": metadata}),
+                patch_task_config(
+                    config,
+                    metadata=metadata,
+                    tags=None,
                     run_name=name,
                     callbacks=(
                         manager.get_child(f"graph:step:{step}") if manager else None
@@ -660,12 +713,13 @@ def prepare_single_task(
                 return PregelExecutableTask(
                     packet.node,
                     packet.arg,
-                    node,
+                    # batched tasks run the writers after the node itself
+                    proc.bound if proc.batch_policy else node,
                     writes,
-                    patch_config(
-                        merge_configs(
-                            config, {"metadata": metadata, "tags": proc.tags}
-                        ),
+                    patch_task_config(
+                        config,
+                        metadata=metadata,
+                        tags=proc.tags,
                         run_name=packet.node,
                         callbacks=(
                             manager.get_child(f"graph:step:{step}") if manager else None
@@ -713,10 +767,12 @@ def prepare_single_task(
                     ),
                     triggers,
                     proc.retry_policy,
-                    None,
+                    proc.cache_policy,
                     task_id,
                     task_path[:3],
                     writers=proc.flat_writers,
+                    batch_policy=proc.batch_policy,
+                    timeout=proc.timeout,
                 )
         else:
             return PregelTask(task_id, packet.node, task_path[:3])
@@ -782,12 +838,13 @@ def prepare_single_task(
                     return PregelExecutableTask(
                         name,
                         val,
-                        node,
+                        # batched tasks run the writers after the node itself
+                        proc.bound if proc.batch_policy else node,
                         writes,
-                        patch_config(
-                            merge_configs(
-                                config, {"metadata": metadata, "tags": proc.tags}
-                            ),
+                        patch_task_config(
+                            config,
+                            metadata=metadata,
+                            tags=proc.tags,
                             run_name=name,
                             callbacks=(
                                 manager.get_child(f"graph:step:{step}")
@@ -837,10 +894,12 @@ def prepare_single_task(
                         ),
                         triggers,
                         proc.retry_policy,
-                        None,
+                        proc.cache_policy,
                         task_id,
                         task_path[:3],
                         writers=proc.flat_writers,
+                        batch_policy=proc.batch_policy,
+                        timeout=proc.timeout,
                     )
             else:
                 return PregelTask(task_id, name, task_path[:3])
@@ -892,6 +951,27 @@ def _proc_input(
     yield val
 
 
+def task_cache_key(
+    task: PregelExecutableTask, parent_ns: Sequence[str]
+) -> Optional[CacheKey]:
+    """Get the cache key for a task, if its node has a cache policy.
+    Namespaced by the graph's checkpoint namespace (without task ids) and node name,
+    so that results are shared across threads and steps. Errors raised by the key
+    function, eg. for inputs that can't be pickled, are treated as a cache miss."""
+    if task.cache_policy is None:
+        return None
+    try:
+        key = task.cache_policy.key_func(task.input)
+    except Exception as exc:
+        logger.debug(f"Not caching task {task.name}, failed to compute key: {exc!r}")
+        return None
+    return CacheKey(
+        (*(part.split(NS_END)[0] for part in parent_ns), task.name),
+        key,
+        task.cache_policy.ttl,
+    )
+
+
 def _uuid5_str(namespace: bytes, *parts: str) -> str:
     """Generate a UUID from the SHA-1 hash of a namespace UUID and a name."""
 
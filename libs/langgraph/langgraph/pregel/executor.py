@@ -1,11 +1,14 @@
 import asyncio
 import concurrent.futures
+import inspect
 import sys
+import threading
 import time
 from contextlib import ExitStack
 from contextvars import copy_context
 from types import TracebackType
 from typing import (
+    Any,
     AsyncContextManager,
     Awaitable,
     Callable,
@@ -21,6 +24,7 @@ from langchain_core.runnables import RunnableConfig
 from langchain_core.runnables.config import get_executor_for_config
 from typing_extensions import ParamSpec
 
+from langgraph.constants import CONF
 from langgraph.errors import GraphBubbleUp
 
 P = ParamSpec("P")
@@ -218,3 +222,100 @@ async def anext_tick(coro: Coroutine[None, None, T]) -> T:
     """A coroutine that yields control to event loop before running another coroutine."""
     await asyncio.sleep(0)
     return await coro
+
+
+_process_pool: Optional["concurrent.futures.ProcessPoolExecutor"] = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> "concurrent.futures.ProcessPoolExecutor":
+    """Get the process pool shared by all nodes added with `executor="process"`.
+    Workers are started with the "spawn" method, as forking a process that
+    runs other nodes in threads can deadlock."""
+    # imported here, as multiprocessing is slow to import and rarely needed
+    import multiprocessing
+
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = concurrent.futures.ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _process_pool
+
+
+def _discard_process_pool(pool: "concurrent.futures.ProcessPoolExecutor") -> None:
+    """Drop a broken process pool, so that the next call (eg. a retry) starts a new one."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def process_config(config: RunnableConfig) -> RunnableConfig:
+    """Get the subset of a config that can be sent to a worker process.
+    Internal pregel keys (channels, checkpointer, store, writers, etc.) and
+    callbacks are left out."""
+    return {
+        "tags": list(config.get("tags", ())),
+        "metadata": dict(config.get("metadata", {})),
+        "recursion_limit": config.get("recursion_limit", 25),
+        CONF: {
+            k: v
+            for k, v in config.get(CONF, {}).items()
+            if not k.startswith("__pregel_")
+        },
+    }
+
+
+def _call_in_process(
+    func: Callable[..., Any], input: Any, config: Optional[RunnableConfig]
+) -> Any:
+    """Entrypoint of a node function in a worker process."""
+    if config is None:
+        return func(input)
+    else:
+        return func(input, config=config)
+
+
+def _submit_to_process(
+    func: Callable[..., Any], input: Any, config: RunnableConfig
+) -> tuple["concurrent.futures.ProcessPoolExecutor", concurrent.futures.Future]:
+    pool = get_process_pool()
+    accepts_config = "config" in inspect.signature(func).parameters
+    try:
+        fut = pool.submit(
+            _call_in_process,
+            func,
+            input,
+            process_config(config) if accepts_config else None,
+        )
+    except concurrent.futures.process.BrokenProcessPool:
+        _discard_process_pool(pool)
+        raise
+    return pool, fut
+
+
+def run_in_process(func: Callable[..., Any], input: Any, config: RunnableConfig) -> Any:
+    """Run a node function in the shared process pool, and return its result.
+    The function, input and config are pickled to the worker process, and the
+    result (or exception) pickled back."""
+    pool, fut = _submit_to_process(func, input, config)
+    try:
+        return fut.result()
+    except concurrent.futures.process.BrokenProcessPool:
+        _discard_process_pool(pool)
+        raise
+
+
+async def arun_in_process(
+    func: Callable[..., Any], input: Any, config: RunnableConfig
+) -> Any:
+    """Async version of `run_in_process`."""
+    pool, fut = _submit_to_process(func, input, config)
+    try:
+        return await asyncio.wrap_future(fut)
+    except concurrent.futures.process.BrokenProcessPool:
+        _discard_process_pool(pool)
+        raise
@@ -1,7 +1,10 @@
 import asyncio
 import concurrent.futures
+import threading
+import time
 from collections import defaultdict, deque
 from contextlib import AsyncExitStack, ExitStack
+from itertools import groupby
 from types import TracebackType
 from typing import (
     Any,
@@ -24,6 +27,7 @@ from langchain_core.callbacks import AsyncParentRunManager, ParentRunManager
 from langchain_core.runnables import RunnableConfig
 from typing_extensions import ParamSpec, Self
 
+from langgraph.cache.base import BaseCache, FullKey
 from langgraph.channels.base import BaseChannel
 from langgraph.checkpoint.base import (
     WRITES_IDX_MAP,
@@ -37,6 +41,7 @@ from langgraph.checkpoint.base import (
     create_checkpoint,
     empty_checkpoint,
 )
+from langgraph.checkpoint.base.id import uuid6
 from langgraph.constants import (
     CONF,
     CONFIG_KEY_CHECKPOINT_ID,
@@ -46,6 +51,7 @@ from langgraph.constants import (
     CONFIG_KEY_DELEGATE,
     CONFIG_KEY_ENSURE_LATEST,
     CONFIG_KEY_RESUMING,
+    CONFIG_KEY_SCRATCHPAD,
     CONFIG_KEY_STREAM,
     CONFIG_KEY_TASK_ID,
     EMPTY_SEQ,
@@ -54,6 +60,7 @@ from langgraph.constants import (
     INTERRUPT,
     NS_SEP,
     NULL_TASK_ID,
+    PULL,
     PUSH,
     RESUME,
     SCHEDULED,
@@ -62,6 +69,7 @@ from langgraph.constants import (
 from langgraph.errors import (
     _SEEN_CHECKPOINT_NS,
     CheckpointNotLatest,
+    EmptyChannelError,
     EmptyInputError,
     GraphDelegate,
     GraphInterrupt,
@@ -81,14 +89,7 @@ from langgraph.pregel.algo import (
     prepare_next_tasks,
     prepare_single_task,
     should_interrupt,
-)
-from langgraph.pregel.debug import (
-    map_debug_checkpoint,
-    map_debug_task_results,
-    map_debug_tasks,
-    print_step_checkpoint,
-    print_step_tasks,
-    print_step_writes,
+    task_cache_key,
 )
 from langgraph.pregel.executor import (
     AsyncBackgroundExecutor,
@@ -103,13 +104,23 @@ from langgraph.pregel.io import (
     read_channels,
     single,
 )
+from langgraph.pregel.log import logger
 from langgraph.pregel.manager import AsyncChannelsManager, ChannelsManager
+from langgraph.pregel.metrics import (
+    MetricsOutput,
+    TaskTimer,
+    map_metrics_checkpointer,
+    map_metrics_step,
+    map_metrics_task,
+)
 from langgraph.pregel.read import PregelNode
-from langgraph.pregel.utils import get_new_channel_versions
+from langgraph.pregel.utils import find_subgraph_pregel, get_new_channel_versions
 from langgraph.store.base import BaseStore
 from langgraph.types import (
     All,
+    CacheKey,
     Command,
+    Durability,
     LoopProtocol,
     PregelExecutableTask,
     StreamChunk,
@@ -119,6 +130,7 @@ from langgraph.utils.config import patch_configurable
 
 V = TypeVar("V")
 P = ParamSpec("P")
+WritesT = Sequence[tuple[str, Any]]
 
 INPUT_DONE = object()
 INPUT_RESUMING = object()
@@ -134,6 +146,27 @@ def DuplexStream(*streams: StreamProtocol) -> StreamProtocol:
     return StreamProtocol(__call__, {mode for s in streams for mode in s.modes})
 
 
+def _copy_channel(channel: BaseChannel) -> BaseChannel:
+    try:
+        return channel.from_checkpoint(channel.checkpoint())
+    except EmptyChannelError:
+        return channel.from_checkpoint(None)
+
+
+def _channels_read(proc: PregelNode) -> frozenset[str]:
+    """Get the channels a node reads, ie. its triggers and input channels,
+    which are also the ones read by its branches."""
+    inputs = (
+        proc.channels.values() if isinstance(proc.channels, dict) else proc.channels
+    )
+    return frozenset((*proc.triggers, *inputs))
+
+
+def _log_cache_set_error(fut: Union[concurrent.futures.Future, asyncio.Future]) -> None:
+    if not fut.cancelled() and (exc := fut.exception()) is not None:
+        logger.warning("Failed to write task writes to the cache", exc_info=exc)
+
+
 class PregelLoop(LoopProtocol):
     input: Optional[Any]
     checkpointer: Optional[BaseCheckpointSaver]
@@ -146,11 +179,17 @@ class PregelLoop(LoopProtocol):
     manager: Union[None, AsyncParentRunManager, ParentRunManager]
     interrupt_after: Union[All, Sequence[str]]
     interrupt_before: Union[All, Sequence[str]]
+    trigger_to_nodes: Optional[Mapping[str, Sequence[str]]]
+    node_index: Optional[Mapping[str, int]]
 
     checkpointer_get_next_version: GetNextVersion
-    checkpointer_put_writes: Optional[
-        Callable[[RunnableConfig, Sequence[tuple[str, Any]], str], Any]
+    checkpointer_put_writes_many: Optional[
+        Callable[[RunnableConfig, Sequence[tuple[str, Sequence[tuple[str, Any]]]]], Any]
     ]
+    _put_writes_queue: list[tuple[int, RunnableConfig, str, Sequence[tuple[str, Any]]]]
+    """Writes waiting to be saved, as (step, config, task_id, writes)."""
+    _put_writes_flushing: bool
+    _put_writes_lock: threading.Lock
     _checkpointer_put_after_previous: Optional[
         Callable[
             [
@@ -163,6 +202,23 @@ class PregelLoop(LoopProtocol):
             Any,
         ]
     ]
+    cache: Optional[BaseCache[WritesT]]
+    durability: Durability
+    _unsaved_checkpoint_parent: Optional[RunnableConfig] = None
+    """With "exit" durability, config of the last saved checkpoint, if any
+    checkpoint was created since."""
+    _unsaved_writes: list[tuple[str, Sequence[tuple[str, Any]]]]
+    """With "exit" durability, writes for the current checkpoint, to save on exit."""
+    metrics_hook: Optional[Callable[[MetricsOutput], None]]
+    metrics: bool
+    """Whether to collect metrics, for stream_mode="metrics" or the metrics hook."""
+    debug_output: bool
+    """Whether to produce debug output, for stream_mode="debug" or the debug flag."""
+    stream_depth: Optional[Callable[[], int]]
+    """Returns the number of chunks waiting to be streamed, reported in metrics."""
+    cache_set: Optional[
+        Callable[[Mapping[FullKey, tuple[WritesT, Optional[int]]]], Any]
+    ]
     submit: Submit
     channels: Mapping[str, BaseChannel]
     managed: ManagedValueMapping
@@ -171,8 +227,13 @@ class PregelLoop(LoopProtocol):
     checkpoint_config: RunnableConfig
     checkpoint_metadata: CheckpointMetadata
     checkpoint_pending_writes: List[PendingWrite]
+    checkpoint_pending_writes_by_task: dict[str, List[PendingWrite]]
     checkpoint_previous_versions: dict[str, Union[str, float, int]]
+    checkpoint_updated_channels: set[str]
     prev_checkpoint_config: Optional[RunnableConfig]
+    updated_channels: Optional[set[str]] = None
+    prepare_tasks_time: float = 0.0
+    create_checkpoint_time: float = 0.0
 
     status: Literal[
         "pending", "done", "interrupt_before", "interrupt_after", "out_of_steps"
@@ -200,6 +261,12 @@ class PregelLoop(LoopProtocol):
         manager: Union[None, AsyncParentRunManager, ParentRunManager] = None,
         check_subgraphs: bool = True,
         debug: bool = False,
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+        node_index: Optional[Mapping[str, int]] = None,
+        cache: Optional[BaseCache[WritesT]] = None,
+        metrics_hook: Optional[Callable[[MetricsOutput], None]] = None,
+        durability: Durability = "async",
+        stream_depth: Optional[Callable[[], int]] = None,
     ) -> None:
         super().__init__(
             step=0,
@@ -217,6 +284,11 @@ class PregelLoop(LoopProtocol):
         self.interrupt_after = interrupt_after
         self.interrupt_before = interrupt_before
         self.manager = manager
+        self.trigger_to_nodes = trigger_to_nodes
+        self.node_index = node_index
+        self.cache = cache
+        self.durability = durability
+        self._unsaved_writes = []
         self.is_nested = CONFIG_KEY_TASK_ID in self.config.get(CONF, {})
         self.skip_done_tasks = (
             CONFIG_KEY_CHECKPOINT_ID not in config[CONF]
@@ -225,6 +297,29 @@ class PregelLoop(LoopProtocol):
         self.debug = debug
         if self.stream is not None and CONFIG_KEY_STREAM in config[CONF]:
             self.stream = DuplexStream(self.stream, config[CONF][CONFIG_KEY_STREAM])
+        self._put_writes_queue = []
+        self._put_writes_flushing = False
+        self._put_writes_lock = threading.Lock()
+        # channels that need to be notified of a new step, set on enter
+        self._notify_channels: Sequence[str] = EMPTY_SEQ
+        # cache keys of the tasks of the current step, by task id
+        self._cache_keys: dict[str, CacheKey] = {}
+        self.metrics_hook = metrics_hook
+        self.stream_depth = stream_depth
+        # tasks of the next step started early, by id, with the ids of the tasks
+        # whose writes they saw, and the channels they read
+        self._eager: dict[
+            str, tuple[PregelExecutableTask, frozenset[str], frozenset[str]]
+        ] = {}
+        # ids of the tasks of the current step started early which can be kept
+        self._eager_kept: frozenset[str] = frozenset()
+        self._eager_checkpoint_id: Optional[str] = None
+        self.metrics = metrics_hook is not None or (
+            self.stream is not None and "metrics" in self.stream.modes
+        )
+        self.debug_output = debug or (
+            self.stream is not None and "debug" in self.stream.modes
+        )
         if not self.is_nested and config[CONF].get(CONFIG_KEY_CHECKPOINT_NS):
             self.config = patch_configurable(
                 self.config,
@@ -261,50 +356,65 @@ class PregelLoop(LoopProtocol):
         )
         self.prev_checkpoint_config = None
 
-    def put_writes(self, task_id: str, writes: Sequence[tuple[str, Any]]) -> None:
-        """Put writes for a task, to be read by the next tick."""
+    def put_writes(
+        self, task_id: str, writes: Sequence[tuple[str, Any]], *, cached: bool = False
+    ) -> None:
+        """Put writes for a task, to be read by the next tick.
+        If `cached`, writes were read from the cache instead of running the task."""
         if not writes:
             return
         # deduplicate writes to special channels, last write wins
         if all(w[0] in WRITES_IDX_MAP for w in writes):
             writes = list({w[0]: w for w in writes}.values())
         # save writes
+        task_writes = self.checkpoint_pending_writes_by_task.setdefault(task_id, [])
+        # last writes to special channels replacing previous ones, by channel,
+        # and the channels of the writes they replace, by id of the latter
+        replaced: dict[str, PendingWrite] = {}
+        stale: dict[int, str] = {}
         for c, v in writes:
-            if (
-                c in WRITES_IDX_MAP
-                and (
-                    idx := next(
-                        (
-                            i
-                            for i, w in enumerate(self.checkpoint_pending_writes)
-                            if w[0] == task_id and w[1] == c
-                        ),
-                        None,
-                    )
-                )
-                is not None
-            ):
-                self.checkpoint_pending_writes[idx] = (task_id, c, v)
+            idx = (
+                next((i for i, w in enumerate(task_writes) if w[1] == c), None)
+                if c in WRITES_IDX_MAP
+                else None
+            )
+            if idx is not None:
+                if c not in replaced:
+                    stale[id(task_writes[idx])] = c
+                task_writes[idx] = replaced[c] = (task_id, c, v)
             else:
                 self.checkpoint_pending_writes.append((task_id, c, v))
-        if self.checkpointer_put_writes is not None:
-            self.submit(
-                self.checkpointer_put_writes,
-                patch_configurable(
-                    self.checkpoint_config,
-                    {
-                        CONFIG_KEY_CHECKPOINT_NS: self.config[CONF].get(
-                            CONFIG_KEY_CHECKPOINT_NS, ""
-                        ),
-                        CONFIG_KEY_CHECKPOINT_ID: self.checkpoint["id"],
-                    },
-                ),
-                writes,
-                task_id,
-            )
+                task_writes.append((task_id, c, v))
+        if replaced:
+            # replace them in a single pass, rather than searching for each
+            self.checkpoint_pending_writes[:] = [
+                replaced[stale[id(w)]] if id(w) in stale else w
+                for w in self.checkpoint_pending_writes
+            ]
+        if self.checkpointer_put_writes_many is not None:
+            if self.durability == "exit":
+                # saved on exit, if still pending for the last checkpoint
+                self._unsaved_writes.append((task_id, writes))
+            else:
+                self._queue_put_writes(
+                    patch_configurable(
+                        self.checkpoint_config,
+                        {
+                            CONFIG_KEY_CHECKPOINT_NS: self.config[CONF].get(
+                                CONFIG_KEY_CHECKPOINT_NS, ""
+                            ),
+                            CONFIG_KEY_CHECKPOINT_ID: self.checkpoint["id"],
+                        },
+                    ),
+                    task_id,
+                    writes,
+                )
         # output writes
         if hasattr(self, "tasks"):
-            self._output_writes(task_id, writes)
+            self._output_writes(task_id, writes, cached=cached)
+            # save writes of successful tasks to the cache
+            if not cached and self.cache_set is not None:
+                self._put_cached_writes(task_id, writes)
 
     def accept_push(
         self, task: PregelExecutableTask, write_idx: int, call: Optional[Call] = None
@@ -322,7 +432,10 @@ class PregelLoop(LoopProtocol):
                 (PUSH, task.path, write_idx, task.id, call),
                 None,
                 checkpoint=self.checkpoint,
-                pending_writes=[(task.id, *w) for w in task.writes],
+                # parent task writes are only needed to look up Send packets
+                pending_writes=(
+                    [(task.id, *w) for w in task.writes] if call is None else []
+                ),
                 processes=self.nodes,
                 channels=self.channels,
                 managed=self.managed,
@@ -341,10 +454,13 @@ class PregelLoop(LoopProtocol):
                 self.to_interrupt.append(pushed)
                 return
             # produce debug output
-            self._emit("debug", map_debug_tasks, self.step, [pushed])
-            # debug flag
-            if self.debug:
-                print_step_tasks(self.step, [pushed])
+            if self.debug_output:
+                from langgraph.pregel.debug import map_debug_tasks, print_step_tasks
+
+                self._emit("debug", map_debug_tasks, self.step, [pushed])
+                # debug flag
+                if self.debug:
+                    print_step_tasks(self.step, [pushed])
             # save the new task
             self.tasks[pushed.id] = pushed
             # match any pending writes to the new task
@@ -353,6 +469,98 @@ class PregelLoop(LoopProtocol):
             # return the new task, to be started if not run before
             return pushed
 
+    def accept_eager(self) -> Sequence[PregelExecutableTask]:
+        """Prepare tasks of the next step that can start before the current step
+        finishes, ie. the nodes triggered by the writes of the tasks done so far.
+        Their writes are only kept if no task that finishes later writes to any
+        of the channels they read."""
+        if (
+            self.step + 1 > self.stop
+            or self.interrupt_before
+            or self.interrupt_after
+            or not self.trigger_to_nodes
+        ):
+            return ()
+        tasks = list(self.tasks.values())
+        done = [t for t in tasks if t.id in self.checkpoint_pending_writes_by_task]
+        if not done or len(done) == len(tasks):
+            return ()
+        if any(w[0] in (ERROR, INTERRUPT) for t in done for w in t.writes):
+            return ()
+        done_ids = frozenset(t.id for t in done)
+        # nodes triggered by the writes of finished tasks, other than those
+        # still running in this step or already started
+        skip = {t.name for t in tasks if t.id not in done_ids}
+        skip.update(t.name for t, _, _ in self._eager.values())
+        names = sorted(
+            {
+                name
+                for t in done
+                for chan, _ in t.writes
+                for name in self.trigger_to_nodes.get(chan, EMPTY_SEQ)
+                if name not in skip
+                and self.nodes[name].batch_policy is None
+                and find_subgraph_pregel(self.nodes[name].bound) is None
+            }
+        )
+        if not names:
+            return ()
+        # apply the writes of finished tasks to copies of checkpoint and channels,
+        # consuming the triggers of all tasks of this step
+        if self._eager_checkpoint_id is None:
+            self._eager_checkpoint_id = str(uuid6(clock_seq=self.step))
+        checkpoint = copy_checkpoint(self.checkpoint)
+        checkpoint["id"] = self._eager_checkpoint_id
+        channels = {k: _copy_channel(v) for k, v in self.channels.items()}
+        mv_writes, _ = apply_writes(
+            checkpoint,
+            channels,
+            [
+                t
+                if t.id in done_ids
+                else PregelTaskWrites(t.path, t.name, EMPTY_SEQ, t.triggers)
+                for t in tasks
+            ],
+            self.checkpointer_get_next_version,
+            self._notify_channels,
+        )
+        if mv_writes:
+            return ()
+        started: list[PregelExecutableTask] = []
+        for name in names:
+            if task := prepare_single_task(
+                (PULL, name),
+                None,
+                checkpoint=checkpoint,
+                pending_writes=[],
+                processes=self.nodes,
+                channels=channels,
+                managed=self.managed,
+                config=self.config,
+                step=self.step + 1,
+                for_execution=True,
+                store=self.store,
+                checkpointer=self.checkpointer,
+                manager=self.manager,
+            ):
+                task = cast(PregelExecutableTask, task)
+                self._eager[task.id] = (
+                    task,
+                    done_ids,
+                    _channels_read(self.nodes[name]),
+                )
+                started.append(task)
+        return started
+
+    def keep_eager(self, task_id: str) -> bool:
+        """Whether the early run of a task of the current step, started in the
+        previous step, can be kept."""
+        return task_id in self._eager_kept
+
+    def put_task_metrics(self, task: PregelExecutableTask, timer: TaskTimer) -> None:
+        """Report the timings of a finished task of the current step."""
+        self._emit_metrics(map_metrics_task, self.step, task, timer)
+
     def tick(
         self,
         *,
@@ -373,6 +581,8 @@ class PregelLoop(LoopProtocol):
             writes = [w for t in self.tasks.values() for w in t.writes]
             # debug flag
             if self.debug:
+                from langgraph.pregel.debug import print_step_writes
+
                 print_step_writes(
                     self.step,
                     writes,
@@ -382,13 +592,29 @@ class PregelLoop(LoopProtocol):
                         else self.stream_keys
                     ),
                 )
+            # keep the tasks of the next step started early, if valid
+            self._eager_kept = self._valid_eager()
+            # with "exit" durability, save the checkpoint of this step if
+            # subgraphs saved checkpoints referring to it, before it is updated
+            if self._unsaved_checkpoint_parent is not None and any(
+                t.config[CONF][CONFIG_KEY_SCRATCHPAD].get("subgraph_checkpointed")
+                for t in self.tasks.values()
+            ):
+                self._save_checkpoint(self._unsaved_checkpoint_parent)
+                self._unsaved_checkpoint_parent = None
             # all tasks have finished
-            mv_writes = apply_writes(
+            if self.metrics:
+                apply_writes_start = time.perf_counter()
+            mv_writes, self.updated_channels = apply_writes(
                 self.checkpoint,
                 self.channels,
                 self.tasks.values(),
                 self.checkpointer_get_next_version,
+                self._notify_channels,
             )
+            if self.metrics:
+                apply_writes_time = time.perf_counter() - apply_writes_start
+            self.checkpoint_updated_channels.update(self.updated_channels)
             # apply writes to managed values
             for key, values in mv_writes.items():
                 self._update_mv(key, values)
@@ -398,6 +624,7 @@ class PregelLoop(LoopProtocol):
             )
             # clear pending writes
             self.checkpoint_pending_writes.clear()
+            self.checkpoint_pending_writes_by_task.clear()
             # "not skip_done_tasks" only applies to first tick after resuming
             self.skip_done_tasks = True
             # save checkpoint
@@ -412,6 +639,17 @@ class PregelLoop(LoopProtocol):
                     ),
                 }
             )
+            # produce metrics output
+            if self.metrics:
+                self._emit_metrics(
+                    map_metrics_step,
+                    self.step - 1,
+                    self.prepare_tasks_time,
+                    apply_writes_time,
+                    self.create_checkpoint_time,
+                    len(self.tasks),
+                    self.stream_depth() if self.stream_depth is not None else 0,
+                )
             # after execution, check if we should interrupt
             if self.interrupt_after and should_interrupt(
                 self.checkpoint, self.interrupt_after, self.tasks.values()
@@ -427,6 +665,8 @@ class PregelLoop(LoopProtocol):
             return False
 
         # prepare next tasks
+        if self.metrics:
+            prepare_tasks_start = time.perf_counter()
         self.tasks = prepare_next_tasks(
             self.checkpoint,
             self.checkpoint_pending_writes,
@@ -439,11 +679,18 @@ class PregelLoop(LoopProtocol):
             manager=self.manager,
             store=self.store,
             checkpointer=self.checkpointer,
+            trigger_to_nodes=self.trigger_to_nodes,
+            node_index=self.node_index,
+            updated_channels=self.updated_channels,
         )
+        if self.metrics:
+            self.prepare_tasks_time = time.perf_counter() - prepare_tasks_start
         self.to_interrupt = []
 
         # produce debug output
-        if self._checkpointer_put_after_previous is not None:
+        if self.debug_output and self._checkpointer_put_after_previous is not None:
+            from langgraph.pregel.debug import map_debug_checkpoint
+
             self._emit(
                 "debug",
                 map_debug_checkpoint,
@@ -492,11 +739,13 @@ class PregelLoop(LoopProtocol):
             raise GraphInterrupt()
 
         # produce debug output
-        self._emit("debug", map_debug_tasks, self.step, self.tasks.values())
+        if self.debug_output:
+            from langgraph.pregel.debug import map_debug_tasks, print_step_tasks
 
-        # debug flag
-        if self.debug:
-            print_step_tasks(self.step, list(self.tasks.values()))
+            self._emit("debug", map_debug_tasks, self.step, self.tasks.values())
+            # debug flag
+            if self.debug:
+                print_step_tasks(self.step, list(self.tasks.values()))
 
         # print output for any tasks we applied previous writes to
         for task in self.tasks.values():
@@ -507,11 +756,77 @@ class PregelLoop(LoopProtocol):
 
     # private
 
-    def _match_writes(self, tasks: Mapping[str, PregelExecutableTask]) -> None:
-        for tid, k, v in self.checkpoint_pending_writes:
-            if k in (ERROR, INTERRUPT, RESUME):
+    def _valid_eager(self) -> frozenset[str]:
+        """Get the ids of tasks started early which are still valid, ie. those
+        that read no channel written by any task of this step which finished
+        after they were started."""
+        eager, self._eager = self._eager, {}
+        if not eager:
+            return frozenset()
+        tasks = list(self.tasks.values())
+        if any(w[0] in (ERROR, INTERRUPT) for t in tasks for w in t.writes):
+            return frozenset()
+        return frozenset(
+            task_id
+            for task_id, (_, done_ids, reads) in eager.items()
+            if not any(
+                t.id not in done_ids and any(w[0] in reads for w in t.writes)
+                for t in tasks
+            )
+        )
+
+    def _tasks_to_match_cache(self) -> dict[FullKey, list[PregelExecutableTask]]:
+        """Get the tasks that could be served from the cache, by cache key.
+        Keys are only computed when the graph has a cache."""
+        tasks: dict[FullKey, list[PregelExecutableTask]] = {}
+        self._cache_keys = {}
+        if self.cache is None:
+            return tasks
+        for task in self.tasks.values():
+            if task.writes:
                 continue
-            if task := tasks.get(tid):
+            if (key := task_cache_key(task, self.checkpoint_ns)) is not None:
+                self._cache_keys[task.id] = key
+                tasks.setdefault((key.ns, key.key), []).append(task)
+        return tasks
+
+    def _apply_cached_writes(
+        self,
+        tasks: Mapping[FullKey, Sequence[PregelExecutableTask]],
+        cached: Mapping[FullKey, WritesT],
+    ) -> None:
+        """Apply cached writes to matching tasks, so that they are not executed."""
+        for key, writes in cached.items():
+            for task in tasks.get(key, EMPTY_SEQ):
+                task.writes.extend((c, v) for c, v in writes)
+                self.put_writes(task.id, task.writes, cached=True)
+
+    def _put_cached_writes(
+        self, task_id: str, writes: Sequence[tuple[str, Any]]
+    ) -> None:
+        key = self._cache_keys.get(task_id)
+        if key is None:
+            return
+        # don't cache failed, interrupted, or functional API tasks
+        if any(c in (ERROR, INTERRUPT, PUSH) for c, _ in writes):
+            return
+        # a failure to write to the cache shouldn't fail the run
+        self.submit(
+            cast(Callable, self.cache_set),
+            {
+                (key.ns, key.key): (
+                    [(c, v) for c, v in writes if c not in WRITES_IDX_MAP],
+                    key.ttl,
+                )
+            },
+            __reraise_on_exit__=False,
+        ).add_done_callback(_log_cache_set_error)
+
+    def _match_writes(self, tasks: Mapping[str, PregelExecutableTask]) -> None:
+        for tid, task in tasks.items():
+            for _, k, v in self.checkpoint_pending_writes_by_task.get(tid, EMPTY_SEQ):
+                if k in (ERROR, INTERRUPT, RESUME):
+                    continue
                 if k == SCHEDULED:
                     if v == max(
                         self.checkpoint["versions_seen"].get(INTERRUPT, {}).values(),
@@ -548,21 +863,26 @@ class PregelLoop(LoopProtocol):
         if null_writes := [
             w[1:] for w in self.checkpoint_pending_writes if w[0] == NULL_TASK_ID
         ]:
-            mv_writes = apply_writes(
+            mv_writes, null_updated_channels = apply_writes(
                 self.checkpoint,
                 self.channels,
                 [PregelTaskWrites((), INPUT, null_writes, [])],
                 self.checkpointer_get_next_version,
+                self._notify_channels,
             )
+            self.checkpoint_updated_channels.update(null_updated_channels)
             for key, values in mv_writes.items():
                 self._update_mv(key, values)
         # proceed past previous checkpoint
         if is_resuming:
-            self.checkpoint["versions_seen"].setdefault(INTERRUPT, {})
-            for k in self.channels:
-                if k in self.checkpoint["channel_versions"]:
-                    version = self.checkpoint["channel_versions"][k]
-                    self.checkpoint["versions_seen"][INTERRUPT][k] = version
+            self.checkpoint["versions_seen"][INTERRUPT] = {
+                **self.checkpoint["versions_seen"].get(INTERRUPT, {}),
+                **{
+                    k: self.checkpoint["channel_versions"][k]
+                    for k in self.channels
+                    if k in self.checkpoint["channel_versions"]
+                },
+            }
             # produce values output
             self._emit(
                 "values", map_output_values, self.output_keys, True, self.channels
@@ -595,7 +915,7 @@ class PregelLoop(LoopProtocol):
                 manager=None,
             )
             # apply input writes
-            mv_writes = apply_writes(
+            mv_writes, updated_channels = apply_writes(
                 self.checkpoint,
                 self.channels,
                 [
@@ -603,8 +923,14 @@ class PregelLoop(LoopProtocol):
                     PregelTaskWrites((), INPUT, input_writes, []),
                 ],
                 self.checkpointer_get_next_version,
+                self._notify_channels,
             )
             assert not mv_writes, "Can't write to SharedValues in graph input"
+            self.checkpoint_updated_channels.update(updated_channels)
+            # only nodes triggered by the input need to be checked on first tick
+            if null_writes:
+                updated_channels.update(null_updated_channels)
+            self.updated_channels = updated_channels
             # save input checkpoint
             self._put_checkpoint({"source": "input", "writes": dict(input_writes)})
         elif CONFIG_KEY_RESUMING not in configurable:
@@ -625,6 +951,8 @@ class PregelLoop(LoopProtocol):
         metadata["parents"] = self.config[CONF].get(CONFIG_KEY_CHECKPOINT_MAP, {})
         # debug flag
         if self.debug:
+            from langgraph.pregel.debug import print_step_checkpoint
+
             print_step_checkpoint(
                 metadata,
                 self.channels,
@@ -634,8 +962,21 @@ class PregelLoop(LoopProtocol):
                     else self.stream_keys
                 ),
             )
-        # create new checkpoint
-        self.checkpoint = create_checkpoint(self.checkpoint, self.channels, self.step)
+        # create new checkpoint, only reading the channels updated since the last one
+        if self.metrics:
+            create_checkpoint_start = time.perf_counter()
+        self.checkpoint = create_checkpoint(
+            self.checkpoint,
+            self.channels,
+            self.step,
+            # reuse the id tasks started early were prepared with, if any
+            id=self._eager_checkpoint_id,
+            updated_channels=self.checkpoint_updated_channels,
+        )
+        self._eager_checkpoint_id = None
+        if self.metrics:
+            self.create_checkpoint_time = time.perf_counter() - create_checkpoint_start
+        self.checkpoint_updated_channels = set()
         # bail if no checkpointer
         if self._checkpointer_put_after_previous is not None:
             self.checkpoint_metadata = metadata
@@ -656,23 +997,14 @@ class PregelLoop(LoopProtocol):
                 },
             }
 
-            channel_versions = self.checkpoint["channel_versions"].copy()
-            new_versions = get_new_channel_versions(
-                self.checkpoint_previous_versions, channel_versions
-            )
-            self.checkpoint_previous_versions = channel_versions
-
-            # save it, without blocking
-            # if there's a previous checkpoint save in progress, wait for it
-            # ensuring checkpointers receive checkpoints in order
-            self._put_checkpoint_fut = self.submit(
-                self._checkpointer_put_after_previous,
-                getattr(self, "_put_checkpoint_fut", None),
-                self.checkpoint_config,
-                copy_checkpoint(self.checkpoint),
-                self.checkpoint_metadata,
-                new_versions,
-            )
+            if self.durability == "exit":
+                # keep the checkpoint in memory, to be saved on exit as a child
+                # of the last checkpoint saved
+                if self._unsaved_checkpoint_parent is None:
+                    self._unsaved_checkpoint_parent = self.checkpoint_config
+                self._unsaved_writes.clear()
+            else:
+                self._save_checkpoint(self.checkpoint_config)
             self.checkpoint_config = {
                 **self.checkpoint_config,
                 CONF: {
@@ -683,9 +1015,112 @@ class PregelLoop(LoopProtocol):
         # increment step
         self.step += 1
 
+    def _save_checkpoint(self, config: RunnableConfig) -> None:
+        if (
+            self.is_nested
+            and (scratchpad := self.config[CONF].get(CONFIG_KEY_SCRATCHPAD)) is not None
+        ):
+            # let the parent graph save the checkpoint this one refers to
+            scratchpad["subgraph_checkpointed"] = True
+        channel_versions = self.checkpoint["channel_versions"].copy()
+        # with "exit" durability, these include the channels updated in all
+        # steps since the last checkpoint saved
+        new_versions = get_new_channel_versions(
+            self.checkpoint_previous_versions, channel_versions
+        )
+        self.checkpoint_previous_versions = channel_versions
+
+        # save it, without blocking
+        # if there's a previous checkpoint save in progress, wait for it
+        # ensuring checkpointers receive checkpoints in order
+        self._put_checkpoint_fut = self.submit(
+            self._checkpointer_put_after_previous,
+            getattr(self, "_put_checkpoint_fut", None),
+            config,
+            # channel values are never mutated after the checkpoint is
+            # created, and the seen versions of each node are replaced, not
+            # mutated, so only the top-level mappings need to be copied
+            Checkpoint(
+                v=self.checkpoint["v"],
+                id=self.checkpoint["id"],
+                ts=self.checkpoint["ts"],
+                channel_values=self.checkpoint["channel_values"],
+                channel_versions=channel_versions,
+                versions_seen=self.checkpoint["versions_seen"].copy(),
+                pending_sends=self.checkpoint["pending_sends"].copy(),
+            ),
+            self.checkpoint_metadata,
+            new_versions,
+        )
+
+    def _save_on_exit(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """With "exit" durability, save the last checkpoint and its writes,
+        whether the run completed, was interrupted or failed."""
+        if self.durability != "exit" or self._checkpointer_put_after_previous is None:
+            return
+        if self._unsaved_checkpoint_parent is not None:
+            self._save_checkpoint(self._unsaved_checkpoint_parent)
+            self._unsaved_checkpoint_parent = None
+        if self._unsaved_writes:
+            config = patch_configurable(
+                self.checkpoint_config,
+                {
+                    CONFIG_KEY_CHECKPOINT_NS: self.config[CONF].get(
+                        CONFIG_KEY_CHECKPOINT_NS, ""
+                    ),
+                    CONFIG_KEY_CHECKPOINT_ID: self.checkpoint["id"],
+                },
+            )
+            for task_id, writes in self._unsaved_writes:
+                self._queue_put_writes(config, task_id, writes)
+            self._unsaved_writes = []
+
     def _update_mv(self, key: str, values: Sequence[Any]) -> None:
         raise NotImplementedError
 
+    def _queue_put_writes(
+        self, config: RunnableConfig, task_id: str, writes: Sequence[tuple[str, Any]]
+    ) -> None:
+        """Queue writes to be saved by the checkpointer. Only one batch of writes
+        is saved at a time, so writes of tasks finishing while a batch is being
+        saved are saved together in the next batch."""
+        with self._put_writes_lock:
+            self._put_writes_queue.append((self.step, config, task_id, writes))
+            if self._put_writes_flushing:
+                return
+            self._put_writes_flushing = True
+        self.submit(self._flush_put_writes)
+
+    def _take_put_writes(
+        self,
+    ) -> list[list[tuple[int, RunnableConfig, str, Sequence[tuple[str, Any]]]]]:
+        """Take all queued writes, grouped by checkpoint. If none are queued,
+        mark the flush as done and return an empty list."""
+        with self._put_writes_lock:
+            queued = self._put_writes_queue
+            if not queued:
+                self._put_writes_flushing = False
+                return []
+            self._put_writes_queue = []
+        return [
+            list(batch)
+            for _, batch in groupby(
+                queued,
+                key=lambda q: (
+                    q[1][CONF][CONFIG_KEY_CHECKPOINT_NS],
+                    q[1][CONF][CONFIG_KEY_CHECKPOINT_ID],
+                ),
+            )
+        ]
+
+    def _flush_put_writes(self) -> Any:
+        raise NotImplementedError
+
     def _suppress_interrupt(
         self,
         exc_type: Optional[Type[BaseException]],
@@ -703,11 +1138,12 @@ class PregelLoop(LoopProtocol):
                 and self.checkpoint_pending_writes
                 and any(task.writes for task in self.tasks.values())
             ):
-                mv_writes = apply_writes(
+                mv_writes, _ = apply_writes(
                     self.checkpoint,
                     self.channels,
                     self.tasks.values(),
                     self.checkpointer_get_next_version,
+                    self._notify_channels,
                 )
                 for key, values in mv_writes.items():
                     self._update_mv(key, values)
@@ -740,6 +1176,17 @@ class PregelLoop(LoopProtocol):
         for v in values(*args, **kwargs):
             self.stream((self.checkpoint_ns, mode, v))
 
+    def _emit_metrics(
+        self,
+        values: Callable[P, Iterator[MetricsOutput]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> None:
+        if self.metrics_hook is not None:
+            for v in values(*args, **kwargs):
+                self.metrics_hook(v)
+        self._emit("metrics", values, *args, **kwargs)
+
     def _output_writes(
         self, task_id: str, writes: Sequence[tuple[str, Any]], *, cached: bool = False
     ) -> None:
@@ -756,7 +1203,9 @@ class PregelLoop(LoopProtocol):
                     [(task, writes)],
                     cached,
                 )
-            if not cached:
+            if not cached and self.debug_output:
+                from langgraph.pregel.debug import map_debug_task_results
+
                 self._emit(
                     "debug",
                     map_debug_task_results,
@@ -784,6 +1233,12 @@ class SyncPregelLoop(PregelLoop, ContextManager):
         stream_keys: Union[str, Sequence[str]] = EMPTY_SEQ,
         check_subgraphs: bool = True,
         debug: bool = False,
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+        node_index: Optional[Mapping[str, int]] = None,
+        cache: Optional[BaseCache[WritesT]] = None,
+        metrics_hook: Optional[Callable[[MetricsOutput], None]] = None,
+        durability: Durability = "async",
+        stream_depth: Optional[Callable[[], int]] = None,
     ) -> None:
         super().__init__(
             input,
@@ -800,15 +1255,29 @@ class SyncPregelLoop(PregelLoop, ContextManager):
             check_subgraphs=check_subgraphs,
             manager=manager,
             debug=debug,
+            trigger_to_nodes=trigger_to_nodes,
+            node_index=node_index,
+            cache=cache,
+            metrics_hook=metrics_hook,
+            durability=durability,
+            stream_depth=stream_depth,
         )
         self.stack = ExitStack()
+        self.cache_set = cache.set if cache is not None else None
         if checkpointer:
             self.checkpointer_get_next_version = checkpointer.get_next_version
-            self.checkpointer_put_writes = checkpointer.put_writes
+            self.checkpointer_put_writes_many = checkpointer.put_writes_many
         else:
             self.checkpointer_get_next_version = increment
             self._checkpointer_put_after_previous = None  # type: ignore[assignment]
-            self.checkpointer_put_writes = None
+            self.checkpointer_put_writes_many = None
+
+    def match_cached_writes(self) -> None:
+        """Apply cached writes to tasks of the current step with a cache hit."""
+        if tasks := self._tasks_to_match_cache():
+            self._apply_cached_writes(
+                tasks, cast(BaseCache, self.cache).get(list(tasks))
+            )
 
     def _checkpointer_put_after_previous(
         self,
@@ -822,9 +1291,45 @@ class SyncPregelLoop(PregelLoop, ContextManager):
             if prev is not None:
                 prev.result()
         finally:
+            start = time.perf_counter()
             cast(BaseCheckpointSaver, self.checkpointer).put(
                 config, checkpoint, metadata, new_versions
             )
+            if self.metrics:
+                self._emit_metrics(
+                    map_metrics_checkpointer,
+                    metadata["step"],
+                    "put",
+                    time.perf_counter() - start,
+                )
+
+    def _flush_put_writes(self) -> None:
+        try:
+            while batches := self._take_put_writes():
+                for batch in batches:
+                    start = time.perf_counter()
+                    cast(BaseCheckpointSaver, self.checkpointer).put_writes_many(
+                        batch[0][1], [(q[2], q[3]) for q in batch]
+                    )
+                    if self.metrics:
+                        self._emit_metrics(
+                            map_metrics_checkpointer,
+                            batch[0][0],
+                            "put_writes",
+                            time.perf_counter() - start,
+                            batch[0][2] if len(batch) == 1 else None,
+                        )
+        except BaseException:
+            with self._put_writes_lock:
+                self._put_writes_flushing = False
+            raise
+
+    def wait_checkpoint(self) -> None:
+        """With "sync" durability, wait for the last checkpoint to be saved."""
+        if self.durability == "sync" and (
+            fut := getattr(self, "_put_checkpoint_fut", None)
+        ):
+            fut.result()
 
     def _update_mv(self, key: str, values: Sequence[Any]) -> None:
         return self.submit(cast(WritableManagedValue, self.managed[key]).update, values)
@@ -875,16 +1380,24 @@ class SyncPregelLoop(PregelLoop, ContextManager):
             if saved.pending_writes is not None
             else []
         )
+        self.checkpoint_pending_writes_by_task = defaultdict(list)
+        for w in self.checkpoint_pending_writes:
+            self.checkpoint_pending_writes_by_task[w[0]].append(w)
 
         self.submit = self.stack.enter_context(BackgroundExecutor(self.config))
         self.channels, self.managed = self.stack.enter_context(
             ChannelsManager(self.specs, self.checkpoint, self)
         )
+        self._notify_channels = [
+            k for k, v in self.channels.items() if v.needs_step_notification
+        ]
+        self.stack.push(self._save_on_exit)
         self.stack.push(self._suppress_interrupt)
         self.status = "pending"
         self.step = self.checkpoint_metadata["step"] + 1
         self.stop = self.step + self.config["recursion_limit"] + 1
         self.checkpoint_previous_versions = self.checkpoint["channel_versions"].copy()
+        self.checkpoint_updated_channels = set()
 
         return self
 
@@ -916,6 +1429,12 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
         stream_keys: Union[str, Sequence[str]] = EMPTY_SEQ,
         check_subgraphs: bool = True,
         debug: bool = False,
+        trigger_to_nodes: Optional[Mapping[str, Sequence[str]]] = None,
+        node_index: Optional[Mapping[str, int]] = None,
+        cache: Optional[BaseCache[WritesT]] = None,
+        metrics_hook: Optional[Callable[[MetricsOutput], None]] = None,
+        durability: Durability = "async",
+        stream_depth: Optional[Callable[[], int]] = None,
     ) -> None:
         super().__init__(
             input,
@@ -932,15 +1451,29 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
             check_subgraphs=check_subgraphs,
             manager=manager,
             debug=debug,
+            trigger_to_nodes=trigger_to_nodes,
+            node_index=node_index,
+            cache=cache,
+            metrics_hook=metrics_hook,
+            durability=durability,
+            stream_depth=stream_depth,
         )
         self.stack = AsyncExitStack()
+        self.cache_set = cache.aset if cache is not None else None
         if checkpointer:
             self.checkpointer_get_next_version = checkpointer.get_next_version
-            self.checkpointer_put_writes = checkpointer.aput_writes
+            self.checkpointer_put_writes_many = checkpointer.aput_writes_many
         else:
             self.checkpointer_get_next_version = increment
             self._checkpointer_put_after_previous = None  # type: ignore[assignment]
-            self.checkpointer_put_writes = None
+            self.checkpointer_put_writes_many = None
+
+    async def amatch_cached_writes(self) -> None:
+        """Apply cached writes to tasks of the current step with a cache hit."""
+        if tasks := self._tasks_to_match_cache():
+            self._apply_cached_writes(
+                tasks, await cast(BaseCache, self.cache).aget(list(tasks))
+            )
 
     async def _checkpointer_put_after_previous(
         self,
@@ -954,9 +1487,45 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
             if prev is not None:
                 await prev
         finally:
+            start = time.perf_counter()
             await cast(BaseCheckpointSaver, self.checkpointer).aput(
                 config, checkpoint, metadata, new_versions
             )
+            if self.metrics:
+                self._emit_metrics(
+                    map_metrics_checkpointer,
+                    metadata["step"],
+                    "put",
+                    time.perf_counter() - start,
+                )
+
+    async def _flush_put_writes(self) -> None:
+        try:
+            while batches := self._take_put_writes():
+                for batch in batches:
+                    start = time.perf_counter()
+                    await cast(BaseCheckpointSaver, self.checkpointer).aput_writes_many(
+                        batch[0][1], [(q[2], q[3]) for q in batch]
+                    )
+                    if self.metrics:
+                        self._emit_metrics(
+                            map_metrics_checkpointer,
+                            batch[0][0],
+                            "put_writes",
+                            time.perf_counter() - start,
+                            batch[0][2] if len(batch) == 1 else None,
+                        )
+        except BaseException:
+            with self._put_writes_lock:
+                self._put_writes_flushing = False
+            raise
+
+    async def await_checkpoint(self) -> None:
+        """With "sync" durability, wait for the last checkpoint to be saved."""
+        if self.durability == "sync" and (
+            fut := getattr(self, "_put_checkpoint_fut", None)
+        ):
+            await fut
 
     def _update_mv(self, key: str, values: Sequence[Any]) -> None:
         return self.submit(
@@ -1009,6 +1578,9 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
             if saved.pending_writes is not None
             else []
         )
+        self.checkpoint_pending_writes_by_task = defaultdict(list)
+        for w in self.checkpoint_pending_writes:
+            self.checkpoint_pending_writes_by_task[w[0]].append(w)
 
         self.submit = await self.stack.enter_async_context(
             AsyncBackgroundExecutor(self.config)
@@ -1016,12 +1588,17 @@ class AsyncPregelLoop(PregelLoop, AsyncContextManager):
         self.channels, self.managed = await self.stack.enter_async_context(
             AsyncChannelsManager(self.specs, self.checkpoint, self)
         )
+        self._notify_channels = [
+            k for k, v in self.channels.items() if v.needs_step_notification
+        ]
+        self.stack.push(self._save_on_exit)
         self.stack.push(self._suppress_interrupt)
         self.status = "pending"
         self.step = self.checkpoint_metadata["step"] + 1
         self.stop = self.step + self.config["recursion_limit"] + 1
 
         self.checkpoint_previous_versions = self.checkpoint["channel_versions"].copy()
+        self.checkpoint_updated_channels = set()
 
         return self
 
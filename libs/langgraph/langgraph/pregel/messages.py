@@ -1,3 +1,4 @@
+import time
 from typing import (
     Any,
     AsyncIterator,
@@ -13,12 +14,12 @@ from typing import (
 from uuid import UUID, uuid4
 
 from langchain_core.callbacks import BaseCallbackHandler
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import BaseMessage, BaseMessageChunk
 from langchain_core.outputs import ChatGenerationChunk, LLMResult
 from langchain_core.tracers._streaming import T, _StreamingCallbackHandler
 
 from langgraph.constants import NS_SEP, TAG_HIDDEN, TAG_NOSTREAM
-from langgraph.types import StreamChunk
+from langgraph.types import StreamChunk, StreamCoalescePolicy
 
 Meta = tuple[tuple[str, ...], dict[str, Any]]
 
@@ -30,10 +31,17 @@ class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
     run_inline = True
     """We want this callback to run in the main thread, to avoid order/locking issues."""
 
-    def __init__(self, stream: Callable[[StreamChunk], None]):
+    def __init__(
+        self,
+        stream: Callable[[StreamChunk], None],
+        coalesce: Optional[StreamCoalescePolicy] = None,
+    ):
         self.stream = stream
+        self.coalesce = coalesce
         self.metadata: dict[UUID, Meta] = {}
         self.seen: set[Union[int, str]] = set()
+        # run id -> (chunks held, number of chunks held, time of last emit)
+        self.held: dict[UUID, tuple[Optional[BaseMessageChunk], int, float]] = {}
 
     def _emit(self, meta: Meta, message: BaseMessage, *, dedupe: bool = False) -> None:
         if dedupe and message.id in self.seen:
@@ -81,7 +89,33 @@ class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
         if not isinstance(chunk, ChatGenerationChunk):
             return
         if meta := self.metadata.get(run_id):
-            self._emit(meta, chunk.message)
+            if self.coalesce is None:
+                self._emit(meta, chunk.message)
+            else:
+                self._emit_coalesced(meta, run_id, chunk.message)
+
+    def _emit_coalesced(
+        self, meta: Meta, run_id: UUID, message: BaseMessageChunk
+    ) -> None:
+        policy = cast(StreamCoalescePolicy, self.coalesce)
+        held, count, last_emit = self.held.get(run_id, (None, 0, 0.0))
+        if held is not None:
+            message = held + message
+        count += 1
+        now = time.monotonic()
+        if (policy.max_wait is not None and now - last_emit >= policy.max_wait) or (
+            policy.max_chunks is not None and count >= policy.max_chunks
+        ):
+            self.held[run_id] = (None, 0, now)
+            self._emit(meta, message)
+        else:
+            self.held[run_id] = (message, count, last_emit)
+
+    def _flush(self, run_id: UUID) -> None:
+        meta = self.metadata.pop(run_id, None)
+        held = self.held.pop(run_id, None)
+        if meta is not None and held is not None and held[0] is not None:
+            self._emit(meta, held[0])
 
     def on_llm_end(
         self,
@@ -91,7 +125,7 @@ class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
         parent_run_id: Optional[UUID] = None,
         **kwargs: Any,
     ) -> Any:
-        self.metadata.pop(run_id, None)
+        self._flush(run_id)
 
     def on_llm_error(
         self,
@@ -101,7 +135,7 @@ class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
         parent_run_id: Optional[UUID] = None,
         **kwargs: Any,
     ) -> Any:
-        self.metadata.pop(run_id, None)
+        self._flush(run_id)
 
     def on_chain_start(
         self,
@@ -0,0 +1,135 @@
+import time
+from typing import Iterator, Literal, Optional, TypedDict, Union
+
+from langgraph.constants import TAG_HIDDEN
+from langgraph.types import PregelExecutableTask
+
+
+class StepMetricsPayload(TypedDict):
+    prepare_tasks: float
+    """Seconds spent preparing the tasks of the step."""
+    apply_writes: float
+    """Seconds spent applying the writes of the step's tasks to channels."""
+    create_checkpoint: float
+    """Seconds spent creating the checkpoint at the end of the step."""
+    tasks: int
+    """Number of tasks in the step."""
+    stream_depth: int
+    """Number of chunks waiting to be consumed from the stream at the end of the step."""
+
+
+class TaskMetricsPayload(TypedDict):
+    id: str
+    name: str
+    queue_wait: float
+    """Seconds between the task being scheduled and starting to run."""
+    run_time: float
+    """Seconds spent running the task, including retries."""
+    retries: int
+    writes: int
+
+
+class CheckpointerMetricsPayload(TypedDict):
+    method: Literal["put", "put_writes"]
+    duration: float
+    """Seconds spent in the checkpointer method, including serialization."""
+    task_id: Optional[str]
+    """Task whose writes were saved, None for checkpoints or writes of several tasks."""
+
+
+class MetricsOutputBase(TypedDict):
+    step: int
+
+
+class MetricsOutputStep(MetricsOutputBase):
+    type: Literal["step"]
+    payload: StepMetricsPayload
+
+
+class MetricsOutputTask(MetricsOutputBase):
+    type: Literal["task"]
+    payload: TaskMetricsPayload
+
+
+class MetricsOutputCheckpointer(MetricsOutputBase):
+    type: Literal["checkpointer"]
+    payload: CheckpointerMetricsPayload
+
+
+MetricsOutput = Union[MetricsOutputStep, MetricsOutputTask, MetricsOutputCheckpointer]
+
+
+class TaskTimer:
+    """Timestamps of a task, from being scheduled to finishing."""
+
+    __slots__ = ("scheduled", "started", "finished", "retries")
+
+    def __init__(self) -> None:
+        self.scheduled = time.perf_counter()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.retries = 0
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+
+    def finish(self) -> None:
+        self.finished = time.perf_counter()
+
+
+def map_metrics_step(
+    step: int,
+    prepare_tasks: float,
+    apply_writes: float,
+    create_checkpoint: float,
+    tasks: int,
+    stream_depth: int = 0,
+) -> Iterator[MetricsOutputStep]:
+    """Produce "step" events for stream_mode=metrics."""
+    yield {
+        "type": "step",
+        "step": step,
+        "payload": {
+            "prepare_tasks": prepare_tasks,
+            "apply_writes": apply_writes,
+            "create_checkpoint": create_checkpoint,
+            "tasks": tasks,
+            "stream_depth": stream_depth,
+        },
+    }
+
+
+def map_metrics_task(
+    step: int, task: PregelExecutableTask, timer: TaskTimer
+) -> Iterator[MetricsOutputTask]:
+    """Produce "task" events for stream_mode=metrics."""
+    if task.config is not None and TAG_HIDDEN in task.config.get("tags", []):
+        return
+    started = timer.started if timer.started is not None else timer.scheduled
+    finished = timer.finished if timer.finished is not None else started
+    yield {
+        "type": "task",
+        "step": step,
+        "payload": {
+            "id": task.id,
+            "name": task.name,
+            "queue_wait": started - timer.scheduled,
+            "run_time": finished - started,
+            "retries": timer.retries,
+            "writes": len(task.writes),
+        },
+    }
+
+
+def map_metrics_checkpointer(
+    step: int,
+    method: Literal["put", "put_writes"],
+    duration: float,
+    task_id: Optional[str] = None,
+) -> Iterator[MetricsOutputCheckpointer]:
+    """Produce "checkpointer" events for stream_mode=metrics."""
+    yield {
+        "type": "checkpointer",
+        "step": step,
+        "payload": {"method": method, "duration": duration, "task_id": task_id},
+    }
@@ -1,42 +1,87 @@
 import asyncio
+import concurrent.futures
 import logging
 import random
 import sys
+import threading
 import time
+from collections import OrderedDict, deque
 from dataclasses import replace
-from typing import Any, Optional, Sequence
+from typing import Any, Callable, Optional, Sequence
+
+from langchain_core.callbacks import BaseCallbackManager
+from langchain_core.runnables import RunnableConfig
 
 from langgraph.constants import (
     CONF,
+    CONFIG_KEY_CALL,
+    CONFIG_KEY_CANCEL_TOKEN,
     CONFIG_KEY_CHECKPOINT_NS,
     CONFIG_KEY_RESUMING,
+    CONFIG_KEY_SEND,
+    CONFIG_KEY_STREAM,
+    CONFIG_KEY_STREAM_WRITER,
     NS_SEP,
 )
-from langgraph.errors import _SEEN_CHECKPOINT_NS, GraphBubbleUp, ParentCommand
-from langgraph.types import Command, PregelExecutableTask, RetryPolicy
+from langgraph.errors import (
+    _SEEN_CHECKPOINT_NS,
+    GraphBubbleUp,
+    NodeTimeoutError,
+    ParentCommand,
+)
+from langgraph.pregel.executor import Submit
+from langgraph.pregel.metrics import TaskTimer
+from langgraph.types import (
+    CancellationToken,
+    Command,
+    PregelExecutableTask,
+    RetryPolicy,
+    StreamProtocol,
+)
 from langgraph.utils.config import patch_configurable
 
 logger = logging.getLogger(__name__)
 SUPPORTS_EXC_NOTES = sys.version_info >= (3, 11)
 
+LATENCY_WINDOW = 100
+"""Number of recent latencies of a node used to compute hedging percentiles."""
+LATENCY_MIN_SAMPLES = 20
+"""Number of latencies of a node to record before using hedging percentiles."""
+LATENCY_MAX_NODES = 1024
+"""Number of nodes for which recent latencies are kept."""
+
+_latencies: OrderedDict[tuple[int, str], tuple[RetryPolicy, deque[float]]] = (
+    OrderedDict()
+)
+_latencies_lock = threading.Lock()
+
 
 def run_with_retry(
     task: PregelExecutableTask,
     retry_policy: Optional[RetryPolicy],
     configurable: Optional[dict[str, Any]] = None,
+    timer: Optional[TaskTimer] = None,
+    submit: Optional[Submit] = None,
 ) -> None:
-    """Run a task with retries."""
+    """Run a task with retries. The timeout and hedging of the task need `submit`,
+    to run its attempts in the background."""
     retry_policy = task.retry_policy or retry_policy
     interval = retry_policy.initial_interval if retry_policy else 0
     attempts = 0
     config = task.config
     if configurable is not None:
         config = patch_configurable(config, configurable)
+    if timer is not None:
+        timer.start()
     while True:
         try:
             # clear any writes from previous attempts
             task.writes.clear()
             # run the task
+            if submit is not None and (
+                task.timeout is not None or _hedges(retry_policy)
+            ):
+                return _run_attempts(task, config, retry_policy, submit)
             return task.proc.invoke(task.input, config)
         except ParentCommand as exc:
             ns: str = config[CONF][CONFIG_KEY_CHECKPOINT_NS]
@@ -81,6 +126,8 @@ def run_with_retry(
             # check if we should give up
             if attempts >= retry_policy.max_attempts:
                 raise
+            if timer is not None:
+                timer.retries += 1
             # sleep before retrying
             interval = min(
                 retry_policy.max_interval,
@@ -110,6 +157,7 @@ async def arun_with_retry(
     retry_policy: Optional[RetryPolicy],
     stream: bool = False,
     configurable: Optional[dict[str, Any]] = None,
+    timer: Optional[TaskTimer] = None,
 ) -> None:
     """Run a task asynchronously with retries."""
     retry_policy = task.retry_policy or retry_policy
@@ -118,12 +166,16 @@ async def arun_with_retry(
     config = task.config
     if configurable is not None:
         config = patch_configurable(config, configurable)
+    if timer is not None:
+        timer.start()
     while True:
         try:
             # clear any writes from previous attempts
             task.writes.clear()
             # run the task
-            if stream:
+            if task.timeout is not None or _hedges(retry_policy):
+                return await _arun_attempts(task, config, retry_policy, stream)
+            elif stream:
                 async for _ in task.proc.astream(task.input, config):
                     pass
                 # if successful, end
@@ -173,6 +225,8 @@ async def arun_with_retry(
             # check if we should give up
             if attempts >= retry_policy.max_attempts:
                 raise
+            if timer is not None:
+                timer.retries += 1
             # sleep before retrying
             interval = min(
                 retry_policy.max_interval,
@@ -195,3 +249,243 @@ async def arun_with_retry(
             # clear checkpoint_ns seen (for subgraph detection)
             if checkpoint_ns := config[CONF].get(CONFIG_KEY_CHECKPOINT_NS):
                 _SEEN_CHECKPOINT_NS.discard(checkpoint_ns)
+
+
+def _hedges(retry_policy: Optional[RetryPolicy]) -> bool:
+    return retry_policy is not None and (
+        retry_policy.hedge_after is not None
+        or retry_policy.hedge_percentile is not None
+    )
+
+
+def _hedge_delay(retry_policy: Optional[RetryPolicy], name: str) -> Optional[float]:
+    """Return the time after which to start a duplicate attempt of a task."""
+    if retry_policy is None:
+        return None
+    if retry_policy.hedge_percentile is not None:
+        with _latencies_lock:
+            entry = _latencies.get((id(retry_policy), name))
+            recent = sorted(entry[1]) if entry else ()
+        if len(recent) >= LATENCY_MIN_SAMPLES:
+            idx = int(len(recent) * retry_policy.hedge_percentile / 100)
+            return recent[min(idx, len(recent) - 1)]
+    return retry_policy.hedge_after
+
+
+def _record_latency(
+    retry_policy: Optional[RetryPolicy], name: str, latency: float
+) -> None:
+    if retry_policy is None or retry_policy.hedge_percentile is None:
+        return
+    # the policy is kept alive with its latencies, so that its id isn't reused
+    key = (id(retry_policy), name)
+    with _latencies_lock:
+        if entry := _latencies.get(key):
+            _latencies.move_to_end(key)
+        else:
+            entry = _latencies[key] = (retry_policy, deque(maxlen=LATENCY_WINDOW))
+            if len(_latencies) > LATENCY_MAX_NODES:
+                _latencies.popitem(last=False)
+        entry[1].append(latency)
+
+
+class _Attempt:
+    """The config of an attempt of a task, buffering its writes and its stream
+    output, ie. custom output, messages and the output of subgraphs, so that only
+    those of the attempt used are sent."""
+
+    __slots__ = ("config", "writes", "output", "token")
+
+    def __init__(self, config: RunnableConfig) -> None:
+        self.writes: deque[tuple[str, Any]] = deque()
+        self.output: deque[tuple[Callable[[Any], None], Any]] = deque()
+        self.token = CancellationToken()
+        conf = config[CONF]
+        configurable: dict[str, Any] = {
+            CONFIG_KEY_SEND: self.writes.extend,
+            CONFIG_KEY_CALL: _call_in_attempt,
+            CONFIG_KEY_CANCEL_TOKEN: self.token,
+        }
+        if writer := conf.get(CONFIG_KEY_STREAM_WRITER):
+            configurable[CONFIG_KEY_STREAM_WRITER] = self._buffer(writer)
+        if stream := conf.get(CONFIG_KEY_STREAM):
+            configurable[CONFIG_KEY_STREAM] = StreamProtocol(
+                self._buffer(stream), stream.modes
+            )
+        self.config = patch_configurable(config, configurable)
+        callbacks = config.get("callbacks")
+        if isinstance(callbacks, BaseCallbackManager):
+            from langgraph.pregel.messages import StreamMessagesHandler
+
+            clones = {
+                id(h): StreamMessagesHandler(self._buffer(h.stream), h.coalesce)
+                for h in callbacks.handlers
+                if isinstance(h, StreamMessagesHandler)
+            }
+            if clones:
+                callbacks = callbacks.copy()
+                callbacks.handlers = [clones.get(id(h), h) for h in callbacks.handlers]
+                callbacks.inheritable_handlers = [
+                    clones.get(id(h), h) for h in callbacks.inheritable_handlers
+                ]
+                self.config = {**self.config, "callbacks": callbacks}
+
+    def _buffer(self, emit: Callable[[Any], None]) -> Callable[[Any], None]:
+        return lambda chunk: self.output.append((emit, chunk))
+
+    def send(self, config: RunnableConfig) -> None:
+        """Send the stream output and writes of the attempt."""
+        for emit, chunk in self.output:
+            emit(chunk)
+        config[CONF][CONFIG_KEY_SEND](list(self.writes))
+
+
+def _call_in_attempt(*args: Any, **kwargs: Any) -> Any:
+    """Calls of tasks made by a node with a timeout or hedging, which can't be
+    undone if the attempt making them isn't used."""
+    raise RuntimeError("Nodes with a timeout or hedging can't call tasks")
+
+
+def _run_attempts(
+    task: PregelExecutableTask,
+    config: RunnableConfig,
+    retry_policy: Optional[RetryPolicy],
+    submit: Submit,
+) -> Any:
+    """Run a task with a timeout, or hedging, ie. starting a duplicate attempt if
+    the first one hasn't finished in time.
+
+    Each attempt is submitted to the executor of the loop, with a copy of the
+    context, and buffers its writes and stream output, only those of the first
+    attempt to succeed are sent. Attempts can't call tasks. A sync attempt can't be stopped once started: attempts that
+    timed out or lost are signalled through their cancellation token, and keep
+    running until they return, their writes discarded. The graph waits for them
+    to return before exiting."""
+    delay = _hedge_delay(retry_policy, task.name)
+    if delay is None and task.timeout is None:
+        started = time.monotonic()
+        ret = task.proc.invoke(task.input, config)
+        _record_latency(retry_policy, task.name, time.monotonic() - started)
+        return ret
+    deadline = time.monotonic() + task.timeout if task.timeout is not None else None
+    attempts: list[tuple[concurrent.futures.Future, _Attempt, float]] = []
+
+    def attempt() -> None:
+        a = _Attempt(config)
+        fut = submit(
+            task.proc.invoke,
+            task.input,
+            a.config,
+            __cancel_on_exit__=True,
+            __reraise_on_exit__=False,
+        )
+        attempts.append((fut, a, time.monotonic()))
+
+    try:
+        attempt()
+        if delay is not None and (
+            deadline is None or time.monotonic() + delay < deadline
+        ):
+            if not concurrent.futures.wait([attempts[0][0]], timeout=delay).done:
+                logger.info(f"Hedging task {task.name} after {delay:.2f} seconds")
+                attempt()
+        pending = {a[0] for a in attempts}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending,
+                timeout=max(0, deadline - time.monotonic()) if deadline else None,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            if not done:
+                raise NodeTimeoutError(
+                    f"Node '{task.name}' timed out after {task.timeout} seconds"
+                )
+            for fut, a, started in attempts:
+                if fut not in done:
+                    continue
+                exc = fut.exception()
+                if exc is None or isinstance(exc, GraphBubbleUp):
+                    # first attempt to succeed, send its output and writes only
+                    a.send(config)
+                    if exc is not None:
+                        raise exc
+                    _record_latency(retry_policy, task.name, time.monotonic() - started)
+                    return fut.result()
+                elif error is None:
+                    error = exc
+        raise error  # type: ignore[misc]
+    finally:
+        for fut, a, _ in attempts:
+            fut.cancel()
+            a.token.cancel()
+
+
+async def _arun_attempts(
+    task: PregelExecutableTask,
+    config: RunnableConfig,
+    retry_policy: Optional[RetryPolicy],
+    stream: bool,
+) -> Any:
+    """Async version of _run_attempts, which cancels the other attempts."""
+
+    async def run(config: RunnableConfig) -> Any:
+        if stream:
+            async for _ in task.proc.astream(task.input, config):
+                pass
+        else:
+            return await task.proc.ainvoke(task.input, config)
+
+    delay = _hedge_delay(retry_policy, task.name)
+    if delay is None and task.timeout is None:
+        started = time.monotonic()
+        ret = await run(config)
+        _record_latency(retry_policy, task.name, time.monotonic() - started)
+        return ret
+    deadline = time.monotonic() + task.timeout if task.timeout is not None else None
+    attempts: list[tuple[asyncio.Future, _Attempt, float]] = []
+
+    def attempt() -> None:
+        a = _Attempt(config)
+        fut = asyncio.ensure_future(run(a.config))
+        attempts.append((fut, a, time.monotonic()))
+
+    try:
+        attempt()
+        if delay is not None and (
+            deadline is None or time.monotonic() + delay < deadline
+        ):
+            done, _ = await asyncio.wait([attempts[0][0]], timeout=delay)
+            if not done:
+                logger.info(f"Hedging task {task.name} after {delay:.2f} seconds")
+                attempt()
+        pending = {a[0] for a in attempts}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=max(0, deadline - time.monotonic()) if deadline else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                raise NodeTimeoutError(
+                    f"Node '{task.name}' timed out after {task.timeout} seconds"
+                )
+            for fut, a, started in attempts:
+                if fut not in done:
+                    continue
+                exc = fut.exception()
+                if exc is None or isinstance(exc, GraphBubbleUp):
+                    # first attempt to succeed, send its output and writes only
+                    a.send(config)
+                    if exc is not None:
+                        raise exc
+                    _record_latency(retry_policy, task.name, time.monotonic() - started)
+                    return fut.result()
+                elif error is None:
+                    error = exc
+        raise error  # type: ignore[misc]
+    finally:
+        for fut, a, _ in attempts:
+            fut.cancel()
+            a.token.cancel()
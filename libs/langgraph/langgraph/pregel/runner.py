@@ -2,6 +2,7 @@ import asyncio
 import concurrent.futures
 import threading
 import time
+from collections import deque
 from functools import partial
 from typing import (
     Any,
@@ -20,7 +21,11 @@ from typing import (
 from langgraph.constants import (
     CONF,
     CONFIG_KEY_CALL,
+    CONFIG_KEY_CHECKPOINT_NS,
+    CONFIG_KEY_READ,
     CONFIG_KEY_SEND,
+    CONFIG_KEY_TASK_ID,
+    CONFIG_KEY_WRITES,
     ERROR,
     INTERRUPT,
     NO_WRITES,
@@ -29,12 +34,15 @@ from langgraph.constants import (
     RETURN,
     TAG_HIDDEN,
 )
-from langgraph.errors import GraphBubbleUp, GraphInterrupt
+from langgraph.errors import GraphBubbleUp, GraphInterrupt, InvalidUpdateError
 from langgraph.pregel.algo import Call
 from langgraph.pregel.executor import Submit
+from langgraph.pregel.metrics import TaskTimer
 from langgraph.pregel.retry import arun_with_retry, run_with_retry
-from langgraph.types import PregelExecutableTask, RetryPolicy
+from langgraph.types import BatchPolicy, PregelExecutableTask, RetryPolicy
+from langgraph.utils.config import patch_configurable
 from langgraph.utils.future import chain_future
+from langgraph.utils.runnable import RunnableSeq
 
 
 class PregelRunner:
@@ -52,12 +60,28 @@ class PregelRunner:
         ],
         use_astream: bool = False,
         node_finished: Optional[Callable[[str], None]] = None,
+        task_finished: Optional[
+            Callable[[PregelExecutableTask, TaskTimer], None]
+        ] = None,
+        schedule_eager: Optional[Callable[[], Sequence[PregelExecutableTask]]] = None,
+        keep_eager: Optional[Callable[[str], bool]] = None,
     ) -> None:
         self.submit = submit
         self.put_writes = put_writes
         self.use_astream = use_astream
+        self.task_finished = task_finished
+        self.timers: dict[str, TaskTimer] = {}
         self.node_finished = node_finished
         self.schedule_task = schedule_task
+        self.schedule_eager = schedule_eager
+        self.keep_eager = keep_eager
+        # tasks of the next step started early, by id, with their futures
+        self.eager: dict[
+            str,
+            tuple[
+                PregelExecutableTask, Union[concurrent.futures.Future, asyncio.Future]
+            ],
+        ] = {}
 
     def tick(
         self,
@@ -97,31 +121,18 @@ class PregelRunner:
                 if next_task := self.schedule_task(
                     task, idx, calls[idx - prev_length] if calls else None
                 ):
-                    if fut := next(
-                        (
-                            f
-                            for f, t in futures.items()
-                            if t is not None and t == next_task.id
-                        ),
-                        None,
-                    ):
+                    if fut := futures_by_task_id.get(next_task.id):
                         # if the parent task was retried,
                         # the next task might already be running
                         rtn[idx - prev_length] = fut
                     elif next_task.writes:
                         # if it already ran, return the result
                         fut = concurrent.futures.Future()
-                        if val := next(v for c, v in next_task.writes if c == RETURN):
-                            fut.set_result(val)
-                        elif exc := next(v for c, v in next_task.writes if c == ERROR):
-                            fut.set_exception(
-                                exc
-                                if isinstance(exc, BaseException)
-                                else Exception(exc)
-                            )
-                        else:
-                            fut.set_result(None)
+                        _set_result_from_writes(fut, next_task.writes)
                         rtn[idx - prev_length] = fut
+                    elif next_task.batch_policy is not None:
+                        # add the next task to a batch
+                        rtn[idx - prev_length] = batched(next_task, None)
                     else:
                         # schedule the next task
                         fut = self.submit(
@@ -132,13 +143,16 @@ class PregelRunner:
                                 CONFIG_KEY_SEND: partial(writer, next_task),
                                 CONFIG_KEY_CALL: partial(call, next_task),
                             },
+                            timer=self._timer(next_task),
+                            submit=self.submit,
                             __reraise_on_exit__=reraise,
                             # starting a new task in the next tick ensures
                             # updates from this tick are committed/streamed first
                             __next_tick__=True,
                         )
-                        fut.add_done_callback(partial(self.commit, next_task))
+                        fut.add_done_callback(partial(on_done, next_task))
                         futures[fut] = next_task
+                        futures_by_task_id[next_task.id] = fut
                         rtn[idx - prev_length] = fut
             return [rtn.get(i) for i in range(len(writes))]
 
@@ -155,13 +169,112 @@ class PregelRunner:
             assert fut is not None, "writer did not return a future for call"
             return fut
 
-        tasks = tuple(tasks)
+        def run(task: PregelExecutableTask) -> concurrent.futures.Future:
+            return self.submit(
+                run_with_retry,
+                task,
+                retry_policy,
+                configurable={
+                    CONFIG_KEY_SEND: partial(writer, task),
+                    CONFIG_KEY_CALL: partial(call, task),
+                },
+                timer=self._timer(task),
+                submit=self.submit,
+                __reraise_on_exit__=reraise,
+            )
+
+        def adopt(
+            task: PregelExecutableTask,
+            early: PregelExecutableTask,
+            fut: concurrent.futures.Future,
+            efut: concurrent.futures.Future,
+        ) -> None:
+            if fut.done():
+                return
+            elif not efut.cancelled() and efut.result():
+                # keep the writes of the early run
+                task.writes.extend(early.writes)
+                fut.set_result(None)
+            else:
+                # it failed or can't be kept, run it again
+                chain_future(run(task), fut)
+
+        def on_done(task: PregelExecutableTask, fut: concurrent.futures.Future) -> None:
+            try:
+                self.commit(task, fut)
+            finally:
+                with committed_cond:
+                    committed.add(fut)
+                    committed_cond.notify_all()
+
+        def batched(
+            task: PregelExecutableTask, started: Optional[list[_Batch]]
+        ) -> concurrent.futures.Future:
+            # the future of each task is resolved when its batch finishes
+            fut: concurrent.futures.Future = concurrent.futures.Future()
+            fut.add_done_callback(partial(on_done, task))
+            futures[fut] = task
+            futures_by_task_id[task.id] = fut
+            configurable = {
+                CONFIG_KEY_SEND: partial(writer, task),
+                CONFIG_KEY_CALL: partial(call, task),
+            }
+            timer = self._timer(task)
+            config = _batch_config(task)
+            with batches_lock:
+                # add to the batch of the node, or start a new one
+                batch = batches.get(task.name)
+                if batch is not None:
+                    if batch.add(task, fut, configurable, timer, config):
+                        return fut
+                    # it gets no more tasks once replaced, don't wait for them
+                    batch.notify()
+                ready = threading.Event()
+                batch = batches[task.name] = _Batch(
+                    cast(BatchPolicy, task.batch_policy), ready, ready.set
+                )
+                batch.add(task, fut, configurable, timer, config)
+            if started is not None:
+                started.append(batch)
+            else:
+                self.submit(
+                    _run_batch,
+                    batch,
+                    retry_policy,
+                    self.submit,
+                    __reraise_on_exit__=False,
+                    # starting a new task in the next tick ensures
+                    # updates from this tick are committed/streamed first
+                    __next_tick__=True,
+                )
+            return fut
+
+        # skip tasks that already have writes, eg. from pending writes or cache
+        tasks = tuple(t for t in tasks if not t.writes)
         futures: dict[concurrent.futures.Future, Optional[PregelExecutableTask]] = {}
+        futures_by_task_id: dict[str, concurrent.futures.Future] = {}
         done_futures: set[concurrent.futures.Future] = set()
+        committed: set[concurrent.futures.Future] = set()
+        committed_cond = threading.Condition()
+        batches: dict[str, _Batch] = {}
+        batches_lock = threading.Lock()
         # give control back to the caller
         yield
-        # fast path if single task with no timeout and no waiter
-        if len(tasks) == 1 and timeout is None and get_waiter is None:
+        # wait for tasks of this step started early, instead of running them
+        for t, early, efut in self._pop_eager(tasks):
+            fut = concurrent.futures.Future()
+            fut.add_done_callback(partial(on_done, t))
+            futures[fut] = t
+            futures_by_task_id[t.id] = fut
+            efut.add_done_callback(partial(adopt, t, early, fut))
+        tasks = tuple(t for t in tasks if t.id not in futures_by_task_id)
+        # fast path if single task with no timeout, no waiter and no batching
+        if (
+            len(tasks) == 1
+            and timeout is None
+            and get_waiter is None
+            and tasks[0].batch_policy is None
+        ):
             t = tasks[0]
             try:
                 run_with_retry(
@@ -171,6 +284,8 @@ class PregelRunner:
                         CONFIG_KEY_SEND: partial(writer, t),
                         CONFIG_KEY_CALL: partial(call, t),
                     },
+                    timer=self._timer(t),
+                    submit=self.submit,
                 )
                 self.commit(t, None)
             except Exception as exc:
@@ -188,20 +303,20 @@ class PregelRunner:
         if get_waiter is not None:
             futures[get_waiter()] = None
         # schedule tasks
+        started: list[_Batch] = []
         for t in tasks:
-            if not t.writes:
-                fut = self.submit(
-                    run_with_retry,
-                    t,
-                    retry_policy,
-                    configurable={
-                        CONFIG_KEY_SEND: partial(writer, t),
-                        CONFIG_KEY_CALL: partial(call, t),
-                    },
-                    __reraise_on_exit__=reraise,
-                )
-                fut.add_done_callback(partial(self.commit, t))
+            if not t.writes and t.batch_policy is not None:
+                batched(t, started)
+            elif not t.writes:
+                fut = run(t)
+                fut.add_done_callback(partial(on_done, t))
                 futures[fut] = t
+                futures_by_task_id[t.id] = fut
+        # schedule batches, once all tasks of this step were added
+        for batch in started:
+            self.submit(
+                _run_batch, batch, retry_policy, self.submit, __reraise_on_exit__=False
+            )
         # execute tasks, and wait for one to fail or all to finish.
         # each task is independent from all other concurrent tasks
         # yield updates/debug output as each task finishes
@@ -229,12 +344,40 @@ class PregelRunner:
             # maybe stop other tasks
             if _should_stop_others(done):
                 break
+            # maybe start tasks of the next step early, without waiting for
+            # them in this step
+            if self.schedule_eager is not None and inflight:
+                # the writes of finished tasks must be committed first
+                with committed_cond:
+                    committed_cond.wait_for(
+                        lambda: all(f in committed for f in done if f in done_futures)
+                    )
+                for et in self.schedule_eager():
+                    self.eager[et.id] = (
+                        et,
+                        self.submit(
+                            _run_eager,
+                            et,
+                            retry_policy,
+                            self.submit,
+                            configurable={CONFIG_KEY_CALL: _call_eager},
+                            timer=self._timer(et),
+                        ),
+                    )
             # give control back to the caller
             yield
         # wait for pending done callbacks
         # if a 2nd future finishes while `wait` is returning, it's possible
-        # that done callbacks for the 2nd future aren't called until next tick
-        time.sleep(0)
+        # that done callbacks for the 2nd future haven't finished committing
+        # its writes yet, which must happen before the loop moves on
+        with committed_cond:
+            committed_cond.wait_for(
+                lambda: all(
+                    f in committed
+                    for f in tuple(futures_by_task_id.values())
+                    if f.done()
+                )
+            )
         # panic on failure or timeout
         _panic_or_proceed(
             done_futures.union(f for f, t in futures.items() if t is not None),
@@ -278,33 +421,18 @@ class PregelRunner:
                 # schedule the next task, if the callback returns one
                 wcall = calls[idx - prev_length] if calls is not None else None
                 if next_task := self.schedule_task(task, idx, wcall):
-                    # if the parent task was retried,
-                    # the next task might already be running
-                    if fut := next(
-                        (
-                            f
-                            for f, t in futures.items()
-                            if t is not None and t == next_task.id
-                        ),
-                        None,
-                    ):
+                    if fut := futures_by_task_id.get(next_task.id):
                         # if the parent task was retried,
                         # the next task might already be running
                         rtn[idx - prev_length] = fut
                     elif next_task.writes:
                         # if it already ran, return the result
                         fut = asyncio.Future()
-                        if val := next(v for c, v in next_task.writes if c == RETURN):
-                            fut.set_result(val)
-                        elif exc := next(v for c, v in next_task.writes if c == ERROR):
-                            fut.set_exception(
-                                exc
-                                if isinstance(exc, BaseException)
-                                else Exception(exc)
-                            )
-                        else:
-                            fut.set_result(None)
+                        _set_result_from_writes(fut, next_task.writes)
                         rtn[idx - prev_length] = fut
+                    elif next_task.batch_policy is not None:
+                        # add the next task to a batch
+                        rtn[idx - prev_length] = batched(next_task, None)
                     else:
                         # schedule the next task
                         fut = cast(
@@ -318,7 +446,8 @@ class PregelRunner:
                                     CONFIG_KEY_SEND: partial(writer, next_task),
                                     CONFIG_KEY_CALL: partial(call, next_task),
                                 },
-                                __name__=t.name,
+                                timer=self._timer(next_task),
+                                __name__=next_task.name,
                                 __cancel_on_exit__=True,
                                 __reraise_on_exit__=reraise,
                                 # starting a new task in the next tick ensures
@@ -328,6 +457,7 @@ class PregelRunner:
                         )
                         fut.add_done_callback(partial(self.commit, next_task))
                         futures[fut] = next_task
+                        futures_by_task_id[next_task.id] = fut
                         rtn[idx - prev_length] = fut
             return [rtn.get(i) for i in range(len(writes))]
 
@@ -349,14 +479,111 @@ class PregelRunner:
             loop.call_soon_threadsafe(chain_future, fut, sfut)
             return sfut
 
+        def run(task: PregelExecutableTask) -> asyncio.Future:
+            return cast(
+                asyncio.Future,
+                self.submit(
+                    arun_with_retry,
+                    task,
+                    retry_policy,
+                    stream=self.use_astream,
+                    configurable={
+                        CONFIG_KEY_SEND: partial(writer, task),
+                        CONFIG_KEY_CALL: partial(call, task),
+                    },
+                    timer=self._timer(task),
+                    __name__=task.name,
+                    __cancel_on_exit__=True,
+                    __reraise_on_exit__=reraise,
+                ),
+            )
+
+        def adopt(
+            task: PregelExecutableTask,
+            early: PregelExecutableTask,
+            fut: asyncio.Future,
+            efut: asyncio.Future,
+        ) -> None:
+            if fut.done():
+                return
+            elif not efut.cancelled() and efut.result():
+                # keep the writes of the early run
+                task.writes.extend(early.writes)
+                fut.set_result(None)
+            else:
+                # it failed or can't be kept, run it again
+                chain_future(run(task), fut)
+
+        def batched(
+            task: PregelExecutableTask, started: Optional[list[_Batch]]
+        ) -> asyncio.Future:
+            # the future of each task is resolved when its batch finishes
+            fut = loop.create_future()
+            fut.add_done_callback(partial(self.commit, task))
+            futures[fut] = task
+            futures_by_task_id[task.id] = fut
+            configurable = {
+                CONFIG_KEY_SEND: partial(writer, task),
+                CONFIG_KEY_CALL: partial(call, task),
+            }
+            timer = self._timer(task)
+            config = _batch_config(task)
+            with batches_lock:
+                # add to the batch of the node, or start a new one
+                batch = batches.get(task.name)
+                if batch is not None:
+                    if batch.add(task, fut, configurable, timer, config):
+                        return fut
+                    # it gets no more tasks once replaced, don't wait for them
+                    batch.notify()
+                ready = asyncio.Event()
+                batch = batches[task.name] = _Batch(
+                    cast(BatchPolicy, task.batch_policy),
+                    ready,
+                    partial(loop.call_soon_threadsafe, ready.set),
+                )
+                batch.add(task, fut, configurable, timer, config)
+            if started is not None:
+                started.append(batch)
+            else:
+                self.submit(
+                    _arun_batch,
+                    batch,
+                    retry_policy,
+                    __name__=task.name,
+                    __cancel_on_exit__=True,
+                    __reraise_on_exit__=False,
+                    # starting a new task in the next tick ensures
+                    # updates from this tick are committed/streamed first
+                    __next_tick__=True,
+                )
+            return fut
+
         loop = asyncio.get_event_loop()
-        tasks = tuple(tasks)
+        # skip tasks that already have writes, eg. from pending writes or cache
+        tasks = tuple(t for t in tasks if not t.writes)
         futures: dict[asyncio.Future, Optional[PregelExecutableTask]] = {}
+        futures_by_task_id: dict[str, asyncio.Future] = {}
         done_futures: set[asyncio.Future] = set()
+        batches: dict[str, _Batch] = {}
+        batches_lock = threading.Lock()
         # give control back to the caller
         yield
-        # fast path if single task with no waiter and no timeout
-        if len(tasks) == 1 and get_waiter is None and timeout is None:
+        # wait for tasks of this step started early, instead of running them
+        for t, early, efut in self._pop_eager(tasks):
+            fut = loop.create_future()
+            fut.add_done_callback(partial(self.commit, t))
+            futures[fut] = t
+            futures_by_task_id[t.id] = fut
+            efut.add_done_callback(partial(adopt, t, early, fut))
+        tasks = tuple(t for t in tasks if t.id not in futures_by_task_id)
+        # fast path if single task with no waiter, no timeout and no batching
+        if (
+            len(tasks) == 1
+            and get_waiter is None
+            and timeout is None
+            and tasks[0].batch_policy is None
+        ):
             t = tasks[0]
             try:
                 await arun_with_retry(
@@ -367,6 +594,7 @@ class PregelRunner:
                         CONFIG_KEY_SEND: partial(writer, t),
                         CONFIG_KEY_CALL: partial(call, t),
                     },
+                    timer=self._timer(t),
                 )
                 self.commit(t, None)
             except Exception as exc:
@@ -384,26 +612,25 @@ class PregelRunner:
         if get_waiter is not None:
             futures[get_waiter()] = None
         # schedule tasks
+        started: list[_Batch] = []
         for t in tasks:
-            if not t.writes:
-                fut = cast(
-                    asyncio.Future,
-                    self.submit(
-                        arun_with_retry,
-                        t,
-                        retry_policy,
-                        stream=self.use_astream,
-                        configurable={
-                            CONFIG_KEY_SEND: partial(writer, t),
-                            CONFIG_KEY_CALL: partial(call, t),
-                        },
-                        __name__=t.name,
-                        __cancel_on_exit__=True,
-                        __reraise_on_exit__=reraise,
-                    ),
-                )
+            if not t.writes and t.batch_policy is not None:
+                batched(t, started)
+            elif not t.writes:
+                fut = run(t)
                 fut.add_done_callback(partial(self.commit, t))
                 futures[fut] = t
+                futures_by_task_id[t.id] = fut
+        # schedule batches, once all tasks of this step were added
+        for batch in started:
+            self.submit(
+                _arun_batch,
+                batch,
+                retry_policy,
+                __name__=batch.tasks[0].name,
+                __cancel_on_exit__=True,
+                __reraise_on_exit__=False,
+            )
         # execute tasks, and wait for one to fail or all to finish.
         # each task is independent from all other concurrent tasks
         # yield updates/debug output as each task finishes
@@ -431,6 +658,23 @@ class PregelRunner:
             # maybe stop other tasks
             if _should_stop_others(done):
                 break
+            # maybe start tasks of the next step early, without waiting for
+            # them in this step
+            if self.schedule_eager is not None and inflight:
+                for et in self.schedule_eager():
+                    self.eager[et.id] = (
+                        et,
+                        self.submit(
+                            _arun_eager,
+                            et,
+                            retry_policy,
+                            self.use_astream,
+                            configurable={CONFIG_KEY_CALL: _call_eager},
+                            timer=self._timer(et),
+                            __name__=et.name,
+                            __cancel_on_exit__=True,
+                        ),
+                    )
             # give control back to the caller
             yield
         # wait for pending done callbacks
@@ -447,12 +691,47 @@ class PregelRunner:
             panic=reraise,
         )
 
+    def _pop_eager(
+        self, tasks: Sequence[PregelExecutableTask]
+    ) -> list[
+        tuple[
+            PregelExecutableTask,
+            PregelExecutableTask,
+            Union[concurrent.futures.Future, asyncio.Future],
+        ]
+    ]:
+        """Get the tasks started early in the previous step which can be kept,
+        with their early run and its future, cancelling all others."""
+        eager, self.eager = self.eager, {}
+        kept = []
+        for t in tasks:
+            if (
+                (entry := eager.pop(t.id, None)) is not None
+                and self.keep_eager is not None
+                and self.keep_eager(t.id)
+            ):
+                kept.append((t, *entry))
+        for task_id, (_, fut) in eager.items():
+            fut.cancel()
+            self.timers.pop(task_id, None)
+        return kept
+
+    def _timer(self, task: PregelExecutableTask) -> Optional[TaskTimer]:
+        """Start timing a task, if task metrics are requested."""
+        if self.task_finished is None:
+            return None
+        timer = self.timers[task.id] = TaskTimer()
+        return timer
+
     def commit(
         self,
         task: PregelExecutableTask,
         fut: Union[None, concurrent.futures.Future[Any], asyncio.Future[Any]],
         exception: Optional[BaseException] = None,
     ) -> None:
+        if self.task_finished is not None and (timer := self.timers.pop(task.id, None)):
+            timer.finish()
+            self.task_finished(task, timer)
         if fut is not None:
             exception = _exception(fut)
         if isinstance(exception, asyncio.CancelledError):
@@ -484,6 +763,272 @@ class PregelRunner:
             self.put_writes(task.id, task.writes)
 
 
+class _Batch:
+    """Tasks of a node with a batch policy, run together in a single invocation
+    of the node, with the list of their inputs. Only tasks with the same config,
+    apart from the keys set for each task, are batched together."""
+
+    def __init__(
+        self,
+        policy: BatchPolicy,
+        ready: Union[threading.Event, asyncio.Event],
+        notify: Callable[[], Any],
+    ) -> None:
+        self.policy = policy
+        # set once the batch is full
+        self.ready = ready
+        self.notify = notify
+        self.tasks: list[PregelExecutableTask] = []
+        self.futures: list[Union[concurrent.futures.Future, asyncio.Future]] = []
+        self.configurables: list[dict[str, Any]] = []
+        self.timers: list[Optional[TaskTimer]] = []
+        # config shared by the tasks, see _batch_config
+        self.config: Optional[dict[str, Any]] = None
+        self.closed = False
+        self.lock = threading.Lock()
+
+    def add(
+        self,
+        task: PregelExecutableTask,
+        fut: Union[concurrent.futures.Future, asyncio.Future],
+        configurable: dict[str, Any],
+        timer: Optional[TaskTimer],
+        config: dict[str, Any],
+    ) -> bool:
+        """Add a task to the batch, unless it already started, is full, or has
+        another config than the tasks in it."""
+        with self.lock:
+            if self.closed or len(self.tasks) >= self.policy.max_size:
+                return False
+            if not self.tasks:
+                self.config = config
+            elif config != self.config:
+                return False
+            self.tasks.append(task)
+            self.futures.append(fut)
+            self.configurables.append(configurable)
+            self.timers.append(timer)
+            if len(self.tasks) >= self.policy.max_size:
+                self.notify()
+            return True
+
+    def start(self) -> PregelExecutableTask:
+        """Close the batch to new tasks, returning a task that runs the node
+        once with the inputs of all tasks."""
+        with self.lock:
+            self.closed = True
+        for timer in self.timers:
+            if timer is not None:
+                timer.start()
+        return self.tasks[0]._replace(
+            input=[t.input for t in self.tasks], writes=deque()
+        )
+
+    def check(self, outputs: Any) -> None:
+        """Check the node returned one output per task."""
+        name = self.tasks[0].name
+        if not isinstance(outputs, (list, tuple)):
+            raise InvalidUpdateError(
+                f"Node '{name}' has a batch policy, expected a list of outputs, "
+                f"got {type(outputs).__name__}"
+            )
+        if len(outputs) != len(self.tasks):
+            raise InvalidUpdateError(
+                f"Node '{name}' has a batch policy, expected {len(self.tasks)} "
+                f"outputs, got {len(outputs)}"
+            )
+
+
+# configurable keys and metadata set for each task, which are allowed to differ
+# between tasks batched together
+_TASK_CONFIGURABLE_KEYS = frozenset(
+    (CONFIG_KEY_TASK_ID, CONFIG_KEY_SEND, CONFIG_KEY_READ, CONFIG_KEY_CHECKPOINT_NS)
+)
+_TASK_METADATA_KEYS = frozenset(("langgraph_path", "langgraph_checkpoint_ns"))
+
+
+def _batch_config(task: PregelExecutableTask) -> dict[str, Any]:
+    """Config of a task, without the keys set for each task. The callbacks are
+    left out too, as each task gets its own child of the step's callbacks.
+    Of the pending writes, only the resume values read by `interrupt` are kept,
+    so that tasks resumed with different values are batched separately."""
+    config: dict[str, Any] = {k: v for k, v in task.config.items() if k != "callbacks"}
+    config[CONF] = {
+        k: v for k, v in config[CONF].items() if k not in _TASK_CONFIGURABLE_KEYS
+    }
+    if CONFIG_KEY_WRITES in config[CONF]:
+        config[CONF][CONFIG_KEY_WRITES] = [
+            (c, v) for _, c, v in config[CONF][CONFIG_KEY_WRITES] if c == RESUME
+        ]
+    if "metadata" in config:
+        config["metadata"] = {
+            k: v for k, v in config["metadata"].items() if k not in _TASK_METADATA_KEYS
+        }
+    return config
+
+
+def _call_in_batch(*args: Any, **kwargs: Any) -> Any:
+    """Calls of tasks made by a node run for a batch of tasks, which can't be
+    attributed to one of them."""
+    raise RuntimeError("Nodes with a batch policy can't call tasks")
+
+
+def _run_batch(
+    batch: _Batch, retry_policy: Optional[RetryPolicy], submit: Submit
+) -> None:
+    """Run a batch of tasks, once full or after waiting for more tasks, and
+    write the output of each task. Never raises, the outcome of each task
+    is set on its future instead."""
+    if batch.policy.max_wait:
+        cast(threading.Event, batch.ready).wait(batch.policy.max_wait)
+    try:
+        outputs = run_with_retry(
+            batch.start(),
+            retry_policy,
+            # the node is run with the config of the first task, which the
+            # others share apart from the keys set for each task
+            configurable={**batch.configurables[0], CONFIG_KEY_CALL: _call_in_batch},
+            submit=submit,
+        )
+        batch.check(outputs)
+    except Exception as exc:
+        for fut in batch.futures:
+            _set_outcome(fut, exc)
+        return
+    for task, output, configurable, fut in zip(
+        batch.tasks, outputs, batch.configurables, batch.futures
+    ):
+        try:
+            task.writes.clear()
+            config = patch_configurable(task.config, configurable)
+            if len(task.writers) > 1:
+                RunnableSeq(*task.writers).invoke(output, config)
+            elif task.writers:
+                task.writers[0].invoke(output, config)
+        except Exception as exc:
+            _set_outcome(fut, exc)
+        else:
+            _set_outcome(fut, None)
+
+
+async def _arun_batch(batch: _Batch, retry_policy: Optional[RetryPolicy]) -> None:
+    """Async version of _run_batch."""
+    try:
+        if batch.policy.max_wait:
+            try:
+                await asyncio.wait_for(
+                    cast(asyncio.Event, batch.ready).wait(), batch.policy.max_wait
+                )
+            except asyncio.TimeoutError:
+                pass
+        try:
+            outputs = await arun_with_retry(
+                batch.start(),
+                retry_policy,
+                configurable={
+                    **batch.configurables[0],
+                    CONFIG_KEY_CALL: _call_in_batch,
+                },
+            )
+            batch.check(outputs)
+        except Exception as exc:
+            for fut in batch.futures:
+                _set_outcome(fut, exc)
+            return
+        for task, output, configurable, fut in zip(
+            batch.tasks, outputs, batch.configurables, batch.futures
+        ):
+            try:
+                task.writes.clear()
+                config = patch_configurable(task.config, configurable)
+                if len(task.writers) > 1:
+                    await RunnableSeq(*task.writers).ainvoke(output, config)
+                elif task.writers:
+                    await task.writers[0].ainvoke(output, config)
+            except Exception as exc:
+                _set_outcome(fut, exc)
+            else:
+                _set_outcome(fut, None)
+    except asyncio.CancelledError:
+        for fut in batch.futures:
+            fut.cancel()
+        raise
+
+
+def _set_outcome(
+    fut: Union[concurrent.futures.Future, asyncio.Future],
+    exception: Optional[BaseException],
+) -> None:
+    """Resolve the future of a batched task."""
+    try:
+        if exception is None:
+            fut.set_result(None)
+        else:
+            fut.set_exception(exception)
+    except (concurrent.futures.InvalidStateError, asyncio.InvalidStateError):
+        # eg. cancelled after another task failed
+        pass
+
+
+def _run_eager(
+    task: PregelExecutableTask,
+    retry_policy: Optional[RetryPolicy],
+    submit: Submit,
+    configurable: dict[str, Any],
+    timer: Optional[TaskTimer],
+) -> bool:
+    """Run a task of the next step started early. Returns whether its writes can
+    be kept, instead of raising, as it mustn't fail the current step. Those of
+    a task that failed or scheduled other tasks are not kept, and the task is
+    run again in its own step."""
+    try:
+        run_with_retry(
+            task, retry_policy, configurable=configurable, timer=timer, submit=submit
+        )
+    except Exception:
+        return False
+    return all(w[0] != PUSH for w in task.writes)
+
+
+async def _arun_eager(
+    task: PregelExecutableTask,
+    retry_policy: Optional[RetryPolicy],
+    stream: bool,
+    configurable: dict[str, Any],
+    timer: Optional[TaskTimer],
+) -> bool:
+    """Async version of _run_eager."""
+    try:
+        await arun_with_retry(
+            task, retry_policy, stream=stream, configurable=configurable, timer=timer
+        )
+    except Exception:
+        return False
+    return all(w[0] != PUSH for w in task.writes)
+
+
+def _call_eager(*args: Any, **kwargs: Any) -> Any:
+    """Calls of tasks made by a task started early, which can't be scheduled
+    before its step."""
+    raise RuntimeError("Tasks can't be called by a node started before its step")
+
+
+def _set_result_from_writes(
+    fut: Union[concurrent.futures.Future[Any], asyncio.Future[Any]],
+    writes: Sequence[tuple[str, Any]],
+) -> None:
+    """Resolve the future of a task that already ran, from its saved writes."""
+    for c, v in writes:
+        if c == RETURN:
+            fut.set_result(v)
+            return
+    for c, v in writes:
+        if c == ERROR:
+            fut.set_exception(v if isinstance(v, BaseException) else Exception(v))
+            return
+    fut.set_result(None)
+
+
 def _should_stop_others(
     done: Union[set[concurrent.futures.Future[Any]], set[asyncio.Future[Any]]],
 ) -> bool:
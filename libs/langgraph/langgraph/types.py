@@ -1,5 +1,8 @@
 import dataclasses
+import hashlib
+import json
 import sys
+import threading
 from collections import deque
 from typing import (
     TYPE_CHECKING,
@@ -27,6 +30,7 @@ from langgraph.checkpoint.base import (
     CheckpointMetadata,
     PendingWrite,
 )
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
 if TYPE_CHECKING:
     from langgraph.store.base import BaseStore
@@ -47,7 +51,7 @@ Checkpointer = Union[None, Literal[False], BaseCheckpointSaver]
 """Type of the checkpointer to use for a subgraph. False disables checkpointing,
 even if the parent graph has a checkpointer. None inherits checkpointer."""
 
-StreamMode = Literal["values", "updates", "debug", "messages", "custom"]
+StreamMode = Literal["values", "updates", "debug", "messages", "custom", "metrics"]
 """How the stream method should emit outputs.
 
 - 'values': Emit all values of the state for each step.
@@ -56,6 +60,18 @@ StreamMode = Literal["values", "updates", "debug", "messages", "custom"]
 - 'debug': Emit debug events for each step.
 - 'messages': Emit LLM messages token-by-token.
 - 'custom': Emit custom output `write: StreamWriter` kwarg of each node.
+- 'metrics': Emit timings of each step, task and checkpointer call.
+"""
+
+Durability = Literal["sync", "async", "exit"]
+"""When checkpoints are saved during a run.
+
+- 'sync': Save the checkpoint of each step before starting the next step.
+- 'async': Save the checkpoint of each step in the background, while the next
+    step runs.
+- 'exit': Only save the last checkpoint, when the run completes, is
+    interrupted or fails. Intermediate checkpoints are kept in memory only,
+    except those that checkpoints of subgraphs refer to as their parent.
 """
 
 StreamWriter = Callable[[Any], None]
@@ -63,6 +79,35 @@ StreamWriter = Callable[[Any], None]
 Always injected into nodes if requested as a keyword argument, but it's a no-op
 when not using stream_mode="custom"."""
 
+
+class CancellationToken:
+    """Signals a node that its attempt was cancelled, eg. after its timeout.
+
+    Injected into nodes if requested as a `cancel_token` keyword argument, or
+    None for nodes whose attempts are never cancelled, ie. without a timeout or
+    hedging. Sync nodes can't be interrupted, so long-running ones should check
+    `cancelled` regularly, and return early once set. Their writes are discarded."""
+
+    __slots__ = ("_event",)
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the attempt was cancelled."""
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Cancel the attempt."""
+        self._event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the attempt is cancelled, or the timeout passes. Returns
+        whether the attempt was cancelled, eg. to use instead of `time.sleep()`."""
+        return self._event.wait(timeout)
+
+
 if sys.version_info >= (3, 10):
     _DC_KWARGS = {"kw_only": True, "slots": True, "frozen": True}
 else:
@@ -73,7 +118,9 @@ def default_retry_on(exc: Exception) -> bool:
     import httpx
     import requests
 
-    if isinstance(exc, ConnectionError):
+    from langgraph.errors import NodeTimeoutError
+
+    if isinstance(exc, (ConnectionError, NodeTimeoutError)):
         return True
     if isinstance(
         exc,
@@ -117,12 +164,112 @@ class RetryPolicy(NamedTuple):
         Type[Exception], Sequence[Type[Exception]], Callable[[Exception], bool]
     ] = default_retry_on
     """List of exception classes that should trigger a retry, or a callable that returns True for exceptions that should trigger a retry."""
+    hedge_after: Optional[float] = None
+    """Amount of time after which a duplicate attempt is started, if the first one
+    hasn't finished yet. The outcome of the first attempt to succeed is used, and
+    the other one is cancelled. In seconds. Defaults to None, no hedging.
+
+    Duplicate attempts run concurrently, so the node must be safe to run twice,
+    and shouldn't call subgraphs. Only the writes and stream output of the attempt
+    used are sent, and nodes with hedging can't call tasks."""
+    hedge_percentile: Optional[float] = None
+    """Percentile of the recent latencies of the node after which a duplicate attempt
+    is started, eg. 95. Until enough latencies are recorded, `hedge_after` is used."""
+
+
+class _CacheKeySerializer(JsonPlusSerializer):
+    """Serializes node inputs to JSON with sorted keys and set items, so that the
+    same input is serialized the same in every process."""
+
+    def _default(self, obj: Any) -> Union[str, dict[str, Any]]:
+        if isinstance(obj, (set, frozenset)):
+            return self._encode_constructor_args(
+                type(obj), args=(sorted(self.dumps(item).decode() for item in obj),)
+            )
+        return super()._default(obj)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj, default=self._default, sort_keys=True, separators=(",", ":")
+        ).encode()
+
+
+_CACHE_KEY_SERDE = _CacheKeySerializer()
+
+
+def default_cache_key(input: Any) -> str:
+    """Default cache key for a node, a hash of its input serialized to JSON with
+    sorted keys, which is the same in every process."""
+    return hashlib.sha256(_CACHE_KEY_SERDE.dumps(input)).hexdigest()
 
 
 class CachePolicy(NamedTuple):
-    """Configuration for caching nodes."""
+    """Configuration for caching nodes.
+
+    Results are cached per node, and shared across threads using the same cache."""
+
+    key_func: Callable[[Any], str] = default_cache_key
+    """Function to generate a cache key from the node input.
+    Defaults to a hash of the input serialized to JSON with sorted keys."""
+    ttl: Optional[int] = None
+    """Time to live for the cache entry in seconds. If None, the entry never expires."""
+
+
+class BatchPolicy(NamedTuple):
+    """Configuration for running the tasks of a node in batches.
+
+    The node is invoked once per batch, with the list of the inputs of its tasks,
+    and must return the list of their outputs, in the same order. Only tasks with
+    the same config, apart from the keys set for each task, eg. its id, are
+    batched together, and the node is invoked with the config of the first one.
+    The node can't call tasks."""
+
+    max_size: int = 64
+    """Maximum number of tasks in a batch."""
+    max_wait: Optional[float] = None
+    """Seconds a batch that isn't full waits for more tasks, eg. pushed by other
+    tasks of the same step, before it starts. None to start right away."""
+
+
+class CacheKey(NamedTuple):
+    """Cache key of a task, derived from its node's cache policy and input."""
+
+    ns: tuple[str, ...]
+    """Namespace of the cache entry, the graph namespace and the node name."""
+    key: str
+    """Key of the cache entry, the output of the policy's key function."""
+    ttl: Optional[int]
+    """Time to live for the cache entry in seconds."""
+
+
+class StreamBufferPolicy(NamedTuple):
+    """Configuration for bounding the buffer of chunks waiting to be streamed."""
+
+    maxsize: int = 1024
+    """Number of chunks buffered before `on_full` applies."""
+    on_full: Literal["block", "drop_oldest", "coalesce"] = "block"
+    """What to do with a new chunk when the buffer is full.
+
+    - 'block': Block the producer until the consumer catches up. Only producers
+        running in other threads, eg. sync nodes, can be blocked, chunks from
+        the graph loop itself or from the event loop are always buffered.
+    - 'drop_oldest': Discard the oldest buffered chunk.
+    - 'coalesce': Merge a "messages" chunk into the last buffered chunk, if both
+        are chunks of the same message, otherwise block as with 'block'.
+    """
+
+
+class StreamCoalescePolicy(NamedTuple):
+    """Configuration for merging the message chunks of a chat model run, before
+    emitting them with stream_mode="messages".
+
+    Chunks are held until either limit is reached, or the model run ends."""
 
-    pass
+    max_wait: Optional[float] = 0.03
+    """Seconds since the last emitted chunk of the run, after which the next
+    chunk is emitted along with those held. None to only merge by count."""
+    max_chunks: Optional[int] = None
+    """Number of chunks to merge into one. None to only merge by time."""
 
 
 @dataclasses.dataclass(**_DC_KWARGS)
@@ -156,6 +303,8 @@ class PregelExecutableTask(NamedTuple):
     path: tuple[Union[str, int, tuple], ...]
     scheduled: bool = False
     writers: Sequence[Runnable] = ()
+    batch_policy: Optional[BatchPolicy] = None
+    timeout: Optional[float] = None
 
 
 class StateSnapshot(NamedTuple):
@@ -346,6 +495,8 @@ class PregelScratchpad(TypedDict, total=False):
     interrupt_counter: int
     used_null_resume: bool
     resume: list[Any]
+    # whether a subgraph saved a checkpoint referring to the task's checkpoint
+    subgraph_checkpointed: bool
 
 
 def interrupt(value: Any) -> Any:
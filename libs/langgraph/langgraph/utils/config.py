@@ -175,6 +175,67 @@ def patch_config(
     return config
 
 
+def patch_task_config(
+    config: RunnableConfig,
+    *,
+    metadata: dict[str, Any],
+    tags: Optional[Sequence[str]],
+    run_name: str,
+    callbacks: Optional[BaseCallbackManager],
+    configurable: dict[str, Any],
+) -> RunnableConfig:
+    """Create the config of a task in a single copy of the parent config, as
+
+    ```python
+    patch_config(
+        merge_configs(config, {"metadata": metadata, "tags": tags}),
+        run_name=run_name,
+        callbacks=callbacks,
+        configurable=configurable,
+    )
+    ```
+
+    would, without copying the parent config, its callbacks and its configurable
+    more than once for every task.
+    """
+    task_config = config.copy()
+    if parent_metadata := config.get("metadata"):
+        task_config["metadata"] = {**parent_metadata, **metadata}
+    else:
+        task_config["metadata"] = metadata
+    if tags:
+        task_config["tags"] = [*config.get("tags", ()), *tags]
+    if callbacks is not None:
+        # replacing the callbacks, unset the run id of the parent run
+        task_config["callbacks"] = callbacks
+        task_config.pop("run_id", None)
+    elif isinstance(
+        parent_callbacks := config.get("callbacks"), (list, BaseCallbackManager)
+    ):
+        task_config["callbacks"] = parent_callbacks.copy()
+    task_config["run_name"] = run_name
+    if parent_configurable := config.get(CONF):
+        task_config[CONF] = {**parent_configurable, **configurable}
+    else:
+        task_config[CONF] = configurable
+    return task_config
+
+
+def has_no_handlers(config: RunnableConfig) -> bool:
+    """Whether the callbacks of a config are a manager without any handlers.
+
+    Callback managers of a graph run already include the handlers configured
+    globally, eg. for tracing, so runnables called with such a config can skip
+    the callback manager altogether.
+    """
+    callbacks = config.get("callbacks")
+    return (
+        isinstance(callbacks, BaseCallbackManager)
+        and not callbacks.handlers
+        and not callbacks.inheritable_handlers
+    )
+
+
 def get_callback_manager_for_config(
     config: RunnableConfig, tags: Optional[Sequence[str]] = None
 ) -> CallbackManager:
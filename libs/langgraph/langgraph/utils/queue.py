@@ -7,15 +7,120 @@ import threading
 import types
 from collections import deque
 from time import monotonic
-from typing import Optional
+from typing import Any, Literal, Optional
+
+from langchain_core.messages import BaseMessageChunk
 
 PY_310 = sys.version_info >= (3, 10)
 
+OnFull = Literal["block", "drop_oldest", "coalesce"]
+
+
+def coalesce_chunks(prev: Any, item: Any) -> Optional[Any]:
+    """Merge a "messages" stream chunk into the previous one, if both are chunks
+    of the same message, with the same namespace and metadata.
+    Returns None if they can't be merged."""
+    ns, mode, payload = item
+    if mode != "messages" or prev[1] != mode or prev[0] != ns:
+        return None
+    msg, meta = payload
+    prev_msg, prev_meta = prev[2]
+    if (
+        type(msg) is not type(prev_msg)
+        or not isinstance(msg, BaseMessageChunk)
+        or msg.id is None
+        or msg.id != prev_msg.id
+        or meta != prev_meta
+    ):
+        return None
+    return (ns, mode, (prev_msg + msg, prev_meta))
+
+
+def _in_loop(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
 
 class AsyncQueue(asyncio.Queue):
-    """Async unbounded FIFO queue with a wait() method.
+    """Async FIFO queue with a wait() method.
+
+    Subclassed from asyncio.Queue, adding a wait() method, and an optional
+    bound, applied according to `on_full` once `maxsize` items are queued.
+    Unlike asyncio.Queue, put_nowait() never raises QueueFull."""
+
+    def __init__(self, maxsize: Optional[int] = None, on_full: OnFull = "block"):
+        super().__init__()
+        self.limit = maxsize
+        self.on_full = on_full
+        # number of items discarded by the "drop_oldest" policy
+        self.dropped = 0
+        self.closed = False
+        self._not_full = threading.Condition(threading.Lock())
+        self._pending = 0
+
+    def _full(self) -> bool:
+        return self.limit is not None and len(self._queue) >= self.limit
+
+    def put_nowait(self, item) -> None:
+        if self._full():
+            if self.on_full == "drop_oldest":
+                self._queue.popleft()
+                self.dropped += 1
+            elif self.on_full == "coalesce" and (
+                merged := coalesce_chunks(self._queue[-1], item)
+            ):
+                self._queue[-1] = merged
+                return
+        super().put_nowait(item)
+
+    def put_threadsafe(self, loop: asyncio.AbstractEventLoop, item) -> None:
+        """Put the item on the queue from any thread.
 
-    Subclassed from asyncio.Queue, adding a wait() method."""
+        If the queue is full and `on_full` is "block" (or "coalesce" and the item
+        can't be merged), callers in other threads block until the consumer
+        catches up or the queue is closed. Callers in the event loop never block.
+        """
+        if self.limit is None or self.on_full == "drop_oldest":
+            loop.call_soon_threadsafe(self.put_nowait, item)
+            return
+        in_loop = _in_loop(loop)
+        with self._not_full:
+            # items put from other threads are only queued once the loop runs
+            while (
+                not in_loop
+                and not self.closed
+                and self._pending + len(self._queue) >= self.limit
+            ):
+                if (
+                    self.on_full == "coalesce"
+                    and not self._pending
+                    and self._queue
+                    and coalesce_chunks(self._queue[-1], item)
+                ):
+                    break
+                self._not_full.wait()
+            self._pending += 1
+        loop.call_soon_threadsafe(self._put_pending, item)
+
+    def _put_pending(self, item) -> None:
+        with self._not_full:
+            self._pending -= 1
+        self.put_nowait(item)
+
+    def get_nowait(self):
+        item = super().get_nowait()
+        if self.limit is not None:
+            with self._not_full:
+                self._not_full.notify()
+        return item
+
+    def close(self) -> None:
+        """Stop blocking producers, eg. once the consumer is done."""
+        with self._not_full:
+            self.closed = True
+            self._not_full.notify_all()
 
     async def wait(self) -> None:
         """If queue is empty, wait until an item is available.
@@ -74,21 +179,54 @@ class Semaphore(threading.Semaphore):
 
 
 class SyncQueue:
-    """Unbounded FIFO queue with a wait() method.
+    """FIFO queue with a wait() method.
     Adapted from pure Python implementation of queue.SimpleQueue.
+
+    Unbounded unless `maxsize` is set, in which case `on_full` applies once
+    `maxsize` items are queued. Only threads other than the one that created
+    the queue, ie. the consumer, are ever blocked.
     """
 
-    def __init__(self):
+    def __init__(self, maxsize: Optional[int] = None, on_full: OnFull = "block"):
         self._queue = deque()
         self._count = Semaphore(0)
+        self.maxsize = maxsize
+        self.on_full = on_full
+        # number of items discarded by the "drop_oldest" policy
+        self.dropped = 0
+        self.closed = False
+        self._not_full = threading.Condition(threading.Lock())
+        self._consumer = threading.get_ident()
 
     def put(self, item, block=True, timeout=None):
         """Put the item on the queue.
 
-        The optional 'block' and 'timeout' arguments are ignored, as this method
-        never blocks.  They are provided for compatibility with the Queue class.
+        If the queue is full and `on_full` is "block" (or "coalesce" and the item
+        can't be merged), block until the consumer catches up, unless 'block'
+        is false, the caller is the consumer or the queue is closed. The optional
+        'timeout' argument is ignored, it is provided for compatibility with the
+        Queue class.
         """
-        self._queue.append(item)
+        if self.maxsize is None:
+            self._queue.append(item)
+            self._count.release()
+            return
+        with self._not_full:
+            while len(self._queue) >= self.maxsize:
+                if self.on_full == "drop_oldest":
+                    self._queue.popleft()
+                    self._queue.append(item)
+                    self.dropped += 1
+                    return
+                if self.on_full == "coalesce" and (
+                    merged := coalesce_chunks(self._queue[-1], item)
+                ):
+                    self._queue[-1] = merged
+                    return
+                if not block or self.closed or threading.get_ident() == self._consumer:
+                    break
+                self._not_full.wait()
+            self._queue.append(item)
         self._count.release()
 
     def get(self, block=True, timeout=None):
@@ -106,10 +244,18 @@ class SyncQueue:
             raise ValueError("'timeout' must be a non-negative number")
         if not self._count.acquire(block, timeout):
             raise queue.Empty
-        try:
-            return self._queue.popleft()
-        except IndexError:
-            raise queue.Empty
+        if self.maxsize is None:
+            try:
+                return self._queue.popleft()
+            except IndexError:
+                raise queue.Empty
+        with self._not_full:
+            try:
+                item = self._queue.popleft()
+            except IndexError:
+                raise queue.Empty
+            self._not_full.notify()
+            return item
 
     def wait(self, block=True, timeout=None):
         """If queue is empty, wait until an item maybe is available,
@@ -119,6 +265,12 @@ class SyncQueue:
             raise ValueError("'timeout' must be a non-negative number")
         self._count.wait(block, timeout)
 
+    def close(self):
+        """Stop blocking producers, eg. once the consumer is done."""
+        with self._not_full:
+            self.closed = True
+            self._not_full.notify_all()
+
     def empty(self):
         """Return True if the queue is empty, False otherwise (not reliable!)."""
         return len(self._queue) == 0
@@ -34,13 +34,19 @@ from langchain_core.runnables.utils import Input
 from langchain_core.tracers._streaming import _StreamingCallbackHandler
 from typing_extensions import TypeGuard
 
-from langgraph.constants import CONF, CONFIG_KEY_STORE, CONFIG_KEY_STREAM_WRITER
+from langgraph.constants import (
+    CONF,
+    CONFIG_KEY_CANCEL_TOKEN,
+    CONFIG_KEY_STORE,
+    CONFIG_KEY_STREAM_WRITER,
+)
 from langgraph.store.base import BaseStore
-from langgraph.types import StreamWriter
+from langgraph.types import CancellationToken, StreamWriter
 from langgraph.utils.config import (
     ensure_config,
     get_async_callback_manager_for_config,
     get_callback_manager_for_config,
+    has_no_handlers,
     patch_config,
 )
 
@@ -73,6 +79,20 @@ KWARGS_CONFIG_KEYS: tuple[tuple[str, tuple[Any, ...], str, Any], ...] = (
         CONFIG_KEY_STORE,
         inspect.Parameter.empty,
     ),
+    (
+        sys.intern("cancel_token"),
+        (
+            CancellationToken,
+            "CancellationToken",
+            Optional[CancellationToken],
+            "Optional[CancellationToken]",
+            inspect.Parameter.empty,
+        ),
+        CONFIG_KEY_CANCEL_TOKEN,
+        # only attempts that can be cancelled, ie. of tasks with a timeout or
+        # hedged, get a token of their own
+        None,
+    ),
 )
 """List of kwargs that can be passed to functions, and their corresponding
 config keys, default values and type annotations."""
@@ -161,7 +181,13 @@ class RunnableCallable(Runnable):
                 kwargs[kw] = _conf.get(ck, defv)
 
         context = copy_context()
-        if self.trace:
+        if self.trace and has_no_handlers(config):
+            # no handlers to notify, run the function as a child run directly
+            config.pop("run_id", None)
+            child_config = patch_config(config, callbacks=config["callbacks"])
+            context.run(_set_config_context, child_config)
+            ret = context.run(self.func, input, **kwargs)
+        elif self.trace:
             callback_manager = get_callback_manager_for_config(config, self.tags)
             run_manager = callback_manager.on_chain_start(
                 None,
@@ -208,7 +234,17 @@ class RunnableCallable(Runnable):
             elif kwargs.get(kw) is None:
                 kwargs[kw] = _conf.get(ck, defv)
         context = copy_context()
-        if self.trace:
+        if self.trace and has_no_handlers(config):
+            # no handlers to notify, run the function as a child run directly
+            config.pop("run_id", None)
+            child_config = patch_config(config, callbacks=config["callbacks"])
+            context.run(_set_config_context, child_config)
+            coro = cast(Coroutine[None, None, Any], self.afunc(input, **kwargs))
+            if ASYNCIO_ACCEPTS_CONTEXT:
+                ret = await asyncio.create_task(coro, context=context)
+            else:
+                ret = await coro
+        elif self.trace:
             callback_manager = get_async_callback_manager_for_config(config, self.tags)
             run_manager = await callback_manager.on_chain_start(
                 None,
@@ -387,6 +423,16 @@ class RunnableSeq(Runnable):
     ) -> Any:
         if config is None:
             config = ensure_config()
+        if has_no_handlers(config):
+            # no handlers to notify, invoke all steps with the same child config
+            config.pop("run_id", None)
+            config = patch_config(config, callbacks=config["callbacks"])
+            for i, step in enumerate(self.steps):
+                if i == 0:
+                    input = step.invoke(input, config, **kwargs)
+                else:
+                    input = step.invoke(input, config)
+            return input
         # setup callbacks and context
         callback_manager = get_callback_manager_for_config(config)
         # start the root run
@@ -424,6 +470,16 @@ class RunnableSeq(Runnable):
     ) -> Any:
         if config is None:
             config = ensure_config()
+        if has_no_handlers(config):
+            # no handlers to notify, invoke all steps with the same child config
+            config.pop("run_id", None)
+            config = patch_config(config, callbacks=config["callbacks"])
+            for i, step in enumerate(self.steps):
+                if i == 0:
+                    input = await step.ainvoke(input, config, **kwargs)
+                else:
+                    input = await step.ainvoke(input, config)
+            return input
         # setup callbacks
         callback_manager = get_async_callback_manager_for_config(config)
         # start the root run
@@ -1,6 +1,17 @@
-from langgraph.checkpoint.base import empty_checkpoint
-from langgraph.pregel.algo import prepare_next_tasks
+import pytest
+
+from langgraph.channels.ephemeral_value import EphemeralValue
+from langgraph.channels.last_value import LastValue
+from langgraph.checkpoint.base import create_checkpoint, empty_checkpoint
+from langgraph.errors import EmptyChannelError
+from langgraph.pregel.algo import (
+    PregelTaskWrites,
+    apply_writes,
+    increment,
+    prepare_next_tasks,
+)
 from langgraph.pregel.manager import ChannelsManager
+from langgraph.pregel.read import PregelNode
 
 
 def test_prepare_next_tasks() -> None:
@@ -40,3 +51,157 @@ def test_prepare_next_tasks() -> None:
         )
 
         # TODO: add more tests
+
+
+def test_prepare_next_tasks_with_updated_channels() -> None:
+    config = {}
+    processes = {
+        "one": PregelNode(channels=["a"], triggers=["a"]),
+        "two": PregelNode(channels=["b"], triggers=["b"]),
+        "three": PregelNode(channels=["a"], triggers=["a"]),
+    }
+    trigger_to_nodes = {"a": ["one", "three"], "b": ["two"]}
+    node_index = {"one": 0, "two": 1, "three": 2}
+    checkpoint = empty_checkpoint()
+
+    with ChannelsManager(
+        {"a": LastValue(int), "b": LastValue(int)}, checkpoint, config
+    ) as (channels, managed):
+        _, updated_channels = apply_writes(
+            checkpoint,
+            channels,
+            [PregelTaskWrites((), "__input__", [("a", 1), ("b", 2)], [])],
+            increment,
+        )
+        assert updated_channels == {"a", "b"}
+
+        # without an index, every node is checked
+        tasks = prepare_next_tasks(
+            checkpoint,
+            [],
+            processes,
+            channels,
+            managed,
+            config,
+            0,
+            for_execution=False,
+        )
+        assert [t.name for t in tasks.values()] == ["one", "two", "three"]
+
+        # with an index, tasks are still in the order nodes were declared in
+        tasks = prepare_next_tasks(
+            checkpoint,
+            [],
+            processes,
+            channels,
+            managed,
+            config,
+            0,
+            for_execution=False,
+            trigger_to_nodes=trigger_to_nodes,
+            node_index=node_index,
+            updated_channels={"a", "b"},
+        )
+        assert [t.name for t in tasks.values()] == ["one", "two", "three"]
+
+        # with an index, only nodes subscribed to updated channels are checked
+        tasks = prepare_next_tasks(
+            checkpoint,
+            [],
+            processes,
+            channels,
+            managed,
+            config,
+            0,
+            for_execution=False,
+            trigger_to_nodes=trigger_to_nodes,
+            node_index=node_index,
+            updated_channels={"b"},
+        )
+        assert [t.name for t in tasks.values()] == ["two"]
+
+        # no updated channels means no PULL tasks
+        assert (
+            prepare_next_tasks(
+                checkpoint,
+                [],
+                processes,
+                channels,
+                managed,
+                config,
+                0,
+                for_execution=False,
+                trigger_to_nodes=trigger_to_nodes,
+                updated_channels=set(),
+            )
+            == {}
+        )
+
+
+def test_apply_writes_copy_on_write() -> None:
+    checkpoint = empty_checkpoint()
+    channels = {"a": LastValue(int), "b": LastValue(int)}
+    apply_writes(
+        checkpoint,
+        channels,
+        [PregelTaskWrites((), "input", [("a", 1), ("b", 1)], [])],
+        increment,
+    )
+    apply_writes(
+        checkpoint,
+        channels,
+        [PregelTaskWrites((), "one", [("b", 2)], ["a"])],
+        increment,
+    )
+    seen = checkpoint["versions_seen"]["one"]
+    checkpoint = create_checkpoint(checkpoint, channels, 1)
+    saved = {**checkpoint, "versions_seen": checkpoint["versions_seen"].copy()}
+
+    # later steps replace, rather than mutate, the seen versions of a node
+    apply_writes(
+        checkpoint,
+        channels,
+        [PregelTaskWrites((), "one", [("a", 3)], ["a", "b"])],
+        increment,
+    )
+    assert saved["versions_seen"]["one"] is seen
+    assert seen == {"a": 1}
+    assert checkpoint["versions_seen"]["one"] == {"a": 1, "b": 2}
+
+    # only updated channels are read, other values are shared
+    next_checkpoint = create_checkpoint(checkpoint, channels, 2, updated_channels={"a"})
+    assert next_checkpoint["channel_values"] == {"a": 3, "b": 2}
+    assert saved["channel_values"] == {"a": 1, "b": 2}
+
+
+def test_apply_writes_notify_channels() -> None:
+    checkpoint = empty_checkpoint()
+    channels = {"a": LastValue(int), "e": EphemeralValue(int)}
+    apply_writes(
+        checkpoint,
+        channels,
+        [PregelTaskWrites((), "input", [("a", 1), ("e", 1)], [])],
+        increment,
+    )
+
+    # only the given channels are notified of a new step
+    _, updated = apply_writes(
+        checkpoint,
+        channels,
+        [PregelTaskWrites((), "one", [("a", 2)], ["a"])],
+        increment,
+        notify_channels=[],
+    )
+    assert updated == {"a"}
+    assert channels["e"].get() == 1
+
+    # by default, every channel that needs it is notified
+    _, updated = apply_writes(
+        checkpoint,
+        channels,
+        [PregelTaskWrites((), "one", [("a", 3)], ["a"])],
+        increment,
+    )
+    assert updated == {"a", "e"}
+    with pytest.raises(EmptyChannelError):
+        channels["e"].get()
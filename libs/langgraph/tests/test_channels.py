@@ -2,11 +2,17 @@ import operator
 from typing import Sequence, Union
 
 import pytest
+from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage
+from typing_extensions import Annotated, TypedDict
 
 from langgraph.channels.binop import BinaryOperatorAggregate
+from langgraph.channels.ephemeral_value import EphemeralValue
 from langgraph.channels.last_value import LastValue
+from langgraph.channels.messages import MessagesChannel
 from langgraph.channels.topic import Topic
 from langgraph.errors import EmptyChannelError, InvalidUpdateError
+from langgraph.graph import StateGraph
+from langgraph.graph.message import add_messages
 
 pytestmark = pytest.mark.anyio
 
@@ -86,3 +92,140 @@ def test_binop() -> None:
     checkpoint = channel.checkpoint()
     channel = BinaryOperatorAggregate(int, operator.add).from_checkpoint(checkpoint)
     assert channel.get() == 10
+
+
+def test_binop_bulk() -> None:
+    current = [0]
+    channel = BinaryOperatorAggregate(list, operator.add).from_checkpoint(current)
+    channel.update([[1], [2, 3], [4]])
+    assert channel.get() == [0, 1, 2, 3, 4]
+    assert current == [0]
+    # values the bulk version doesn't handle are folded one at a time
+    with pytest.raises(TypeError):
+        channel.update([[5], (6,)])
+
+    channel = BinaryOperatorAggregate(dict, operator.or_).from_checkpoint({"a": 1})
+    channel.update([{"b": 2}, {"a": 3}])
+    assert channel.get() == {"a": 3, "b": 2}
+
+    calls = []
+
+    def reducer(a: int, b: int) -> int:
+        return a + b
+
+    def bulk(a: int, values: Sequence[int]) -> int:
+        calls.append(list(values))
+        return a + sum(values)
+
+    reducer.__bulk__ = bulk  # type: ignore[attr-defined]
+    channel = BinaryOperatorAggregate(int, reducer).from_checkpoint(None)
+    channel.update([1, 2, 3])
+    channel.update([4])
+    assert channel.get() == 10
+    assert calls == [[1, 2, 3], [4]]
+
+    # add_messages merges each update in turn, as successive calls would
+    add = add_messages(format=None)
+    channel = BinaryOperatorAggregate(list, add).from_checkpoint(
+        [HumanMessage(content="hi", id="1")]
+    )
+    updates = [
+        [AIMessage(content="hello", id="2")],
+        [RemoveMessage(id="2"), AIMessage(content="hey", id="1")],
+        AIMessage(content="bye", id="3"),
+    ]
+    channel.update(updates)
+    expected: list = [HumanMessage(content="hi", id="1")]
+    for update in updates:
+        expected = add(expected, update)
+    assert (
+        channel.get()
+        == expected
+        == [
+            AIMessage(content="hey", id="1"),
+            AIMessage(content="bye", id="3"),
+        ]
+    )
+
+
+def test_messages() -> None:
+    channel = MessagesChannel(list).from_checkpoint(None)
+    assert channel.get() == []
+
+    channel.update(
+        [
+            HumanMessage(content="hi", id="1"),
+            [AIMessage(content="hello", id="2"), ("human", "bye")],
+        ]
+    )
+    value = channel.get()
+    assert value[:2] == [
+        HumanMessage(content="hi", id="1"),
+        AIMessage(content="hello", id="2"),
+    ]
+    assert value[2].content == "bye" and value[2].id is not None
+    third_id = value[2].id
+
+    # replace by id, append new ids, remove at the end of the update
+    channel.update(
+        [
+            [
+                AIMessage(content="hello again", id="2"),
+                RemoveMessage(id="1"),
+                HumanMessage(content="new", id="4"),
+            ]
+        ]
+    )
+    assert channel.get() == [
+        AIMessage(content="hello again", id="2"),
+        HumanMessage(content="bye", id=third_id),
+        HumanMessage(content="new", id="4"),
+    ]
+    # values read before an update are left unchanged
+    assert len(value) == 3 and value[0].id == "1"
+
+    with pytest.raises(ValueError, match="doesn't exist"):
+        channel.update([RemoveMessage(id="missing")])
+
+    checkpoint = channel.checkpoint()
+    channel = MessagesChannel(list).from_checkpoint(checkpoint)
+    channel.update([AIMessage(content="newer", id="4")])
+    assert [m.content for m in channel.get()] == ["hello again", "bye", "newer"]
+    assert [m.content for m in checkpoint] == ["hello again", "bye", "new"]
+
+
+def test_messages_state_channel() -> None:
+    class State(TypedDict):
+        messages: Annotated[list, add_messages]
+
+    builder = StateGraph(State)
+    builder.add_node("agent", lambda _: {"messages": [AIMessage("hey", id="2")]})
+    builder.set_entry_point("agent")
+    graph = builder.compile()
+
+    assert isinstance(graph.channels["messages"], MessagesChannel)
+    assert graph.invoke({"messages": [HumanMessage("hi", id="1")]}) == {
+        "messages": [HumanMessage("hi", id="1"), AIMessage("hey", id="2")]
+    }
+    assert graph.invoke(
+        {"messages": [HumanMessage("hi", id="1"), AIMessage("old", id="2")]}
+    ) == {"messages": [HumanMessage("hi", id="1"), AIMessage("hey", id="2")]}
+
+
+def test_needs_step_notification() -> None:
+    # channels whose value changes on an empty update must be notified
+    assert EphemeralValue(int).needs_step_notification
+    assert Topic(str).needs_step_notification
+    # channels for which an empty update is a no-op can be skipped
+    assert not LastValue(int).needs_step_notification
+    assert not BinaryOperatorAggregate(int, operator.add).needs_step_notification
+    assert not MessagesChannel(list).needs_step_notification
+
+    channel = LastValue(int).from_checkpoint(None)
+    channel.update([1])
+    assert not channel.update([])
+    assert channel.get() == 1
+    channel = BinaryOperatorAggregate(int, operator.add).from_checkpoint(None)
+    channel.update([1])
+    assert not channel.update([])
+    assert channel.get() == 1
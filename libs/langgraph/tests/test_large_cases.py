@@ -4714,7 +4714,7 @@ def test_root_graph(
                     content="result for query",
                     name="search_api",
                     tool_call_id="tool_call123",
-                    id="00000000-0000-4000-8000-000000000037",
+                    id="00000000-0000-4000-8000-000000000013",
                 )
             ]
         },
@@ -4737,7 +4737,7 @@ def test_root_graph(
                     content="result for another",
                     name="search_api",
                     tool_call_id="tool_call456",
-                    id="00000000-0000-4000-8000-000000000045",
+                    id="00000000-0000-4000-8000-000000000016",
                 )
             ]
         },
@@ -5441,7 +5441,7 @@ def test_root_graph(
         "__root__": [
             HumanMessage(
                 content="what is weather in sf",
-                id="00000000-0000-4000-8000-000000000078",
+                id="00000000-0000-4000-8000-000000000028",
             ),
             AIMessage(
                 content="",
@@ -5461,7 +5461,7 @@ def test_root_graph(
             ),
             AIMessage(content="answer", id="ai2"),
             AIMessage(
-                content="an extra message", id="00000000-0000-4000-8000-000000000100"
+                content="an extra message", id="00000000-0000-4000-8000-000000000037"
             ),
             HumanMessage(content="what is weather in la"),
         ],
@@ -2,6 +2,9 @@ import enum
 import json
 import logging
 import operator
+import os
+import subprocess
+import sys
 import threading
 import time
 import uuid
@@ -13,6 +16,7 @@ from random import randrange
 from typing import (
     Annotated,
     Any,
+    Callable,
     Dict,
     Generator,
     Iterator,
@@ -28,6 +32,7 @@ from typing import (
 
 import httpx
 import pytest
+from langchain_core.messages import AIMessage
 from langchain_core.runnables import (
     RunnableConfig,
     RunnableLambda,
@@ -37,6 +42,7 @@ from langsmith import traceable
 from pytest_mock import MockerFixture
 from syrupy import SnapshotAssertion
 
+from langgraph.cache.memory import InMemoryCache
 from langgraph.channels.base import BaseChannel
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.context import Context
@@ -57,7 +63,11 @@ from langgraph.constants import (
     PULL,
     START,
 )
-from langgraph.errors import InvalidUpdateError, MultipleSubgraphsError
+from langgraph.errors import (
+    InvalidUpdateError,
+    MultipleSubgraphsError,
+    NodeTimeoutError,
+)
 from langgraph.func import entrypoint, task
 from langgraph.graph import END, Graph, StateGraph
 from langgraph.graph.message import MessageGraph, MessagesState, add_messages
@@ -66,14 +76,21 @@ from langgraph.pregel import Channel, GraphRecursionError, Pregel, StateSnapshot
 from langgraph.pregel.retry import RetryPolicy
 from langgraph.store.base import BaseStore
 from langgraph.types import (
+    BatchPolicy,
+    CachePolicy,
+    CancellationToken,
     Command,
     Interrupt,
     PregelTask,
     Send,
+    StreamBufferPolicy,
+    StreamCoalescePolicy,
     StreamWriter,
+    default_cache_key,
     interrupt,
 )
 from tests.agents import AgentAction, AgentFinish
+from tests.any_int import AnyInt
 from tests.any_str import AnyStr, AnyVersion, FloatBetween, UnsortedSequence
 from tests.conftest import (
     ALL_CHECKPOINTERS_SYNC,
@@ -81,6 +98,7 @@ from tests.conftest import (
     REGULAR_CHECKPOINTERS_SYNC,
     SHOULD_CHECK_SNAPSHOTS,
 )
+from tests.fake_chat import FakeChatModel
 from tests.memory_assert import MemorySaverAssertCheckpointMetadata
 from tests.messages import (
     _AnyIdAIMessage,
@@ -1508,6 +1526,44 @@ def test_imp_task(request: pytest.FixtureRequest, checkpointer_name: str) -> Non
     assert mapper_calls == 2
 
 
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_SYNC)
+def test_imp_task_many_resume(
+    request: pytest.FixtureRequest, checkpointer_name: str
+) -> None:
+    checkpointer = request.getfixturevalue(f"checkpointer_{checkpointer_name}")
+    mapper_calls = 0
+
+    @task()
+    def mapper(input: int) -> int:
+        nonlocal mapper_calls
+        mapper_calls += 1
+        return input % 2
+
+    @entrypoint(checkpointer=checkpointer)
+    def graph(input: list[int]) -> list[int]:
+        futures = [mapper(i) for i in input]
+        mapped = [f.result() for f in futures]
+        answer = interrupt("question")
+        return [m + answer for m in mapped]
+
+    thread1 = {"configurable": {"thread_id": "1"}}
+    assert [*graph.stream(list(range(100)), thread1)][-1] == {
+        "__interrupt__": (
+            Interrupt(
+                value="question",
+                resumable=True,
+                ns=[AnyStr("graph:")],
+                when="during",
+            ),
+        )
+    }
+    assert mapper_calls == 100
+
+    # results of tasks that already ran are reused, including falsy ones
+    assert graph.invoke(Command(resume=1), thread1) == [i % 2 + 1 for i in range(100)]
+    assert mapper_calls == 100
+
+
 @pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_SYNC)
 def test_imp_stream_order(
     request: pytest.FixtureRequest, checkpointer_name: str
@@ -5293,3 +5349,918 @@ def test_multiple_updates() -> None:
         {"node_a": [{"foo": "a1"}, {"foo": "a2"}]},
         {"node_b": {"foo": "b"}},
     ]
+
+
+class ProcessState(TypedDict):
+    n: int
+    pid: int
+    total: Annotated[int, operator.add]
+
+
+def _process_node(state: ProcessState, config: RunnableConfig) -> dict:
+    if state["n"] < 0:
+        raise ValueError("n must be positive")
+    factor = config["configurable"].get("factor", 1)
+    return {
+        "pid": os.getpid(),
+        "total": factor * sum(i * i for i in range(state["n"])),
+    }
+
+
+def test_process_executor() -> None:
+    builder = StateGraph(ProcessState)
+    builder.add_node("square", _process_node, executor="process")
+    builder.add_node("add_one", lambda s: {"total": 1})
+    builder.add_edge(START, "square")
+    builder.add_edge("square", "add_one")
+    graph = builder.compile(checkpointer=MemorySaver(), interrupt_before=["square"])
+
+    thread = {"configurable": {"thread_id": "1", "factor": 2}}
+    assert graph.invoke({"n": 4, "pid": 0, "total": 0}, thread) == {
+        "n": 4,
+        "pid": 0,
+        "total": 0,
+    }
+    # resume after interrupt, node runs in a different process
+    assert [*graph.stream(None, thread, stream_mode="updates")] == [
+        {"square": {"pid": AnyInt(), "total": 28}},
+        {"add_one": {"total": 1}},
+    ]
+    state = graph.get_state(thread)
+    assert state.values["total"] == 29
+    assert state.values["pid"] != os.getpid()
+
+    # errors raised in the worker are re-raised and recorded
+    graph = builder.compile(checkpointer=MemorySaver())
+    thread = {"configurable": {"thread_id": "2"}}
+    with pytest.raises(ValueError, match="n must be positive"):
+        graph.invoke({"n": -1, "pid": 0, "total": 0}, thread)
+    assert "n must be positive" in graph.get_state(thread).tasks[0].error
+
+    # only picklable sync functions are accepted
+    with pytest.raises(ValueError, match="must be picklable"):
+        StateGraph(ProcessState).add_node(
+            "node", lambda s: {"total": 1}, executor="process"
+        )
+    with pytest.raises(ValueError, match="must be a sync function"):
+        StateGraph(ProcessState).add_node(
+            "node", RunnableLambda(_process_node), executor="process"
+        )
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_SYNC)
+def test_node_cache(request: pytest.FixtureRequest, checkpointer_name: str) -> None:
+    checkpointer = request.getfixturevalue(f"checkpointer_{checkpointer_name}")
+
+    class State(TypedDict):
+        x: int
+        items: Annotated[list, operator.add]
+
+    calls: list[str] = []
+
+    def fanout(state: State) -> Command:
+        calls.append("fanout")
+        return Command(goto=[Send("expensive", {"x": i % 2}) for i in range(4)])
+
+    def expensive(state: dict) -> dict:
+        calls.append("expensive")
+        return {"items": [state["x"] * 10]}
+
+    builder = StateGraph(State)
+    builder.add_node("fanout", fanout, cache_policy=CachePolicy(ttl=60))
+    builder.add_node(
+        "expensive", expensive, cache_policy=CachePolicy(key_func=lambda s: str(s))
+    )
+    builder.add_edge(START, "fanout")
+    graph = builder.compile(checkpointer=checkpointer, cache=InMemoryCache())
+
+    # first run populates the cache
+    config = {"configurable": {"thread_id": "1"}}
+    assert graph.invoke({"x": 1, "items": []}, config) == {
+        "x": 1,
+        "items": [0, 10, 0, 10],
+    }
+    assert calls == ["fanout", *["expensive"] * 4]
+
+    # same input in another thread is served from the cache
+    calls.clear()
+    config = {"configurable": {"thread_id": "2"}}
+    assert [*graph.stream({"x": 1, "items": []}, config, stream_mode="updates")] == [
+        {"fanout": None, "__metadata__": {"cached": True}},
+        *[{"expensive": {"items": [0]}, "__metadata__": {"cached": True}}] * 2,
+        *[{"expensive": {"items": [10]}, "__metadata__": {"cached": True}}] * 2,
+    ]
+    assert calls == []
+    assert graph.get_state(config).values == {"x": 1, "items": [0, 10, 0, 10]}
+
+    # a different input runs the first node again
+    assert graph.invoke({"x": 2, "items": []}, config) == {
+        "x": 2,
+        "items": [0, 10, 0, 10, 0, 10, 0, 10],
+    }
+    assert calls == ["fanout"]
+
+    # a graph compiled without a cache runs all nodes
+    calls.clear()
+    builder.compile(checkpointer=checkpointer).invoke({"x": 1, "items": []}, config)
+    assert calls == ["fanout", *["expensive"] * 4]
+
+
+def test_node_cache_unpicklable_input() -> None:
+    class State(TypedDict):
+        lock: Any
+        items: Annotated[list, operator.add]
+
+    calls: list[str] = []
+
+    def node(state: State) -> dict:
+        calls.append("node")
+        return {"items": ["node"]}
+
+    builder = StateGraph(State)
+    builder.add_node("node", node, cache_policy=CachePolicy())
+    builder.add_edge(START, "node")
+
+    # keys aren't computed for graphs without a cache
+    graph = builder.compile()
+    assert graph.invoke({"lock": threading.Lock(), "items": []})["items"] == ["node"]
+
+    # inputs that can't be keyed are a cache miss
+    graph = builder.compile(cache=InMemoryCache())
+    for _ in range(2):
+        graph.invoke({"lock": threading.Lock(), "items": []})
+    assert calls == ["node"] * 3
+
+
+def test_node_cache_set_error(caplog: pytest.LogCaptureFixture) -> None:
+    class State(TypedDict):
+        items: Annotated[list, operator.add]
+
+    class FailingCache(InMemoryCache):
+        def set(self, pairs: Any) -> None:
+            raise ConnectionError("cache is down")
+
+    builder = StateGraph(State)
+    builder.add_node("node", lambda s: {"items": ["node"]}, cache_policy=CachePolicy())
+    builder.add_edge(START, "node")
+    graph = builder.compile(cache=FailingCache())
+
+    # a failure to write to the cache is logged, and doesn't fail the run
+    with caplog.at_level(logging.WARNING, logger="langgraph"):
+        assert graph.invoke({"items": []}) == {"items": ["node"]}
+    assert "cache is down" in caplog.text
+
+
+def test_default_cache_key_is_canonical() -> None:
+    value = {"b": [1, "x"], "a": {"tags": {"x", "y", "z"}}, "c": None}
+    reordered = {"c": None, "a": {"tags": {"z", "y", "x"}}, "b": [1, "x"]}
+    assert default_cache_key(value) == default_cache_key(reordered)
+    assert default_cache_key(value) != default_cache_key({**value, "c": 1})
+
+    # the same in other processes, where strings hash differently
+    script = (
+        "from langgraph.types import default_cache_key; "
+        f"print(default_cache_key({value!r}))"
+    )
+    for seed in ("1", "2"):
+        out = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+        ).stdout
+        assert out.strip() == default_cache_key(value)
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_SYNC)
+def test_stream_mode_metrics(
+    request: pytest.FixtureRequest, checkpointer_name: str
+) -> None:
+    checkpointer = request.getfixturevalue(f"checkpointer_{checkpointer_name}")
+
+    class State(TypedDict):
+        items: Annotated[list, operator.add]
+
+    attempts = 0
+
+    def flaky(state: State) -> dict:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise ConnectionError("try again")
+        return {"items": ["flaky"]}
+
+    builder = StateGraph(State)
+    builder.add_node(
+        "flaky", flaky, retry=RetryPolicy(initial_interval=0, jitter=False)
+    )
+    builder.add_node("other", lambda state: {"items": ["other"]})
+    builder.add_edge(START, "flaky")
+    builder.add_edge(START, "other")
+    graph = builder.compile(checkpointer=checkpointer)
+
+    config = {"configurable": {"thread_id": "1"}}
+    events = [*graph.stream({"items": []}, config, stream_mode="metrics")]
+
+    assert [e for e in events if e["type"] == "step"] == [
+        {
+            "type": "step",
+            "step": step,
+            "payload": {
+                "prepare_tasks": FloatBetween(0, 1),
+                "apply_writes": FloatBetween(0, 1),
+                "create_checkpoint": FloatBetween(0, 1),
+                "tasks": tasks,
+                "stream_depth": AnyInt(),
+            },
+        }
+        for step, tasks in ((0, 1), (1, 2))
+    ]
+    # hidden tasks, ie. __start__, are not reported
+    assert sorted(
+        (e for e in events if e["type"] == "task"), key=lambda e: e["payload"]["name"]
+    ) == [
+        {
+            "type": "task",
+            "step": 1,
+            "payload": {
+                "id": AnyStr(),
+                "name": name,
+                "queue_wait": FloatBetween(0, 1),
+                "run_time": FloatBetween(0, 1),
+                "retries": retries,
+                "writes": 2,
+            },
+        }
+        for name, retries in (("flaky", 1), ("other", 0))
+    ]
+    checkpointer_events = [e for e in events if e["type"] == "checkpointer"]
+    assert all(
+        e["payload"]["duration"] == FloatBetween(0, 1) for e in checkpointer_events
+    )
+    assert sorted(
+        {(e["step"], e["payload"]["method"]) for e in checkpointer_events}
+    ) == [
+        (-1, "put"),
+        (0, "put"),
+        (0, "put_writes"),
+        (1, "put"),
+        (1, "put_writes"),
+    ]
+
+    # no metrics are collected for other stream modes
+    assert [
+        *graph.stream({"items": []}, config, stream_mode="updates")
+    ] == UnsortedSequence(
+        {"flaky": {"items": ["flaky"]}},
+        {"other": {"items": ["other"]}},
+    )
+
+
+def test_metrics_hook() -> None:
+    class State(TypedDict):
+        items: Annotated[list, operator.add]
+
+    builder = StateGraph(State)
+    builder.add_node("node", lambda state: {"items": ["node"]})
+    builder.add_edge(START, "node")
+
+    events: list[dict] = []
+    graph = builder.compile(metrics_hook=events.append)
+
+    # the hook gets metrics without streaming them
+    assert graph.invoke({"items": []}) == {"items": ["node"]}
+    assert [(e["type"], e["step"]) for e in events] == [
+        ("step", 0),
+        ("task", 1),
+        ("step", 1),
+    ]
+    assert events[1]["payload"]["name"] == "node"
+
+    # and along with stream_mode="metrics"
+    events.clear()
+    assert [e["type"] for e in graph.stream({"items": []}, stream_mode="metrics")] == [
+        e["type"] for e in events
+    ]
+    assert len(events) == 3
+
+
+def test_put_writes_batched() -> None:
+    class SlowPutWritesCheckpointer(MemorySaver):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batches: list[list[str]] = []
+
+        def put_writes_many(
+            self,
+            config: RunnableConfig,
+            task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+        ) -> None:
+            self.batches.append([task_id for task_id, _ in task_writes])
+            time.sleep(0.05)
+            super().put_writes_many(config, task_writes)
+
+    class State(TypedDict):
+        items: Annotated[list, operator.add]
+
+    calls = Counter()
+    should_fail = True
+
+    def make_node(name: str):
+        def node(state: State) -> dict:
+            calls[name] += 1
+            return {"items": [name]}
+
+        return node
+
+    def failing(state: State) -> dict:
+        calls["failing"] += 1
+        time.sleep(0.2)
+        if should_fail:
+            raise ConnectionError("oops")
+        return {"items": ["failing"]}
+
+    builder = StateGraph(State)
+    names = [f"node_{i}" for i in range(10)]
+    for name in names:
+        builder.add_node(name, make_node(name))
+        builder.add_edge(START, name)
+    builder.add_node("failing", failing)
+    builder.add_edge(START, "failing")
+
+    checkpointer = SlowPutWritesCheckpointer()
+    graph = builder.compile(checkpointer=checkpointer)
+    config = {"configurable": {"thread_id": "1"}}
+
+    with pytest.raises(ConnectionError):
+        graph.invoke({"items": []}, config)
+
+    # writes of tasks finishing while a batch is being saved are saved together
+    saved = [task_id for batch in checkpointer.batches for task_id in batch]
+    assert len(saved) == len(set(saved)) == 12  # input, 10 nodes, error
+    assert len(checkpointer.batches) < len(saved)
+
+    # on resume, only the failed task runs again
+    should_fail = False
+    assert sorted(graph.invoke(None, config)["items"]) == sorted([*names, "failing"])
+    assert calls == {**{name: 1 for name in names}, "failing": 2}
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_SYNC)
+def test_durability(request: pytest.FixtureRequest, checkpointer_name: str) -> None:
+    checkpointer = request.getfixturevalue(f"checkpointer_{checkpointer_name}")
+
+    class State(TypedDict):
+        items: Annotated[list, operator.add]
+
+    calls = Counter()
+    should_fail = True
+    seen_steps: list[int] = []
+
+    def one(state: State) -> dict:
+        calls["one"] += 1
+        return {"items": ["one"]}
+
+    def two(state: State) -> dict:
+        calls["two"] += 1
+        if should_fail:
+            raise ConnectionError("oops")
+        return {"items": ["two"]}
+
+    def three(state: State, config: RunnableConfig) -> dict:
+        # the checkpoint of the previous step was saved before this step started
+        seen_steps.append(
+            checkpointer.get_tuple(
+                {"configurable": {"thread_id": config["configurable"]["thread_id"]}}
+            ).metadata["step"]
+        )
+        return {"items": ["three"]}
+
+    builder = StateGraph(State)
+    builder.add_node("one", one)
+    builder.add_node("two", two)
+    builder.add_edge(START, "one")
+    builder.add_edge("one", "two")
+
+    # only the last checkpoint is saved
+    graph = builder.compile(checkpointer=checkpointer, durability="exit")
+    config = {"configurable": {"thread_id": "1"}}
+    with pytest.raises(ConnectionError):
+        graph.invoke({"items": []}, config)
+    history = [*graph.get_state_history(config)]
+    assert len(history) == 1
+    assert history[0].values == {"items": ["one"]}
+    assert history[0].next == ("two",)
+    assert history[0].metadata["step"] == 1
+    assert history[0].parent_config is None
+
+    # on resume, the successful steps don't run again
+    should_fail = False
+    assert graph.invoke(None, config) == {"items": ["one", "two"]}
+    assert calls == {"one": 1, "two": 2}
+    history = [*graph.get_state_history(config)]
+    assert len(history) == 2
+    assert history[0].values == {"items": ["one", "two"]}
+    assert history[0].next == ()
+    assert history[0].parent_config == history[1].config
+
+    # interrupted runs save the checkpoint before the interrupt
+    graph = builder.compile(checkpointer=checkpointer, interrupt_before=["two"])
+    config = {"configurable": {"thread_id": "2"}}
+    assert graph.invoke({"items": []}, config, durability="exit") == {"items": ["one"]}
+    assert [c.next for c in graph.get_state_history(config)] == [("two",)]
+    assert graph.invoke(None, config, durability="exit") == {"items": ["one", "two"]}
+    assert [c.next for c in graph.get_state_history(config)] == [(), ("two",)]
+
+    # all checkpoints are saved otherwise
+    builder.add_node("three", three)
+    builder.add_edge("two", "three")
+    graph = builder.compile(checkpointer=checkpointer)
+    config = {"configurable": {"thread_id": "3"}}
+    assert graph.invoke({"items": []}, config, durability="sync") == {
+        "items": ["one", "two", "three"]
+    }
+    assert seen_steps == [2]
+    assert len([*graph.get_state_history(config)]) == 5
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_SYNC)
+def test_durability_exit_nested_subgraphs(
+    request: pytest.FixtureRequest, checkpointer_name: str
+) -> None:
+    checkpointer = request.getfixturevalue(f"checkpointer_{checkpointer_name}")
+
+    class State(TypedDict):
+        items: Annotated[list, operator.add]
+
+    should_ask = True
+
+    def ask(state: State) -> dict:
+        return {"items": [interrupt("question") if should_ask else "no answer"]}
+
+    grandchild = StateGraph(State)
+    grandchild.add_node("ask", ask)
+    grandchild.add_edge(START, "ask")
+
+    child = StateGraph(State)
+    child.add_node("c1", lambda s: {"items": ["c1"]})
+    child.add_node("grandchild", grandchild.compile())
+    child.add_edge(START, "c1")
+    child.add_edge("c1", "grandchild")
+
+    builder = StateGraph(State)
+    builder.add_node("p1", lambda s: {"items": ["p1"]})
+    builder.add_node("child", child.compile())
+    builder.add_node("p2", lambda s: {"items": ["p2"]})
+    builder.add_edge(START, "p1")
+    builder.add_edge("p1", "child")
+    builder.add_edge("child", "p2")
+    graph = builder.compile(checkpointer=checkpointer, durability="exit")
+    config = {"configurable": {"thread_id": "1"}}
+
+    def assert_parents_saved(config: RunnableConfig) -> None:
+        saved = [*checkpointer.list(config)]
+        ids = {
+            (
+                c.config["configurable"]["checkpoint_ns"],
+                c.config["configurable"]["checkpoint_id"],
+            )
+            for c in saved
+        }
+        for c in saved:
+            for ns, id in c.metadata["parents"].items():
+                assert (ns, id) in ids
+
+    assert graph.invoke({"items": []}, config) == {"items": ["p1"]}
+    assert_parents_saved(config)
+    state = graph.get_state(config, subgraphs=True)
+    assert state.next == ("child",)
+    assert state.tasks[0].state.next == ("grandchild",)
+    assert state.tasks[0].state.tasks[0].state.next == ("ask",)
+
+    # the subgraphs resume where they were interrupted
+    assert graph.invoke(Command(resume="answer"), config) == {
+        "items": ["p1", "p1", "c1", "p1", "c1", "answer", "p2"]
+    }
+    assert_parents_saved(config)
+    assert graph.get_state(config, subgraphs=True).next == ()
+    assert [c.metadata["step"] for c in graph.get_state_history(config)] == [3, 1]
+
+    # the parent checkpoints subgraphs refer to are saved, although the parent
+    # moved past them
+    should_ask = False
+    config = {"configurable": {"thread_id": "2"}}
+    assert graph.invoke({"items": []}, config) == {
+        "items": ["p1", "p1", "c1", "p1", "c1", "no answer", "p2"]
+    }
+    assert_parents_saved(config)
+    assert [c.metadata["step"] for c in graph.get_state_history(config)] == [3, 1]
+
+
+def test_stream_buffer() -> None:
+    class State(TypedDict):
+        answer: str
+
+    produced: list[int] = []
+    model = FakeChatModel(
+        messages=[AIMessage(content="one two three four five six", id="ai1")]
+    )
+
+    def write(state: State, writer: StreamWriter) -> dict:
+        for i in range(20):
+            writer(i)
+            produced.append(i)
+        return {}
+
+    def answer(state: State) -> dict:
+        return {"answer": model.invoke("hi").content}
+
+    def compile(node: Callable, policy: StreamBufferPolicy) -> Pregel:
+        builder = StateGraph(State)
+        builder.add_node("node", node)
+        builder.add_edge(START, "node")
+        return builder.compile(stream_buffer=policy)
+
+    # the producer is blocked until the consumer catches up
+    graph = compile(write, StreamBufferPolicy(maxsize=2))
+    received: list[int] = []
+    for c in graph.stream({"answer": ""}, stream_mode="custom"):
+        assert len(produced) - c <= 3
+        received.append(c)
+        time.sleep(0.01)
+    assert received == [*range(20)]
+
+    # the oldest chunks are dropped
+    graph = compile(write, StreamBufferPolicy(maxsize=2, on_full="drop_oldest"))
+    received = [
+        c
+        for c in graph.stream({"answer": ""}, stream_mode="custom")
+        if not time.sleep(0.01)
+    ]
+    assert received == sorted(received)
+    assert received[-1] == 19
+    assert len(received) < 20
+
+    # chunks of the same message are merged
+    graph = compile(answer, StreamBufferPolicy(maxsize=1, on_full="coalesce"))
+    chunks = [
+        msg
+        for msg, meta in graph.stream({"answer": ""}, stream_mode="messages")
+        if not time.sleep(0.01)
+    ]
+    assert "".join(c.content for c in chunks) == "one two three four five six"
+    assert {c.id for c in chunks} == {"ai1"}
+    assert len(chunks) < 11
+
+
+def test_stream_coalesce() -> None:
+    model = FakeChatModel(
+        messages=[AIMessage(content="one two three four five six", id="ai1")]
+    )
+
+    def call_model(state: MessagesState) -> dict:
+        return {"messages": [model.invoke(state["messages"])]}
+
+    builder = StateGraph(MessagesState)
+    builder.add_node("call_model", call_model)
+    builder.add_edge(START, "call_model")
+
+    # by count, the last chunks are emitted when the model run ends
+    graph = builder.compile(
+        stream_coalesce=StreamCoalescePolicy(max_wait=None, max_chunks=4)
+    )
+    chunks = [
+        msg for msg, meta in graph.stream({"messages": "hi"}, stream_mode="messages")
+    ]
+    assert [c.content for c in chunks] == ["one two ", "three four ", "five six"]
+    assert {c.id for c in chunks} == {"ai1"}
+
+    # by time, the first chunk is emitted right away
+    graph = builder.compile(stream_coalesce=StreamCoalescePolicy(max_wait=10))
+    chunks = [
+        msg for msg, meta in graph.stream({"messages": "hi"}, stream_mode="messages")
+    ]
+    assert [c.content for c in chunks] == ["one", " two three four five six"]
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_SYNC)
+def test_eager(request: pytest.FixtureRequest, checkpointer_name: str) -> None:
+    checkpointer = request.getfixturevalue(f"checkpointer_{checkpointer_name}")
+
+    class State(TypedDict, total=False):
+        a: str
+        b: str
+        c: str
+        d: str
+
+    class FastState(TypedDict):
+        b: str
+
+    calls = Counter()
+
+    def slow(state: State) -> dict:
+        time.sleep(0.6)
+        return {"a": "slow"}
+
+    def fast(state: State) -> dict:
+        return {"b": "fast"}
+
+    def after_fast(state: FastState) -> dict:
+        calls["after_fast"] += 1
+        time.sleep(0.4)
+        return {"c": state["b"] + "!"}
+
+    def reader(state: State) -> dict:
+        # reads the key written by "slow", so its early start is discarded
+        calls["reader"] += 1
+        return {"d": state["a"] + state["b"]}
+
+    builder = StateGraph(State)
+    builder.add_node("slow", slow)
+    builder.add_node("fast", fast)
+    builder.add_node("after_fast", after_fast, input=FastState)
+    builder.add_node("reader", reader)
+    builder.add_edge(START, "slow")
+    builder.add_edge(START, "fast")
+    builder.add_edge("fast", "after_fast")
+    builder.add_edge("fast", "reader")
+
+    results = {}
+    for eager in (False, True):
+        calls.clear()
+        graph = builder.compile(checkpointer=checkpointer, eager=eager)
+        config = {"configurable": {"thread_id": str(eager)}}
+        start = time.perf_counter()
+        result = graph.invoke({"a": ""}, config)
+        duration = time.perf_counter() - start
+        history = [
+            (s.values, s.next, s.metadata["step"], s.metadata["writes"])
+            for s in graph.get_state_history(config)
+        ]
+        results[eager] = (result, history, dict(calls), duration)
+
+    # same results and checkpoints, with or without eager scheduling
+    assert results[True][0] == results[False][0]
+    assert results[True][0] == {
+        "a": "slow",
+        "b": "fast",
+        "c": "fast!",
+        "d": "slowfast",
+    }
+    assert results[True][1] == results[False][1]
+    # "after_fast" ran while "slow" was still running, "reader" ran again
+    assert results[False][2] == {"after_fast": 1, "reader": 1}
+    assert results[True][2] == {"after_fast": 1, "reader": 2}
+    assert results[False][3] >= 1.0
+    assert results[True][3] < 0.95
+
+
+def test_eager_does_not_delay_step() -> None:
+    class State(TypedDict, total=False):
+        a: str
+        b: str
+        c: str
+
+    class FastState(TypedDict):
+        b: str
+
+    def slow(state: State) -> dict:
+        time.sleep(0.3)
+        return {"a": "slow"}
+
+    def fast(state: State) -> dict:
+        return {"b": "fast"}
+
+    def after_fast(state: FastState) -> dict:
+        time.sleep(1.2)
+        return {"c": state["b"] + "!"}
+
+    builder = StateGraph(State)
+    builder.add_node("slow", slow)
+    builder.add_node("fast", fast)
+    builder.add_node("after_fast", after_fast, input=FastState)
+    builder.add_edge(START, "slow")
+    builder.add_edge(START, "fast")
+    builder.add_edge("fast", "after_fast")
+    graph = builder.compile(eager=True)
+
+    start = time.perf_counter()
+    chunks = [
+        (c, time.perf_counter() - start)
+        for c in graph.stream({"a": ""}, stream_mode="values")
+    ]
+    duration = time.perf_counter() - start
+
+    assert [c for c, _ in chunks] == [
+        {"a": ""},
+        {"a": "slow", "b": "fast"},
+        {"a": "slow", "b": "fast", "c": "fast!"},
+    ]
+    # the first step ends when "slow" does, not when "after_fast" does
+    assert chunks[1][1] < 0.9
+    assert duration < 1.6
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_SYNC)
+def test_batch_policy(request: pytest.FixtureRequest, checkpointer_name: str) -> None:
+    checkpointer = request.getfixturevalue(f"checkpointer_{checkpointer_name}")
+
+    class State(TypedDict):
+        items: list[int]
+        embeddings: Annotated[list, operator.add]
+
+    batches: list[list[int]] = []
+    should_fail = False
+
+    def embed(inputs: list[dict]) -> list[dict]:
+        batches.append([i["item"] for i in inputs])
+        if should_fail:
+            raise ConnectionError("oops")
+        return [{"embeddings": [i["item"] * 10]} for i in inputs]
+
+    def fan_out(state: State) -> list[Send]:
+        return [Send("embed", {"item": i}) for i in state["items"]]
+
+    builder = StateGraph(State)
+    builder.add_node("embed", embed, batch=BatchPolicy(max_size=3))
+    builder.add_conditional_edges(START, fan_out)
+    graph = builder.compile(checkpointer=checkpointer)
+    config = {"configurable": {"thread_id": "1"}}
+
+    assert graph.invoke({"items": [1, 2, 3, 4, 5, 6, 7]}, config) == {
+        "items": [1, 2, 3, 4, 5, 6, 7],
+        "embeddings": [10, 20, 30, 40, 50, 60, 70],
+    }
+    assert batches == [[1, 2, 3], [4, 5, 6], [7]]
+    # outputs are written per task
+    assert graph.get_state(config).metadata["writes"] == {
+        "embed": [{"embeddings": [i * 10]} for i in range(1, 8)]
+    }
+
+    # tasks with their own pending writes, eg. errors, are still batched together
+    should_fail = True
+    batches.clear()
+    config = {"configurable": {"thread_id": "2"}}
+    with pytest.raises(ConnectionError):
+        graph.invoke({"items": [1, 2, 3]}, config)
+    should_fail = False
+    assert graph.invoke(None, config)["embeddings"] == [10, 20, 30]
+    assert batches == [[1, 2, 3], [1, 2, 3]]
+
+    # the node is run once for all tasks, so it can't call tasks
+    @task()
+    def double(x: int) -> int:
+        return x * 2
+
+    def embed_calling(inputs: list[dict]) -> list[dict]:
+        return [{"embeddings": [double(i["item"]).result()]} for i in inputs]
+
+    builder = StateGraph(State)
+    builder.add_node("embed", embed_calling, batch=BatchPolicy())
+    builder.add_conditional_edges(START, fan_out)
+    graph = builder.compile()
+    with pytest.raises(RuntimeError, match="can't call tasks"):
+        graph.invoke({"items": [1, 2]})
+
+    # the node must return one output per input
+    builder = StateGraph(State)
+    builder.add_node("embed", lambda inputs: inputs[:1], batch=BatchPolicy())
+    builder.add_conditional_edges(START, fan_out)
+    graph = builder.compile()
+    with pytest.raises(InvalidUpdateError, match="expected 2 outputs, got 1"):
+        graph.invoke({"items": [1, 2]})
+
+    with pytest.raises(ValueError, match="max_size must be at least 1"):
+        StateGraph(State).add_node("embed", embed, batch=BatchPolicy(max_size=0))
+
+
+def test_hedged_retry() -> None:
+    class State(TypedDict):
+        items: Annotated[list[str], operator.add]
+
+    calls = 0
+
+    def flaky(
+        state: State, writer: StreamWriter, cancel_token: CancellationToken
+    ) -> dict:
+        nonlocal calls
+        calls += 1
+        attempt = calls
+        writer(f"attempt {attempt}")
+        if attempt == 1:
+            # the first attempt hangs, until cancelled once the second one wins
+            cancel_token.wait(5)
+        return {"items": [f"attempt {attempt}"]}
+
+    builder = StateGraph(State)
+    builder.add_node("flaky", flaky, retry=RetryPolicy(hedge_after=0.05))
+    builder.add_edge(START, "flaky")
+    graph = builder.compile()
+
+    # the duplicate attempt wins, its writes are committed only once
+    start = time.monotonic()
+    assert graph.invoke({"items": []}) == {"items": ["attempt 2"]}
+    assert time.monotonic() - start < 1
+    assert calls == 2
+
+    # attempts that finish in time aren't duplicated
+    calls = 1
+    assert graph.invoke({"items": []}) == {"items": ["attempt 2"]}
+    assert calls == 2
+
+    # only the stream output of the attempt used is sent
+    calls = 0
+    assert list(graph.stream({"items": []}, stream_mode="custom")) == ["attempt 2"]
+
+    # attempts can't call tasks, which can't be undone
+    @task()
+    def double(x: int) -> int:
+        return x * 2
+
+    builder = StateGraph(State)
+    builder.add_node(
+        "caller",
+        lambda state: {"items": [str(double(1).result())]},
+        retry=RetryPolicy(hedge_after=1.0),
+    )
+    builder.add_edge(START, "caller")
+    with pytest.raises(RuntimeError, match="can't call tasks"):
+        builder.compile().invoke({"items": []})
+
+
+def test_hedged_retry_percentile() -> None:
+    from langgraph.pregel.retry import (
+        LATENCY_MIN_SAMPLES,
+        _hedge_delay,
+        _record_latency,
+    )
+
+    policy = RetryPolicy(hedge_after=1.0, hedge_percentile=90)
+    # until enough latencies are recorded, the fixed delay is used
+    for i in range(LATENCY_MIN_SAMPLES - 1):
+        _record_latency(policy, "node", 0.01 * i)
+    assert _hedge_delay(policy, "node") == 1.0
+    _record_latency(policy, "node", 0.01 * (LATENCY_MIN_SAMPLES - 1))
+    assert _hedge_delay(policy, "node") == pytest.approx(0.18)
+    # latencies are recorded per node
+    assert _hedge_delay(policy, "other") == 1.0
+
+
+def test_node_timeout() -> None:
+    class State(TypedDict):
+        items: Annotated[list[str], operator.add]
+
+    calls = 0
+    tokens: list[CancellationToken] = []
+
+    def stuck(state: State, cancel_token: CancellationToken) -> dict:
+        nonlocal calls
+        calls += 1
+        attempt = calls
+        tokens.append(cancel_token)
+        if attempt == 1:
+            # the first attempt hangs, until cancelled
+            cancel_token.wait(5)
+            return {"items": ["cancelled"]}
+        return {"items": [f"stuck {attempt}"]}
+
+    builder = StateGraph(State)
+    builder.add_node(
+        "stuck",
+        stuck,
+        timeout=0.1,
+        retry=RetryPolicy(initial_interval=0, jitter=False),
+    )
+    builder.add_node("other", lambda state: {"items": ["other"]})
+    builder.add_edge(START, "stuck")
+    builder.add_edge(START, "other")
+    graph = builder.compile()
+
+    # the attempt that timed out is retried, its writes are discarded
+    start = time.monotonic()
+    assert graph.invoke({"items": []}) == {"items": ["other", "stuck 2"]}
+    assert time.monotonic() - start < 1
+    assert calls == 2
+    assert tokens[0].cancelled
+    # each attempt gets a token of its own
+    assert tokens[0] is not tokens[1]
+
+    # nodes without a timeout get no token, as they're never cancelled
+    builder = StateGraph(State)
+    builder.add_node(
+        "node",
+        lambda state, cancel_token: {"items": [repr(cancel_token)]},
+    )
+    builder.add_edge(START, "node")
+    assert builder.compile().invoke({"items": []}) == {"items": ["None"]}
+
+    # without retries, the task fails
+    builder = StateGraph(State)
+    builder.add_node("stuck", lambda state: time.sleep(0.5) or {}, timeout=0.1)
+    builder.add_edge(START, "stuck")
+    with pytest.raises(NodeTimeoutError, match="Node 'stuck' timed out"):
+        builder.compile().invoke({"items": []})
+
+    with pytest.raises(ValueError, match="Timeout must be positive"):
+        StateGraph(State).add_node("stuck", stuck, timeout=0)
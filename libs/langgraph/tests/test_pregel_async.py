@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import operator
+import os
 import random
 import sys
 import uuid
@@ -13,11 +14,13 @@ from typing import (
     Any,
     AsyncGenerator,
     AsyncIterator,
+    Callable,
     Dict,
     Generator,
     List,
     Literal,
     Optional,
+    Sequence,
     Tuple,
     TypedDict,
     Union,
@@ -26,6 +29,7 @@ from uuid import UUID
 
 import httpx
 import pytest
+from langchain_core.messages import AIMessage
 from langchain_core.runnables import (
     RunnableConfig,
     RunnableLambda,
@@ -35,6 +39,7 @@ from langchain_core.utils.aiter import aclosing
 from pytest_mock import MockerFixture
 from syrupy import SnapshotAssertion
 
+from langgraph.cache.memory import InMemoryCache
 from langgraph.channels.base import BaseChannel
 from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.channels.context import Context
@@ -54,7 +59,12 @@ from langgraph.constants import (
     PULL,
     START,
 )
-from langgraph.errors import InvalidUpdateError, MultipleSubgraphsError, NodeInterrupt
+from langgraph.errors import (
+    InvalidUpdateError,
+    MultipleSubgraphsError,
+    NodeInterrupt,
+    NodeTimeoutError,
+)
 from langgraph.func import entrypoint, task
 from langgraph.graph import END, Graph, StateGraph
 from langgraph.graph.message import MessagesState, add_messages
@@ -63,13 +73,18 @@ from langgraph.pregel import Channel, GraphRecursionError, Pregel, StateSnapshot
 from langgraph.pregel.retry import RetryPolicy
 from langgraph.store.base import BaseStore
 from langgraph.types import (
+    BatchPolicy,
+    CachePolicy,
     Command,
     Interrupt,
     PregelTask,
     Send,
+    StreamBufferPolicy,
+    StreamCoalescePolicy,
     StreamWriter,
     interrupt,
 )
+from tests.any_int import AnyInt
 from tests.any_str import AnyStr, AnyVersion, FloatBetween, UnsortedSequence
 from tests.conftest import (
     ALL_CHECKPOINTERS_ASYNC,
@@ -80,6 +95,7 @@ from tests.conftest import (
     awith_checkpointer,
     awith_store,
 )
+from tests.fake_chat import FakeChatModel
 from tests.fake_tracer import FakeTracer
 from tests.memory_assert import (
     MemorySaverAssertCheckpointMetadata,
@@ -6669,3 +6685,801 @@ async def test_multiple_updates() -> None:
         {"node_a": [{"foo": "a1"}, {"foo": "a2"}]},
         {"node_b": {"foo": "b"}},
     ]
+
+
+class ProcessState(TypedDict):
+    n: int
+    pid: int
+    total: Annotated[int, operator.add]
+
+
+def _process_node(state: ProcessState, config: RunnableConfig) -> dict:
+    if state["n"] < 0:
+        raise ValueError("n must be positive")
+    factor = config["configurable"].get("factor", 1)
+    return {
+        "pid": os.getpid(),
+        "total": factor * sum(i * i for i in range(state["n"])),
+    }
+
+
+async def test_process_executor() -> None:
+    builder = StateGraph(ProcessState)
+    builder.add_node("square", _process_node, executor="process")
+    builder.add_node("add_one", lambda s: {"total": 1})
+    builder.add_edge(START, "square")
+    builder.add_edge("square", "add_one")
+    graph = builder.compile(checkpointer=MemorySaver(), interrupt_before=["square"])
+
+    thread = {"configurable": {"thread_id": "1", "factor": 2}}
+    assert await graph.ainvoke({"n": 4, "pid": 0, "total": 0}, thread) == {
+        "n": 4,
+        "pid": 0,
+        "total": 0,
+    }
+    # resume after interrupt, node runs in a different process
+    assert [c async for c in graph.astream(None, thread, stream_mode="updates")] == [
+        {"square": {"pid": AnyInt(), "total": 28}},
+        {"add_one": {"total": 1}},
+    ]
+    state = await graph.aget_state(thread)
+    assert state.values["total"] == 29
+    assert state.values["pid"] != os.getpid()
+
+    # errors raised in the worker are re-raised and recorded
+    graph = builder.compile(checkpointer=MemorySaver())
+    thread = {"configurable": {"thread_id": "2"}}
+    with pytest.raises(ValueError, match="n must be positive"):
+        await graph.ainvoke({"n": -1, "pid": 0, "total": 0}, thread)
+    assert "n must be positive" in (await graph.aget_state(thread)).tasks[0].error
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_ASYNC)
+async def test_node_cache(checkpointer_name: str) -> None:
+    class State(TypedDict):
+        x: int
+        items: Annotated[list, operator.add]
+
+    calls: list[str] = []
+
+    async def fanout(state: State) -> Command:
+        calls.append("fanout")
+        return Command(goto=[Send("expensive", {"x": i % 2}) for i in range(4)])
+
+    async def expensive(state: dict) -> dict:
+        calls.append("expensive")
+        return {"items": [state["x"] * 10]}
+
+    builder = StateGraph(State)
+    builder.add_node("fanout", fanout, cache_policy=CachePolicy(ttl=60))
+    builder.add_node(
+        "expensive", expensive, cache_policy=CachePolicy(key_func=lambda s: str(s))
+    )
+    builder.add_edge(START, "fanout")
+
+    async with awith_checkpointer(checkpointer_name) as checkpointer:
+        graph = builder.compile(checkpointer=checkpointer, cache=InMemoryCache())
+
+        # first run populates the cache
+        config = {"configurable": {"thread_id": "1"}}
+        assert await graph.ainvoke({"x": 1, "items": []}, config) == {
+            "x": 1,
+            "items": [0, 10, 0, 10],
+        }
+        assert calls == ["fanout", *["expensive"] * 4]
+
+        # same input in another thread is served from the cache
+        calls.clear()
+        config = {"configurable": {"thread_id": "2"}}
+        assert [
+            c
+            async for c in graph.astream(
+                {"x": 1, "items": []}, config, stream_mode="updates"
+            )
+        ] == [
+            {"fanout": None, "__metadata__": {"cached": True}},
+            *[{"expensive": {"items": [0]}, "__metadata__": {"cached": True}}] * 2,
+            *[{"expensive": {"items": [10]}, "__metadata__": {"cached": True}}] * 2,
+        ]
+        assert calls == []
+        assert (await graph.aget_state(config)).values == {
+            "x": 1,
+            "items": [0, 10, 0, 10],
+        }
+
+        # a graph compiled without a cache runs all nodes
+        await builder.compile(checkpointer=checkpointer).ainvoke(
+            {"x": 1, "items": []}, config
+        )
+        assert calls == ["fanout", *["expensive"] * 4]
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_ASYNC)
+async def test_stream_mode_metrics(checkpointer_name: str) -> None:
+    class State(TypedDict):
+        items: Annotated[list, operator.add]
+
+    attempts = 0
+
+    async def flaky(state: State) -> dict:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise ConnectionError("try again")
+        return {"items": ["flaky"]}
+
+    async def other(state: State) -> dict:
+        return {"items": ["other"]}
+
+    builder = StateGraph(State)
+    builder.add_node(
+        "flaky", flaky, retry=RetryPolicy(initial_interval=0, jitter=False)
+    )
+    builder.add_node("other", other)
+    builder.add_edge(START, "flaky")
+    builder.add_edge(START, "other")
+
+    async with awith_checkpointer(checkpointer_name) as checkpointer:
+        graph = builder.compile(checkpointer=checkpointer)
+
+        config = {"configurable": {"thread_id": "1"}}
+        events = [
+            e async for e in graph.astream({"items": []}, config, stream_mode="metrics")
+        ]
+
+        assert [e for e in events if e["type"] == "step"] == [
+            {
+                "type": "step",
+                "step": step,
+                "payload": {
+                    "prepare_tasks": FloatBetween(0, 1),
+                    "apply_writes": FloatBetween(0, 1),
+                    "create_checkpoint": FloatBetween(0, 1),
+                    "tasks": tasks,
+                    "stream_depth": AnyInt(),
+                },
+            }
+            for step, tasks in ((0, 1), (1, 2))
+        ]
+        # hidden tasks, ie. __start__, are not reported
+        assert sorted(
+            (e for e in events if e["type"] == "task"),
+            key=lambda e: e["payload"]["name"],
+        ) == [
+            {
+                "type": "task",
+                "step": 1,
+                "payload": {
+                    "id": AnyStr(),
+                    "name": name,
+                    "queue_wait": FloatBetween(0, 1),
+                    "run_time": FloatBetween(0, 1),
+                    "retries": retries,
+                    "writes": 2,
+                },
+            }
+            for name, retries in (("flaky", 1), ("other", 0))
+        ]
+        checkpointer_events = [e for e in events if e["type"] == "checkpointer"]
+        assert all(
+            e["payload"]["duration"] == FloatBetween(0, 1) for e in checkpointer_events
+        )
+        assert sorted(
+            {(e["step"], e["payload"]["method"]) for e in checkpointer_events}
+        ) == [
+            (-1, "put"),
+            (0, "put"),
+            (0, "put_writes"),
+            (1, "put"),
+            (1, "put_writes"),
+        ]
+
+
+async def test_put_writes_batched() -> None:
+    class SlowPutWritesCheckpointer(MemorySaver):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batches: list[list[str]] = []
+
+        async def aput_writes_many(
+            self,
+            config: RunnableConfig,
+            task_writes: Sequence[tuple[str, Sequence[tuple[str, Any]]]],
+        ) -> None:
+            self.batches.append([task_id for task_id, _ in task_writes])
+            await asyncio.sleep(0.05)
+            await super().aput_writes_many(config, task_writes)
+
+    class State(TypedDict):
+        items: Annotated[list, operator.add]
+
+    calls = Counter()
+    should_fail = True
+
+    def make_node(name: str):
+        async def node(state: State) -> dict:
+            calls[name] += 1
+            return {"items": [name]}
+
+        return node
+
+    async def failing(state: State) -> dict:
+        calls["failing"] += 1
+        await asyncio.sleep(0.2)
+        if should_fail:
+            raise ConnectionError("oops")
+        return {"items": ["failing"]}
+
+    builder = StateGraph(State)
+    names = [f"node_{i}" for i in range(10)]
+    for name in names:
+        builder.add_node(name, make_node(name))
+        builder.add_edge(START, name)
+    builder.add_node("failing", failing)
+    builder.add_edge(START, "failing")
+
+    checkpointer = SlowPutWritesCheckpointer()
+    graph = builder.compile(checkpointer=checkpointer)
+    config = {"configurable": {"thread_id": "1"}}
+
+    with pytest.raises(ConnectionError):
+        await graph.ainvoke({"items": []}, config)
+
+    # writes of tasks finishing while a batch is being saved are saved together
+    saved = [task_id for batch in checkpointer.batches for task_id in batch]
+    assert len(saved) == len(set(saved)) == 12  # input, 10 nodes, error
+    assert len(checkpointer.batches) < len(saved)
+
+    # on resume, only the failed task runs again
+    should_fail = False
+    assert sorted((await graph.ainvoke(None, config))["items"]) == sorted(
+        [*names, "failing"]
+    )
+    assert calls == {**{name: 1 for name in names}, "failing": 2}
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_ASYNC)
+async def test_durability(checkpointer_name: str) -> None:
+    class State(TypedDict):
+        items: Annotated[list, operator.add]
+
+    calls = Counter()
+    should_fail = True
+    seen_steps: list[int] = []
+
+    async def one(state: State) -> dict:
+        calls["one"] += 1
+        return {"items": ["one"]}
+
+    async def two(state: State) -> dict:
+        calls["two"] += 1
+        if should_fail:
+            raise ConnectionError("oops")
+        return {"items": ["two"]}
+
+    async with awith_checkpointer(checkpointer_name) as checkpointer:
+
+        async def three(state: State, config: RunnableConfig) -> dict:
+            # the checkpoint of the previous step was saved before this step started
+            saved = await checkpointer.aget_tuple(
+                {"configurable": {"thread_id": config["configurable"]["thread_id"]}}
+            )
+            seen_steps.append(saved.metadata["step"])
+            return {"items": ["three"]}
+
+        builder = StateGraph(State)
+        builder.add_node("one", one)
+        builder.add_node("two", two)
+        builder.add_edge(START, "one")
+        builder.add_edge("one", "two")
+
+        # only the last checkpoint is saved
+        graph = builder.compile(checkpointer=checkpointer, durability="exit")
+        config = {"configurable": {"thread_id": "1"}}
+        with pytest.raises(ConnectionError):
+            await graph.ainvoke({"items": []}, config)
+        history = [c async for c in graph.aget_state_history(config)]
+        assert len(history) == 1
+        assert history[0].values == {"items": ["one"]}
+        assert history[0].next == ("two",)
+        assert history[0].metadata["step"] == 1
+        assert history[0].parent_config is None
+
+        # on resume, the successful steps don't run again
+        should_fail = False
+        assert await graph.ainvoke(None, config) == {"items": ["one", "two"]}
+        assert calls == {"one": 1, "two": 2}
+        history = [c async for c in graph.aget_state_history(config)]
+        assert len(history) == 2
+        assert history[0].values == {"items": ["one", "two"]}
+        assert history[0].next == ()
+        assert history[0].parent_config == history[1].config
+
+        # interrupted runs save the checkpoint before the interrupt
+        graph = builder.compile(checkpointer=checkpointer, interrupt_before=["two"])
+        config = {"configurable": {"thread_id": "2"}}
+        assert await graph.ainvoke({"items": []}, config, durability="exit") == {
+            "items": ["one"]
+        }
+        assert [c.next async for c in graph.aget_state_history(config)] == [("two",)]
+        assert await graph.ainvoke(None, config, durability="exit") == {
+            "items": ["one", "two"]
+        }
+        assert [c.next async for c in graph.aget_state_history(config)] == [
+            (),
+            ("two",),
+        ]
+
+        # all checkpoints are saved otherwise
+        builder.add_node("three", three)
+        builder.add_edge("two", "three")
+        graph = builder.compile(checkpointer=checkpointer)
+        config = {"configurable": {"thread_id": "3"}}
+        assert await graph.ainvoke({"items": []}, config, durability="sync") == {
+            "items": ["one", "two", "three"]
+        }
+        assert seen_steps == [2]
+        assert len([c async for c in graph.aget_state_history(config)]) == 5
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_ASYNC)
+async def test_durability_exit_nested_subgraphs(checkpointer_name: str) -> None:
+    class State(TypedDict):
+        items: Annotated[list, operator.add]
+
+    should_ask = True
+
+    async def ask(state: State) -> dict:
+        return {"items": [interrupt("question") if should_ask else "no answer"]}
+
+    grandchild = StateGraph(State)
+    grandchild.add_node("ask", ask)
+    grandchild.add_edge(START, "ask")
+
+    child = StateGraph(State)
+    child.add_node("c1", lambda s: {"items": ["c1"]})
+    child.add_node("grandchild", grandchild.compile())
+    child.add_edge(START, "c1")
+    child.add_edge("c1", "grandchild")
+
+    builder = StateGraph(State)
+    builder.add_node("p1", lambda s: {"items": ["p1"]})
+    builder.add_node("child", child.compile())
+    builder.add_node("p2", lambda s: {"items": ["p2"]})
+    builder.add_edge(START, "p1")
+    builder.add_edge("p1", "child")
+    builder.add_edge("child", "p2")
+
+    async with awith_checkpointer(checkpointer_name) as checkpointer:
+        graph = builder.compile(checkpointer=checkpointer, durability="exit")
+        config = {"configurable": {"thread_id": "1"}}
+
+        async def assert_parents_saved(config: RunnableConfig) -> None:
+            saved = [c async for c in checkpointer.alist(config)]
+            ids = {
+                (
+                    c.config["configurable"]["checkpoint_ns"],
+                    c.config["configurable"]["checkpoint_id"],
+                )
+                for c in saved
+            }
+            for c in saved:
+                for ns, id in c.metadata["parents"].items():
+                    assert (ns, id) in ids
+
+        assert await graph.ainvoke({"items": []}, config) == {"items": ["p1"]}
+        await assert_parents_saved(config)
+        state = await graph.aget_state(config, subgraphs=True)
+        assert state.next == ("child",)
+        assert state.tasks[0].state.next == ("grandchild",)
+        assert state.tasks[0].state.tasks[0].state.next == ("ask",)
+
+        # the subgraphs resume where they were interrupted
+        assert await graph.ainvoke(Command(resume="answer"), config) == {
+            "items": ["p1", "p1", "c1", "p1", "c1", "answer", "p2"]
+        }
+        await assert_parents_saved(config)
+        assert (await graph.aget_state(config, subgraphs=True)).next == ()
+        assert [c.metadata["step"] async for c in graph.aget_state_history(config)] == [
+            3,
+            1,
+        ]
+
+        # the parent checkpoints subgraphs refer to are saved, although the
+        # parent moved past them
+        should_ask = False
+        config = {"configurable": {"thread_id": "2"}}
+        assert await graph.ainvoke({"items": []}, config) == {
+            "items": ["p1", "p1", "c1", "p1", "c1", "no answer", "p2"]
+        }
+        await assert_parents_saved(config)
+        assert [c.metadata["step"] async for c in graph.aget_state_history(config)] == [
+            3,
+            1,
+        ]
+
+
+async def test_stream_buffer() -> None:
+    class State(TypedDict):
+        answer: str
+
+    produced: list[int] = []
+    model = FakeChatModel(
+        messages=[AIMessage(content="one two three four five six", id="ai1")]
+    )
+
+    def write(state: State, writer: StreamWriter) -> dict:
+        for i in range(20):
+            writer(i)
+            produced.append(i)
+        return {}
+
+    async def awrite(state: State, writer: StreamWriter) -> dict:
+        for i in range(20):
+            writer(i)
+        return {}
+
+    async def answer(state: State) -> dict:
+        return {"answer": (await model.ainvoke("hi")).content}
+
+    def compile(node: Callable, policy: StreamBufferPolicy) -> Pregel:
+        builder = StateGraph(State)
+        builder.add_node("node", node)
+        builder.add_edge(START, "node")
+        return builder.compile(stream_buffer=policy)
+
+    # producers running in other threads are blocked until the consumer catches up
+    graph = compile(write, StreamBufferPolicy(maxsize=2))
+    received: list[int] = []
+    async for c in graph.astream({"answer": ""}, stream_mode="custom"):
+        assert len(produced) - c <= 4
+        received.append(c)
+        await asyncio.sleep(0.01)
+    assert received == [*range(20)]
+
+    # the oldest chunks are dropped
+    graph = compile(awrite, StreamBufferPolicy(maxsize=2, on_full="drop_oldest"))
+    received = []
+    async for c in graph.astream({"answer": ""}, stream_mode="custom"):
+        received.append(c)
+        await asyncio.sleep(0.01)
+    assert received == sorted(received)
+    assert received[-1] == 19
+    assert len(received) < 20
+
+    # chunks of the same message are merged
+    graph = compile(answer, StreamBufferPolicy(maxsize=1, on_full="coalesce"))
+    chunks = []
+    async for msg, meta in graph.astream({"answer": ""}, stream_mode="messages"):
+        chunks.append(msg)
+        await asyncio.sleep(0.01)
+    assert "".join(c.content for c in chunks) == "one two three four five six"
+    assert {c.id for c in chunks} == {"ai1"}
+    assert len(chunks) < 11
+
+
+async def test_stream_coalesce() -> None:
+    model = FakeChatModel(
+        messages=[AIMessage(content="one two three four five six", id="ai1")]
+    )
+
+    async def call_model(state: MessagesState) -> dict:
+        return {"messages": [await model.ainvoke(state["messages"])]}
+
+    builder = StateGraph(MessagesState)
+    builder.add_node("call_model", call_model)
+    builder.add_edge(START, "call_model")
+
+    # by count, the last chunks are emitted when the model run ends
+    graph = builder.compile(
+        stream_coalesce=StreamCoalescePolicy(max_wait=None, max_chunks=4)
+    )
+    chunks = [
+        msg
+        async for msg, meta in graph.astream({"messages": "hi"}, stream_mode="messages")
+    ]
+    assert [c.content for c in chunks] == ["one two ", "three four ", "five six"]
+    assert {c.id for c in chunks} == {"ai1"}
+
+    # by time, the first chunk is emitted right away
+    graph = builder.compile(stream_coalesce=StreamCoalescePolicy(max_wait=10))
+    chunks = [
+        msg
+        async for msg, meta in graph.astream({"messages": "hi"}, stream_mode="messages")
+    ]
+    assert [c.content for c in chunks] == ["one", " two three four five six"]
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_ASYNC)
+async def test_eager(checkpointer_name: str) -> None:
+    class State(TypedDict, total=False):
+        a: str
+        b: str
+        c: str
+        d: str
+
+    class FastState(TypedDict):
+        b: str
+
+    calls = Counter()
+
+    async def slow(state: State) -> dict:
+        await asyncio.sleep(0.6)
+        return {"a": "slow"}
+
+    async def fast(state: State) -> dict:
+        return {"b": "fast"}
+
+    async def after_fast(state: FastState) -> dict:
+        calls["after_fast"] += 1
+        await asyncio.sleep(0.4)
+        return {"c": state["b"] + "!"}
+
+    async def reader(state: State) -> dict:
+        # reads the key written by "slow", so its early start is discarded
+        calls["reader"] += 1
+        return {"d": state["a"] + state["b"]}
+
+    builder = StateGraph(State)
+    builder.add_node("slow", slow)
+    builder.add_node("fast", fast)
+    builder.add_node("after_fast", after_fast, input=FastState)
+    builder.add_node("reader", reader)
+    builder.add_edge(START, "slow")
+    builder.add_edge(START, "fast")
+    builder.add_edge("fast", "after_fast")
+    builder.add_edge("fast", "reader")
+
+    async with awith_checkpointer(checkpointer_name) as checkpointer:
+        results = {}
+        for eager in (False, True):
+            calls.clear()
+            graph = builder.compile(checkpointer=checkpointer, eager=eager)
+            config = {"configurable": {"thread_id": str(eager)}}
+            start = perf_counter()
+            result = await graph.ainvoke({"a": ""}, config)
+            duration = perf_counter() - start
+            history = [
+                (s.values, s.next, s.metadata["step"], s.metadata["writes"])
+                async for s in graph.aget_state_history(config)
+            ]
+            results[eager] = (result, history, dict(calls), duration)
+
+    # same results and checkpoints, with or without eager scheduling
+    assert results[True][0] == results[False][0]
+    assert results[True][0] == {"a": "slow", "b": "fast", "c": "fast!", "d": "slowfast"}
+    assert results[True][1] == results[False][1]
+    # "after_fast" ran while "slow" was still running, "reader" ran again
+    assert results[False][2] == {"after_fast": 1, "reader": 1}
+    assert results[True][2] == {"after_fast": 1, "reader": 2}
+    assert results[False][3] >= 1.0
+    assert results[True][3] < 0.95
+
+
+async def test_eager_does_not_delay_step() -> None:
+    class State(TypedDict, total=False):
+        a: str
+        b: str
+        c: str
+
+    class FastState(TypedDict):
+        b: str
+
+    async def slow(state: State) -> dict:
+        await asyncio.sleep(0.3)
+        return {"a": "slow"}
+
+    async def fast(state: State) -> dict:
+        return {"b": "fast"}
+
+    async def after_fast(state: FastState) -> dict:
+        await asyncio.sleep(1.2)
+        return {"c": state["b"] + "!"}
+
+    builder = StateGraph(State)
+    builder.add_node("slow", slow)
+    builder.add_node("fast", fast)
+    builder.add_node("after_fast", after_fast, input=FastState)
+    builder.add_edge(START, "slow")
+    builder.add_edge(START, "fast")
+    builder.add_edge("fast", "after_fast")
+    graph = builder.compile(eager=True)
+
+    start = perf_counter()
+    chunks = [
+        (c, perf_counter() - start)
+        async for c in graph.astream({"a": ""}, stream_mode="values")
+    ]
+    duration = perf_counter() - start
+
+    assert [c for c, _ in chunks] == [
+        {"a": ""},
+        {"a": "slow", "b": "fast"},
+        {"a": "slow", "b": "fast", "c": "fast!"},
+    ]
+    # the first step ends when "slow" does, not when "after_fast" does
+    assert chunks[1][1] < 0.9
+    assert duration < 1.6
+
+
+@pytest.mark.parametrize("checkpointer_name", ALL_CHECKPOINTERS_ASYNC)
+async def test_batch_policy(checkpointer_name: str) -> None:
+    class State(TypedDict):
+        items: list[int]
+        embeddings: Annotated[list, operator.add]
+
+    batches: list[list[int]] = []
+    should_fail = False
+
+    async def embed(inputs: list[dict]) -> list[dict]:
+        batches.append([i["item"] for i in inputs])
+        if should_fail:
+            raise ConnectionError("oops")
+        return [{"embeddings": [i["item"] * 10]} for i in inputs]
+
+    def fan_out(state: State) -> list[Send]:
+        return [Send("embed", {"item": i}) for i in state["items"]]
+
+    builder = StateGraph(State)
+    builder.add_node("embed", embed, batch=BatchPolicy(max_size=3))
+    builder.add_conditional_edges(START, fan_out)
+
+    async with awith_checkpointer(checkpointer_name) as checkpointer:
+        graph = builder.compile(checkpointer=checkpointer)
+        config = {"configurable": {"thread_id": "1"}}
+
+        assert await graph.ainvoke({"items": [1, 2, 3, 4, 5, 6, 7]}, config) == {
+            "items": [1, 2, 3, 4, 5, 6, 7],
+            "embeddings": [10, 20, 30, 40, 50, 60, 70],
+        }
+        assert batches == [[1, 2, 3], [4, 5, 6], [7]]
+        # outputs are written per task
+        assert (await graph.aget_state(config)).metadata["writes"] == {
+            "embed": [{"embeddings": [i * 10]} for i in range(1, 8)]
+        }
+
+        # tasks with their own pending writes, eg. errors, are still batched
+        # together
+        should_fail = True
+        batches.clear()
+        config = {"configurable": {"thread_id": "2"}}
+        with pytest.raises(ConnectionError):
+            await graph.ainvoke({"items": [1, 2, 3]}, config)
+        should_fail = False
+        assert (await graph.ainvoke(None, config))["embeddings"] == [10, 20, 30]
+        assert batches == [[1, 2, 3], [1, 2, 3]]
+
+    # the node is run once for all tasks, so it can't call tasks
+    @task()
+    async def double(x: int) -> int:
+        return x * 2
+
+    async def embed_calling(inputs: list[dict]) -> list[dict]:
+        return [{"embeddings": [await double(i["item"])]} for i in inputs]
+
+    builder = StateGraph(State)
+    builder.add_node("embed", embed_calling, batch=BatchPolicy())
+    builder.add_conditional_edges(START, fan_out)
+    graph = builder.compile()
+    with pytest.raises(RuntimeError, match="can't call tasks"):
+        await graph.ainvoke({"items": [1, 2]})
+
+    # the node must return one output per input
+    async def embed_one(inputs: list[dict]) -> list[dict]:
+        return inputs[:1]
+
+    builder = StateGraph(State)
+    builder.add_node("embed", embed_one, batch=BatchPolicy())
+    builder.add_conditional_edges(START, fan_out)
+    graph = builder.compile()
+    with pytest.raises(InvalidUpdateError, match="expected 2 outputs, got 1"):
+        await graph.ainvoke({"items": [1, 2]})
+
+
+async def test_hedged_retry() -> None:
+    class State(TypedDict):
+        items: Annotated[list[str], operator.add]
+
+    calls = 0
+    cancelled = False
+
+    async def flaky(state: State, writer: StreamWriter) -> dict:
+        nonlocal calls, cancelled
+        calls += 1
+        attempt = calls
+        writer(f"attempt {attempt}")
+        if attempt == 1:
+            # the first attempt hangs, until cancelled
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+        return {"items": [f"attempt {attempt}"]}
+
+    builder = StateGraph(State)
+    builder.add_node("flaky", flaky, retry=RetryPolicy(hedge_after=0.05))
+    builder.add_edge(START, "flaky")
+    graph = builder.compile()
+
+    # the duplicate attempt wins, its writes are committed only once
+    assert await asyncio.wait_for(graph.ainvoke({"items": []}), 1) == {
+        "items": ["attempt 2"]
+    }
+    assert calls == 2
+    # the other attempt is cancelled
+    assert cancelled
+
+    # only the stream output of the attempt used is sent
+    calls = 0
+    assert [c async for c in graph.astream({"items": []}, stream_mode="custom")] == [
+        "attempt 2"
+    ]
+
+    # attempts can't call tasks, which can't be undone
+    @task()
+    async def double(x: int) -> int:
+        return x * 2
+
+    async def caller(state: State) -> dict:
+        return {"items": [str(await double(1))]}
+
+    builder = StateGraph(State)
+    builder.add_node("caller", caller, retry=RetryPolicy(hedge_after=1.0))
+    builder.add_edge(START, "caller")
+    with pytest.raises(RuntimeError, match="can't call tasks"):
+        await builder.compile().ainvoke({"items": []})
+
+
+async def test_node_timeout() -> None:
+    class State(TypedDict):
+        items: Annotated[list[str], operator.add]
+
+    calls = 0
+    cancelled = False
+
+    async def stuck(state: State) -> dict:
+        nonlocal calls, cancelled
+        calls += 1
+        attempt = calls
+        if attempt == 1:
+            # the first attempt hangs, until cancelled
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+        return {"items": [f"stuck {attempt}"]}
+
+    async def other(state: State) -> dict:
+        return {"items": ["other"]}
+
+    builder = StateGraph(State)
+    builder.add_node(
+        "stuck",
+        stuck,
+        timeout=0.1,
+        retry=RetryPolicy(initial_interval=0, jitter=False),
+    )
+    builder.add_node("other", other)
+    builder.add_edge(START, "stuck")
+    builder.add_edge(START, "other")
+    graph = builder.compile()
+
+    # the attempt that timed out is cancelled and retried
+    assert await asyncio.wait_for(graph.ainvoke({"items": []}), 1) == {
+        "items": ["other", "stuck 2"]
+    }
+    assert calls == 2
+    assert cancelled
+
+    # without retries, the task fails
+    async def sleepy(state: State) -> dict:
+        await asyncio.sleep(0.5)
+        return {}
+
+    builder = StateGraph(State)
+    builder.add_node("stuck", sleepy, timeout=0.1)
+    builder.add_edge(START, "stuck")
+    with pytest.raises(NodeTimeoutError, match="Node 'stuck' timed out"):
+        await builder.compile().ainvoke({"items": []})
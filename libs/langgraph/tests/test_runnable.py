@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from typing import Any
+from unittest.mock import patch
 
 import pytest
+from langchain_core.callbacks import BaseCallbackHandler, CallbackManager
 
 from langgraph.store.base import BaseStore
 from langgraph.types import StreamWriter
-from langgraph.utils.runnable import RunnableCallable
+from langgraph.utils.runnable import RunnableCallable, RunnableSeq
 
 pytestmark = pytest.mark.anyio
 
@@ -63,3 +65,35 @@ async def test_runnable_callable_basic():
     # Test asynchronous ainvoke
     result_async = await runnable_async.ainvoke("test")
     assert result_async == "test"
+
+
+async def test_runnable_seq_skips_callbacks_without_handlers():
+    class RecordRuns(BaseCallbackHandler):
+        def __init__(self) -> None:
+            self.runs: list[str] = []
+
+        def on_chain_start(self, serialized: Any, inputs: Any, **kwargs: Any) -> None:
+            self.runs.append(kwargs["name"])
+
+    seq = RunnableSeq(
+        RunnableCallable(lambda x: x + 1, name="one"),
+        RunnableCallable(lambda x: x * 2, name="two"),
+        name="seq",
+    )
+
+    # without handlers, no callback manager is involved
+    config = {"callbacks": CallbackManager([]), "configurable": {}}
+    with patch(
+        "langgraph.utils.runnable.get_callback_manager_for_config",
+        side_effect=AssertionError("callbacks should be skipped"),
+    ), patch(
+        "langgraph.utils.runnable.get_async_callback_manager_for_config",
+        side_effect=AssertionError("callbacks should be skipped"),
+    ):
+        assert seq.invoke(1, config.copy()) == 4
+        assert await seq.ainvoke(1, config.copy()) == 4
+
+    # with handlers, each step is a child run
+    handler = RecordRuns()
+    assert seq.invoke(1, {"callbacks": [handler], "configurable": {}}) == 4
+    assert handler.runs == ["seq", "one", "two"]
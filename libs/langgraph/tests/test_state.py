@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from typing import Annotated as Annotated2
 from typing import Any, Optional
 
+import pydantic
 import pytest
 from langchain_core.runnables import RunnableConfig, RunnableLambda
 from pydantic.v1 import BaseModel
@@ -236,6 +237,32 @@ def test_state_schema_default_values(kw_only_: bool):
     )
 
 
+def test_pydantic_state_not_shared_between_reads():
+    class State(pydantic.BaseModel):
+        items: list[int] = []
+        seen: list[list[int]] = []
+
+    def a(state: State) -> dict:
+        # modified in place, not written to the channel
+        state.items.append(99)
+        return {"seen": [list(state.items)]}
+
+    def b(state: State) -> dict:
+        return {"seen": [*state.seen, list(state.items)]}
+
+    builder = StateGraph(State)
+    builder.add_node(a)
+    builder.add_node(b)
+    builder.add_edge("__start__", "a")
+    builder.add_conditional_edges("a", lambda s: "b")
+    graph = builder.compile()
+    for _ in range(2):
+        assert graph.invoke({"items": [1]}) == {
+            "items": [1],
+            "seen": [[1, 99], [1]],
+        }
+
+
 def test_raises_invalid_managed():
     class BadInputState(TypedDict):
         some_thing: str
@@ -17,10 +17,12 @@ from unittest.mock import patch
 
 import langsmith
 import pytest
+from langchain_core.callbacks import CallbackManager
 from typing_extensions import Annotated, NotRequired, Required
 
 from langgraph.graph import END, StateGraph
 from langgraph.graph.graph import CompiledGraph
+from langgraph.utils.config import merge_configs, patch_config, patch_task_config
 from langgraph.utils.fields import (
     _is_optional_type,
     get_enhanced_type_hints,
@@ -285,3 +287,47 @@ def test_enhanced_type_hints() -> None:
     assert hints[0] == ("val_1", str, None, "A description")
     assert hints[1] == ("val_2", int, 42, None)
     assert hints[2] == ("val_3", str, "default", "Another description")
+
+
+def test_patch_task_config() -> None:
+    parent = {
+        "tags": ["a"],
+        "metadata": {"x": 1, "y": 2},
+        "run_name": "parent",
+        "run_id": uuid.uuid4(),
+        "recursion_limit": 10,
+        "configurable": {"thread_id": "1", "k": "v"},
+    }
+    manager = CallbackManager([])
+    task_config = patch_task_config(
+        parent,
+        metadata={"y": 3},
+        tags=["b"],
+        run_name="task",
+        callbacks=manager,
+        configurable={"k": "w", "task_id": "t"},
+    )
+    expected = patch_config(
+        merge_configs(parent, {"metadata": {"y": 3}, "tags": ["b"]}),
+        run_name="task",
+        callbacks=manager,
+        configurable={"k": "w", "task_id": "t"},
+    )
+    assert task_config == expected
+    # the parent config is left untouched
+    assert parent["metadata"] == {"x": 1, "y": 2}
+    assert parent["configurable"] == {"thread_id": "1", "k": "v"}
+
+    # tasks of a parent without metadata or configurable, nor callbacks
+    assert patch_task_config(
+        {},
+        metadata={"y": 3},
+        tags=None,
+        run_name="task",
+        callbacks=None,
+        configurable={"task_id": "t"},
+    ) == patch_config(
+        merge_configs({}, {"metadata": {"y": 3}}),
+        run_name="task",
+        configurable={"task_id": "t"},
+    )